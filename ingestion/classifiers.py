@@ -5,6 +5,7 @@ Pure functions. No side effects. No data fetching.
 Take raw market data, return structured classification.
 """
 
+from functools import lru_cache
 from typing import Optional
 
 
@@ -201,6 +202,9 @@ def is_allowed_exchange(exchange: Optional[str]) -> tuple[bool, str]:
 
 
 # ── Symbol Normalisation ───────────────────────────────────────
+# Memoised: dedup and classify_asset both normalise every row, and the same
+# (ticker, exchange) pairs recur across sources and runs.
+@lru_cache(maxsize=65536)
 def normalise_ticker(ticker: str, exchange: Optional[str] = None) -> str:
     """
     Normalise ticker to Yahoo Finance format.
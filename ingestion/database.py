@@ -10,6 +10,7 @@ Run tracking, notifications, and deactivations are lightweight no-ops
 Environment variables:
   MB_API_URL     — https://web-production-db367d.up.railway.app
   INGEST_API_KEY — mb-ingest-secret
+  INGEST_PUSH_CONCURRENCY — /api/ingest batches in flight at once (default 4)
 """
 
 import asyncio
@@ -26,11 +27,12 @@ log = logging.getLogger("mb-ingestion.database")
 MB_API_URL     = os.environ.get("MB_API_URL", "").rstrip("/")
 INGEST_API_KEY = os.environ.get("INGEST_API_KEY", "mb-ingest-secret")
 
-INGEST_ENDPOINT = f"{MB_API_URL}/api/ingest"
-BATCH_SIZE      = 50
-REQUEST_TIMEOUT = 30
-RETRY_ATTEMPTS  = 3
-RETRY_DELAY     = 3.0
+INGEST_ENDPOINT  = f"{MB_API_URL}/api/ingest"
+BATCH_SIZE       = 50
+PUSH_CONCURRENCY = int(os.environ.get("INGEST_PUSH_CONCURRENCY", "4"))
+REQUEST_TIMEOUT  = 30
+RETRY_ATTEMPTS   = 3
+RETRY_DELAY      = 3.0
 
 # In-memory state (per-run only — resets on restart)
 _active_tickers: Dict[str, dict] = {}
@@ -126,19 +128,23 @@ async def _push_assets_async(assets: List[dict]) -> Dict[str, int]:
 
     log.info(f"Pushing {len(deduped)} assets to main app...")
 
-    ok_count = fail_count = 0
-    async with httpx.AsyncClient() as client:
-        for i in range(0, len(deduped), BATCH_SIZE):
-            batch = deduped[i : i + BATCH_SIZE]
-            ok = await _post_batch(client, batch)
-            if ok:
-                ok_count += 1
-            else:
-                fail_count += 1
-            if i + BATCH_SIZE < len(deduped):
-                await asyncio.sleep(0.4)
+    # Batches go out PUSH_CONCURRENCY at a time over one pooled client,
+    # instead of one after another with a fixed pause between them.
+    batches = [deduped[i : i + BATCH_SIZE] for i in range(0, len(deduped), BATCH_SIZE)]
+    sem = asyncio.Semaphore(PUSH_CONCURRENCY)
 
-    return {"sent": len(deduped), "batches_ok": ok_count, "batches_failed": fail_count}
+    async def push(batch: List[dict]) -> bool:
+        async with sem:
+            return await _post_batch(client, batch)
+
+    limits = httpx.Limits(max_connections=PUSH_CONCURRENCY,
+                          max_keepalive_connections=PUSH_CONCURRENCY)
+    async with httpx.AsyncClient(limits=limits) as client:
+        results = await asyncio.gather(*(push(b) for b in batches))
+
+    ok_count = sum(results)
+    return {"sent": len(deduped), "batches_ok": ok_count,
+            "batches_failed": len(results) - ok_count}
 
 
 # ══════════════════════════════════════════════════════════════
@@ -194,6 +200,15 @@ def deactivate_asset(ticker: str, run_id: str = "", source: str = "", reason: st
         log.info(f"Deactivated {ticker}: {reason}")
 
 
+def bulk_deactivate_assets(tickers: List[str], run_id: str = "", source: str = "",
+                           reason: str = "") -> int:
+    """Deactivate many tickers in one call. Returns how many were active."""
+    removed = [t for t in map(str.upper, tickers) if _active_tickers.pop(t, None) is not None]
+    if removed:
+        log.info(f"Deactivated {len(removed)} assets ({reason}): {', '.join(removed)}")
+    return len(removed)
+
+
 # ── Run tracking ──────────────────────────────────────────────
 def start_run(run_id: str, source: str) -> None:
     _runs.append({
@@ -0,0 +1,88 @@
+"""
+Market Brain — Ingestion Disk Cache
+────────────────────────────────────
+Tiny sqlite-backed key/value store for slow-changing API responses
+(CoinGecko market pages, Yahoo screener results).
+
+Entries survive process restarts, so a cold start inside the TTL is
+served from disk instead of re-hitting the remote APIs. The cache is
+strictly best-effort: any sqlite error is logged and treated as a miss.
+Access goes through aiosqlite, so lookups never block the event loop.
+
+Environment variables:
+  INGEST_CACHE_PATH — sqlite file (default: .ingest_cache.sqlite beside this module)
+"""
+
+import json
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional
+
+import aiosqlite
+
+try:
+    import orjson
+
+    def _dumps(value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    _loads = orjson.loads
+except ImportError:     # stdlib fallback
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value).encode()
+
+    _loads = json.loads
+
+log = logging.getLogger("mb-ingestion.disk_cache")
+
+CACHE_PATH = os.environ.get(
+    "INGEST_CACHE_PATH", str(Path(__file__).with_name(".ingest_cache.sqlite"))
+)
+
+
+class DiskCache:
+
+    def __init__(self, path: str = CACHE_PATH):
+        self.path = path
+
+    @asynccontextmanager
+    async def _db(self) -> AsyncIterator[aiosqlite.Connection]:
+        # A connection per call: a handful of lookups per run, and nothing
+        # is tied to the event loop that happened to open it.
+        async with aiosqlite.connect(self.path) as conn:
+            await conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " key TEXT PRIMARY KEY, ts REAL NOT NULL, payload BLOB NOT NULL)"
+            )
+            yield conn
+
+    async def get(self, key: str, ttl: float) -> Optional[Any]:
+        """Cached value for `key` if written within `ttl` seconds, else None."""
+        try:
+            async with self._db() as conn:
+                async with conn.execute(
+                    "SELECT payload FROM cache WHERE key = ? AND ts >= ?",
+                    (key, time.time() - ttl),
+                ) as cur:
+                    row = await cur.fetchone()
+            return _loads(row[0]) if row else None
+        except Exception as e:
+            log.debug(f"Disk cache read failed for {key}: {e}")
+            return None
+
+    async def set(self, key: str, value: Any) -> None:
+        try:
+            async with self._db() as conn:
+                await conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, ts, payload) VALUES (?, ?, ?)",
+                    (key, time.time(), _dumps(value)),
+                )
+                await conn.commit()
+        except Exception as e:
+            log.debug(f"Disk cache write failed for {key}: {e}")
+
+
+disk_cache = DiskCache()
@@ -5,25 +5,60 @@ Fetchers pull raw asset data from external APIs.
 They return normalised dicts. They do NOT write to the database.
 
 Sources:
-  - Yahoo Finance  (equities, ETFs, indices, forex) — uses v8/chart only
+  - Yahoo Finance  (equities, ETFs, indices, forex) — v7/quote + v8/chart
   - CoinGecko      (crypto — free tier, no key needed)
   - Static seeds   (fallback / manual additions)
 
 NOTE: Yahoo's v10/quoteSummary endpoint now requires auth (401).
-      We use only the v8/chart endpoint which still works freely.
+      Batches try the multi-symbol v7/quote endpoint first (one request
+      per 100 symbols) and fall back to v8/chart per symbol for anything
+      it does not return — v8/chart still works freely.
 """
 
 import asyncio
+import importlib.util
+import json
 import logging
-from typing import List, Optional
+import math
+import os
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+from urllib.parse import quote_plus
 
 import httpx
 
+from disk_cache import disk_cache
+from universe import Stock, Universe, get_universe
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:     # stdlib fallback — same result, just slower
+    _json_loads = json.loads
+
 log = logging.getLogger("mb-ingestion.fetchers")
 
 REQUEST_TIMEOUT = 12
 RETRY_ATTEMPTS  = 3
 RETRY_DELAY     = 2.0
+RETRY_MAX_DELAY = 30.0
+RETRY_STATUSES  = {429, 500, 502, 503, 504}
+QUOTE_TTL       = 60.0      # seconds a fetched quote is reused within a run
+COINGECKO_TTL   = 600.0     # seconds a CoinGecko markets page is served from disk
+SCREENER_TTL    = 3600.0    # seconds a screener result is served from disk
+
+HTTP2_ENABLED   = importlib.util.find_spec("h2") is not None
+# Pool sized to the fetch concurrency; every socket may stay warm between batches
+MAX_CONNECTIONS = int(os.environ.get("FETCH_MAX_CONNECTIONS", "10"))
+HTTP_LIMITS     = httpx.Limits(max_connections=MAX_CONNECTIONS,
+                               max_keepalive_connections=MAX_CONNECTIONS,
+                               keepalive_expiry=30.0)
 
 YAHOO_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
@@ -32,121 +67,446 @@ YAHOO_HEADERS = {
 }
 
 
+# ══════════════════════════════════════════════════════════════
+# STATIC TICKER LISTS
+# ══════════════════════════════════════════════════════════════
+# Module-level tuples: built once at import, shared by every fetcher
+# instance and safe from accidental mutation.
+FOREX_TICKERS = (
+    "EURUSD=X","GBPUSD=X","USDJPY=X","USDCHF=X","AUDUSD=X",
+    "USDCAD=X","NZDUSD=X","EURGBP=X","EURJPY=X","GBPJPY=X",
+    "USDCNH=X","USDINR=X","USDMXN=X","USDBRL=X","USDSGD=X",
+    "USDKRW=X","USDHKD=X","USDTRY=X","USDZAR=X","USDNOK=X",
+)
+
+COMMODITY_TICKERS = (
+    "GC=F","SI=F","CL=F","BZ=F","NG=F","HG=F",
+    "ZW=F","ZC=F","ZS=F","GLD","SLV","USO","UNG",
+)
+
+ETF_TICKERS = (
+    "SPY","QQQ","IWM","DIA","VTI","VOO","VEA","VWO","EFA","EEM",
+    "XLK","XLF","XLV","XLE","XLI","XLB","XLY","XLP","XLRE","XLU",
+    "GLD","SLV","TLT","IEF","LQD","HYG","VNQ","ARKK","ARKG","ARKW",
+    "SQQQ","TQQQ","SPXL","SPXS","UVXY","VXX",
+    "SOXX","SMH","IBB","XBI","IHI","IYT","ITB","XHB",
+    "EWJ","EWZ","EWC","EWA","EWG","EWU","FXI","INDA",
+    "BOTZ","ROBO","AIQ","WCLD","BUG","HACK",
+    "ICLN","QCLN","TAN","FAN","ACES","GRID",
+    "CPER","REMX","LIT","PICK","SIL","GDX","GDXJ",
+)
+
+
 # ══════════════════════════════════════════════════════════════
 # HTTP CLIENT
 # ══════════════════════════════════════════════════════════════
+class TokenBucket:
+    """
+    Token bucket: refills at `rate` tokens/second up to `capacity`.
+    Tokens are reserved before sleeping (the balance may go negative), so
+    concurrent callers queue behind one another instead of waking together.
+    """
+
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate     = rate        # tokens per second
+        self._tokens  = capacity
+        self._last    = time.monotonic()
+
+    async def wait(self, tokens: float = 1.0) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last   = now
+        self._tokens -= tokens
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+def _new_client(timeout: float = REQUEST_TIMEOUT) -> httpx.AsyncClient:
+    """
+    AsyncClient for Yahoo/CoinGecko. Speaks HTTP/2 when `h2` is installed,
+    so concurrent requests to one host multiplex over a single connection.
+    """
+    # No pool timeout: callers cap in-flight requests themselves, so waiting
+    # for a free connection is queueing, not a failure (no spurious PoolTimeout).
+    return httpx.AsyncClient(http2=HTTP2_ENABLED, limits=HTTP_LIMITS,
+                             timeout=httpx.Timeout(timeout, pool=None))
+
+
+# ── Shared client ──────────────────────────────────────────────
+# One pool for every fetcher in the process: Yahoo quotes, the screener and
+# CoinGecko pages all reuse the same kept-alive connections.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Process-wide AsyncClient, created on first use (again after aclose_client())."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _new_client()
+    return _client
+
+
+async def aclose_client() -> None:
+    """Shutdown hook for the shared client. Safe to call more than once."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _backoff(attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Jittered exponential backoff: uniform in [RETRY_DELAY, RETRY_DELAY·2^(n+1)],
+    capped at RETRY_MAX_DELAY, so tasks rate-limited together retry spread
+    out rather than in one burst. A server Retry-After is a floor (itself
+    capped at RETRY_MAX_DELAY).
+    """
+    wait = random.uniform(RETRY_DELAY, min(RETRY_DELAY * 2 ** (attempt + 1), RETRY_MAX_DELAY))
+    if retry_after:
+        wait = max(wait, min(retry_after, RETRY_MAX_DELAY))
+    return wait
+
+
+def _retry_after(r: httpx.Response) -> Optional[float]:
+    """Retry-After header in seconds (delta-seconds or HTTP-date), if present."""
+    value = r.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class AuthRefused(Exception):
+    """An endpoint answered 401/403 — it wants auth, so retrying is pointless."""
+
+
+# url -> (etag, last_modified, body) for revalidating endpoints; process-local,
+# the bodies that should outlive a restart are already in the disk cache
+_validators: Dict[str, tuple] = {}
+
+
 async def _get(client: httpx.AsyncClient, url: str, params: dict = None,
-               headers: dict = None) -> Optional[dict]:
+               headers: dict = None, timeout: Optional[float] = None,
+               raise_on_auth: bool = False, revalidate: bool = False) -> Optional[dict]:
+    """
+    GET and decode JSON. Transient failures (429/5xx, timeouts, connection
+    errors) are retried with exponential backoff; anything else is final.
+
+    With `revalidate` (slow endpoints only), ETag / Last-Modified from an
+    earlier 200 go back as If-None-Match / If-Modified-Since and a 304 is
+    answered from the body kept in memory alongside them.
+    `timeout` overrides the client's default for this call only.
+    With `raise_on_auth`, a 401/403 raises AuthRefused instead of returning
+    None, so callers can tell "needs auth" apart from a transient failure.
+    """
+    headers = headers or YAHOO_HEADERS
+    request_timeout = (httpx.Timeout(timeout, pool=None) if timeout
+                       else httpx.USE_CLIENT_DEFAULT)
+    stored = None
+    if revalidate:
+        cache_key = str(httpx.URL(url, params=params))
+        stored = _validators.get(cache_key)
+        if stored:
+            etag, last_modified, _ = stored
+            headers = dict(headers)
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
     for attempt in range(RETRY_ATTEMPTS):
+        retry_after = None
         try:
-            r = await client.get(url, params=params,
-                                 headers=headers or YAHOO_HEADERS,
-                                 timeout=REQUEST_TIMEOUT)
+            r = await client.get(url, params=params, headers=headers,
+                                 timeout=request_timeout)
             if r.status_code == 200:
-                return r.json()
-            if r.status_code == 429:
-                wait = RETRY_DELAY * (attempt + 1) * 2
-                log.warning(f"Rate limited — waiting {wait}s")
-                await asyncio.sleep(wait)
-                continue
-            if r.status_code == 401:
-                log.warning(f"HTTP 401 — skipping {url[:60]}")
+                data = _json_loads(r.content)
+                if revalidate:
+                    etag, last_modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+                    if etag or last_modified:
+                        _validators[cache_key] = (etag, last_modified, data)
+                return data
+            if r.status_code == 304 and stored:
+                return stored[2]
+            if r.status_code in (401, 403):
+                log.warning("HTTP %s — skipping %.60s", r.status_code, url)
+                if raise_on_auth:
+                    raise AuthRefused(r.status_code)
                 return None
-            log.warning(f"HTTP {r.status_code} from {url[:60]}")
+            if r.status_code not in RETRY_STATUSES:
+                log.warning("HTTP %s from %.60s", r.status_code, url)
+                return None
+            log.warning("HTTP %s (attempt %d): %.60s", r.status_code, attempt + 1, url)
+            retry_after = _retry_after(r)
         except httpx.TimeoutException:
-            log.warning(f"Timeout (attempt {attempt+1}): {url[:60]}")
+            log.warning("Timeout (attempt %d): %.60s", attempt + 1, url)
+        except httpx.TransportError as e:
+            log.warning("Error (attempt %d): %s", attempt + 1, e)
+        except AuthRefused:
+            raise
         except Exception as e:
-            log.warning(f"Error (attempt {attempt+1}): {e}")
+            log.warning("Error fetching %.60s: %s", url, e)
+            return None
         if attempt < RETRY_ATTEMPTS - 1:
-            await asyncio.sleep(RETRY_DELAY)
+            await asyncio.sleep(_backoff(attempt, retry_after))
     return None
 
 
 # ══════════════════════════════════════════════════════════════
 # YAHOO FINANCE FETCHER
 # ══════════════════════════════════════════════════════════════
+@dataclass(slots=True)
+class Quote:
+    """One priced instrument. Kept as a slots object internally; callers get as_dict()."""
+    ticker:              str
+    name:                str
+    quote_type:          Optional[str]
+    exchange:            Optional[str]
+    currency:            str
+    price:               float
+    change_pct:          float
+    fifty_two_week_high: Optional[float]
+    fifty_two_week_low:  Optional[float]
+    avg_volume_30d:      Optional[float]
+    market_cap:          Optional[float]
+    source:              str = "yahoo_finance"
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _quote_from_v7(q: dict) -> Optional[Quote]:
+    """v7/quote result row → the same Quote fetch_quote builds from chart meta."""
+    qg = q.get
+    price = qg("regularMarketPrice") or qg("regularMarketPreviousClose")
+    if not price:
+        return None
+    ticker     = qg("symbol")
+    prev_close = qg("regularMarketPreviousClose") or price
+    change_pct = qg("regularMarketChangePercent")
+    if change_pct is None:
+        change_pct = ((price - prev_close) / prev_close * 100) if prev_close else 0
+    return Quote(
+        ticker              = ticker,
+        name                = qg("shortName") or qg("longName") or ticker,
+        quote_type          = qg("quoteType"),
+        exchange            = qg("exchange"),
+        currency            = qg("currency", "USD"),
+        price               = round(float(price), 4),
+        change_pct          = round(float(change_pct), 4),
+        fifty_two_week_high = qg("fiftyTwoWeekHigh"),
+        fifty_two_week_low  = qg("fiftyTwoWeekLow"),
+        avg_volume_30d      = qg("averageDailyVolume3Month") or qg("regularMarketVolume"),
+        market_cap          = qg("marketCap"),
+    )
+
+
 class YahooFetcher:
 
     BASE_QUOTE          = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
     BASE_QUOTE_FALLBACK = "https://query2.finance.yahoo.com/v8/finance/chart/{symbol}"
+    BASE_QUOTE_MULTI    = "https://query1.finance.yahoo.com/v7/finance/quote"
+    # Only chart meta is read — ask for a single daily bar so the
+    # timestamp/indicators arrays that ride along stay a few bytes long.
+    CHART_PARAMS        = {"range": "1d", "interval": "1d", "includePrePost": "false"}
+    MULTI_CHUNK         = 100
+    # (prefix, suffix) around the symbol, split once so the per-ticker URL
+    # is plain concatenation rather than a str.format parse.
+    QUOTE_URL_PARTS     = (tuple(BASE_QUOTE.split("{symbol}")),
+                           tuple(BASE_QUOTE_FALLBACK.split("{symbol}")))
+
+    # Caps the aggregate Yahoo request rate (~5/s, short bursts allowed)
+    # rather than adding a fixed delay to every task. Shared across instances.
+    _bucket = TokenBucket(capacity=5, rate=5.0)
+
+    FOREX_TICKERS     = FOREX_TICKERS
+    COMMODITY_TICKERS = COMMODITY_TICKERS
+    ETF_TICKERS       = ETF_TICKERS
+
+    def __init__(self):
+        # Cleared once v7/quote refuses us (it is auth-gated in some regions),
+        # so later batches go straight to the per-symbol chart endpoint.
+        self._multi_available = True
+        # ticker → (fetched_at monotonic, quote); reused for QUOTE_TTL seconds
+        self._quote_cache: Dict[str, Tuple[float, Quote]] = {}
+        # ticker → future settled by the call currently fetching it
+        self._quote_inflight: Dict[str, asyncio.Future] = {}
+        # Index into QUOTE_URL_PARTS of the chart host that last answered.
+        self._chart_host = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # The module client outlives any one fetcher; run_ingestion releases
+        # it with aclose_client() at shutdown.
+        return get_client()
+
+    def _quote_cache_get(self, ticker: str) -> Optional[Quote]:
+        hit = self._quote_cache.get(ticker)
+        if hit and time.monotonic() - hit[0] < QUOTE_TTL:
+            return hit[1]
+        return None
+
+    def _quote_cache_put(self, quote: Quote) -> None:
+        self._quote_cache[quote.ticker] = (time.monotonic(), quote)
 
-    FOREX_TICKERS = [
-        "EURUSD=X","GBPUSD=X","USDJPY=X","USDCHF=X","AUDUSD=X",
-        "USDCAD=X","NZDUSD=X","EURGBP=X","EURJPY=X","GBPJPY=X",
-        "USDCNH=X","USDINR=X","USDMXN=X","USDBRL=X","USDSGD=X",
-        "USDKRW=X","USDHKD=X","USDTRY=X","USDZAR=X","USDNOK=X",
-    ]
-
-    COMMODITY_TICKERS = [
-        "GC=F","SI=F","CL=F","BZ=F","NG=F","HG=F",
-        "ZW=F","ZC=F","ZS=F","GLD","SLV","USO","UNG",
-    ]
-
-    ETF_TICKERS = [
-        "SPY","QQQ","IWM","DIA","VTI","VOO","VEA","VWO","EFA","EEM",
-        "XLK","XLF","XLV","XLE","XLI","XLB","XLY","XLP","XLRE","XLU",
-        "GLD","SLV","TLT","IEF","LQD","HYG","VNQ","ARKK","ARKG","ARKW",
-        "SQQQ","TQQQ","SPXL","SPXS","UVXY","VXX",
-        "SOXX","SMH","IBB","XBI","IHI","IYT","ITB","XHB",
-        "EWJ","EWZ","EWC","EWA","EWG","EWU","FXI","INDA",
-        "BOTZ","ROBO","AIQ","WCLD","BUG","HACK",
-        "ICLN","QCLN","TAN","FAN","ACES","GRID",
-        "CPER","REMX","LIT","PICK","SIL","GDX","GDXJ",
-    ]
-
-
-    async def fetch_quote(self, client: httpx.AsyncClient, ticker: str) -> Optional[dict]:
-        for url_template in [self.BASE_QUOTE, self.BASE_QUOTE_FALLBACK]:
-            url = url_template.format(symbol=ticker)
-            data = await _get(client, url)
+    async def fetch_quote(self, client: httpx.AsyncClient, ticker: str) -> Optional[Quote]:
+        symbol = quote_plus(ticker)     # "^GSPC", "EURUSD=X" need escaping
+        # Start from whichever host answered last, so a rate-limited query1
+        # costs its retries once per batch rather than once per ticker.
+        for host in (self._chart_host, 1 - self._chart_host):
+            prefix, suffix = self.QUOTE_URL_PARTS[host]
+            data = await _get(client, prefix + symbol + suffix, params=self.CHART_PARAMS)
             if not data:
                 continue
             try:
                 result = data.get("chart", {}).get("result", [])
                 if not result:
                     continue
-                meta = result[0].get("meta", {})
-                price = meta.get("regularMarketPrice") or meta.get("previousClose")
+                mg = result[0].get("meta", {}).get     # bound once, used per field
+                price = mg("regularMarketPrice") or mg("previousClose")
                 if not price:
                     continue
-                prev_close = meta.get("previousClose") or meta.get("chartPreviousClose") or price
+                prev_close = mg("previousClose") or mg("chartPreviousClose") or price
                 change_pct = ((price - prev_close) / prev_close * 100) if prev_close else 0
-                return {
-                    "ticker":              ticker,
-                    "name":                meta.get("shortName") or meta.get("longName") or ticker,
-                    "quote_type":          meta.get("instrumentType") or meta.get("quoteType"),
-                    "exchange":            meta.get("exchangeName"),
-                    "currency":            meta.get("currency", "USD"),
-                    "price":               round(float(price), 4),
-                    "change_pct":          round(float(change_pct), 4),
-                    "fifty_two_week_high": meta.get("fiftyTwoWeekHigh"),
-                    "fifty_two_week_low":  meta.get("fiftyTwoWeekLow"),
-                    "avg_volume_30d":      meta.get("regularMarketVolume"),
-                    "market_cap":          meta.get("marketCap"),
-                    "source":              "yahoo_finance",
-                }
+                quote = Quote(
+                    ticker              = ticker,
+                    name                = mg("shortName") or mg("longName") or ticker,
+                    quote_type          = mg("instrumentType") or mg("quoteType"),
+                    exchange            = mg("exchangeName"),
+                    currency            = mg("currency", "USD"),
+                    price               = round(float(price), 4),
+                    change_pct          = round(float(change_pct), 4),
+                    fifty_two_week_high = mg("fiftyTwoWeekHigh"),
+                    fifty_two_week_low  = mg("fiftyTwoWeekLow"),
+                    avg_volume_30d      = mg("regularMarketVolume"),
+                    market_cap          = mg("marketCap"),
+                )
             except Exception as e:
-                log.warning(f"Parse error for {ticker}: {e}")
+                log.warning("Parse error for %s: %s", ticker, e)
                 continue
+            self._chart_host = host
+            return quote
         return None
 
+    async def _fetch_quotes_chunk(self, client: httpx.AsyncClient,
+                                  chunk: List[str]) -> Dict[str, Quote]:
+        # Failures stay inside the chunk, so the gather in fetch_quotes_multi
+        # never sees an exception and one bad chunk cannot sink the batch.
+        quotes = {}
+        try:
+            await self._bucket.wait()
+            data = await _get(client, self.BASE_QUOTE_MULTI,
+                              params={"symbols": ",".join(chunk)},
+                              raise_on_auth=True)
+            if not data:
+                return quotes
+            for q in data.get("quoteResponse", {}).get("result") or []:
+                quote = _quote_from_v7(q)
+                if quote:
+                    quotes[quote.ticker] = quote
+        except AuthRefused:
+            # Only an auth refusal retires v7 — a 5xx or timeout on one
+            # chunk says nothing about the next.
+            self._multi_available = False
+        except Exception as e:
+            log.warning("Multi-quote chunk failed: %s", e)
+        return quotes
+
+    async def fetch_quotes_multi(self, client: httpx.AsyncClient,
+                                 tickers: List[str]) -> Dict[str, Quote]:
+        """
+        Quotes for many symbols via v7/quote, MULTI_CHUNK symbols per request.
+        Returns {ticker: quote}; symbols Yahoo does not return are absent.
+        """
+        if not self._multi_available or not tickers:
+            return {}
+        chunks = [tickers[i:i + self.MULTI_CHUNK]
+                  for i in range(0, len(tickers), self.MULTI_CHUNK)]
+        quotes: Dict[str, Quote] = {}
+        for part in await asyncio.gather(
+            *(self._fetch_quotes_chunk(client, c) for c in chunks)
+        ):
+            quotes.update(part)
+        return quotes
+
     async def fetch_tickers_batch(self, tickers: List[str], concurrency: int = 5) -> List[dict]:
-        results = []
-        sem = asyncio.Semaphore(concurrency)
-
-        async def fetch_one(ticker: str):
-            async with sem:
-                async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-                    quote = await self.fetch_quote(client, ticker)
-                    await asyncio.sleep(0.2)
-                    return quote
-
-        tasks = [fetch_one(t) for t in tickers]
-        raw = await asyncio.gather(*tasks, return_exceptions=True)
-        for r in raw:
-            if isinstance(r, dict):
-                results.append(r)
-        return results
+        return [q.as_dict() for q in await self._fetch_quotes(tickers, concurrency)]
+
+    async def _fetch_quotes(self, tickers: List[str], concurrency: int = 5) -> List[Quote]:
+        """
+        Quotes for `tickers` in input order. Symbols quoted within QUOTE_TTL
+        (e.g. GLD/SLV, listed as both commodities and ETFs) come from the
+        cache, symbols a concurrent call is fetching share its request, and
+        repeats within one call are requested once; the rest go to v7/quote,
+        with the chart endpoint as per-symbol fallback.
+        """
+        quotes = {t: q for t in tickers if (q := self._quote_cache_get(t)) is not None}
+        # Symbols another call is already fetching (e.g. the commodity and
+        # ETF batches running together) are awaited, not requested again.
+        pending = {t: f for t in tickers if t not in quotes
+                   and (f := self._quote_inflight.get(t)) is not None}
+        misses = [t for t in dict.fromkeys(tickers) if t not in quotes and t not in pending]
+        if misses:
+            loop = asyncio.get_running_loop()
+            owned = {t: loop.create_future() for t in misses}
+            self._quote_inflight.update(owned)
+            bulk: Dict[str, Quote] = {}
+            try:
+                bulk = await self.fetch_quotes_multi(self.client, misses)
+                missing = [t for t in misses if t not in bulk]
+                if missing:
+                    bulk.update((q.ticker, q) for q in
+                                await self._fetch_chart_quotes(missing, concurrency))
+                for quote in bulk.values():
+                    self._quote_cache_put(quote)
+                quotes.update(bulk)
+            finally:
+                # Always settle: waiters get the quote, or None if it failed.
+                for t, fut in owned.items():
+                    self._quote_inflight.pop(t, None)
+                    if not fut.done():
+                        fut.set_result(bulk.get(t))
+        if pending:
+            # Shielded: cancelling this waiter must not cancel the owner's futures.
+            shared = [asyncio.shield(f) for f in pending.values()]
+            for t, q in zip(pending, await asyncio.gather(*shared)):
+                if q is not None:
+                    quotes[t] = q
+        return [quotes[t] for t in tickers if t in quotes]
+
+    async def _fetch_chart_quotes(self, tickers: List[str], concurrency: int) -> List[Quote]:
+        # One slot per ticker, filled in place by whichever worker takes it —
+        # no exception objects in a results list, no isinstance filtering.
+        results: List[Optional[Quote]] = [None] * len(tickers)
+        # A fixed pool of workers drains one shared job iterator, so only
+        # `workers` coroutines exist however long the list is. Never more in
+        # flight than the pool has connections: over HTTP/2 one connection
+        # carries many streams, and the pool alone would not bound them.
+        jobs = iter(enumerate(tickers))
+        workers = min(concurrency, MAX_CONNECTIONS, len(tickers))
+        # Every worker shares the fetcher's client: one TLS handshake,
+        # kept-alive sockets, and (with h2) requests multiplexed on one connection.
+        client = self.client
+
+        async def worker():
+            for i, ticker in jobs:
+                try:
+                    await self._bucket.wait()
+                    results[i] = await self.fetch_quote(client, ticker)
+                except Exception as e:
+                    log.debug("Fetch failed for %s: %s", ticker, e)
+
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(workers):
+                tg.create_task(worker())
+        return [r for r in results if r is not None]
 
     async def fetch_forex(self) -> List[dict]:
         log.info(f"Fetching {len(self.FOREX_TICKERS)} forex pairs")
@@ -160,13 +520,29 @@ class YahooFetcher:
         log.info(f"Fetching {len(self.ETF_TICKERS)} ETFs")
         return await self.fetch_tickers_batch(self.ETF_TICKERS, concurrency=3)
 
+    async def fetch_universe(self, region: Optional[str] = None,
+                             concurrency: int = 5) -> List[dict]:
+        """
+        Quotes for every seed ticker in `region` (all regions when None).
+        Tickers quoted within QUOTE_TTL come from the cache; the rest go out
+        as one batch — v7/quote takes MULTI_CHUNK symbols per request with
+        all chunks in flight together.
+        """
+        tickers = get_universe(region).tickers
+        log.info(f"Fetching {len(tickers)} seed universe quotes ({region or 'all regions'})")
+        return await self.fetch_tickers_batch(tickers, concurrency)
+
     async def fetch_equities_screener(self, query_name: str = "us_large_cap") -> List[dict]:
         log.info(f"Attempting Yahoo screener: {query_name}")
-        async with httpx.AsyncClient(timeout=15) as client:
-            data = await _get(client,
+        cache_key = f"yahoo_screener:{query_name}"
+        data = await disk_cache.get(cache_key, SCREENER_TTL)
+        if data is None:
+            data = await _get(self.client,
                 "https://query1.finance.yahoo.com/v1/finance/screener",
                 params={"formatted": "false", "lang": "en-US", "region": "US"},
-                headers=YAHOO_HEADERS)
+                headers=YAHOO_HEADERS, timeout=15, revalidate=True)
+            if data:
+                await disk_cache.set(cache_key, data)
         if not data:
             log.warning("Yahoo screener unavailable — skipping")
             return []
@@ -191,55 +567,91 @@ class YahooFetcher:
             log.warning(f"Screener parse error: {e}")
             return []
 
+    async def validate_tickers(self, tickers: List[str],
+                               concurrency: int = 5) -> Dict[str, bool]:
+        """
+        Bulk validity check. Tickers quoted within QUOTE_TTL are answered from
+        the cache; the rest go through one multi-quote batch.
+        """
+        priced = {q.ticker for q in await self._fetch_quotes(tickers, concurrency)
+                  if q.price is not None}
+        return {t: t in priced for t in tickers}
+
     async def validate_ticker(self, ticker: str) -> bool:
-        async with httpx.AsyncClient(timeout=8) as client:
-            quote = await self.fetch_quote(client, ticker)
-        return quote is not None and quote.get("price") is not None
+        return (await self.validate_tickers([ticker]))[ticker]
 
 
 # ══════════════════════════════════════════════════════════════
 # COINGECKO FETCHER
 # ══════════════════════════════════════════════════════════════
+def _coin_row(coin: dict) -> dict:
+    """/coins/markets row → asset dict."""
+    symbol = coin.get("symbol","").upper()
+    return {
+        "ticker":          f"{symbol}-USD",
+        "name":            coin.get("name", symbol),
+        "quote_type":      "CRYPTOCURRENCY",
+        "sector":          "Crypto",
+        "currency":        "USD",
+        "market_cap":      coin.get("market_cap"),
+        "price":           coin.get("current_price"),
+        "change_pct":      coin.get("price_change_percentage_24h"),
+        "avg_volume_30d":  coin.get("total_volume"),
+        "fifty_two_week_high": coin.get("ath"),
+        "fifty_two_week_low":  coin.get("atl"),
+        "source":          "coingecko",
+        "source_id":       coin.get("id"),
+    }
+
+
 class CoinGeckoFetcher:
 
-    BASE = "https://api.coingecko.com/api/v3"
+    BASE     = "https://api.coingecko.com/api/v3"
+    PER_PAGE = 100
+
+    # Free tier allows ~30 req/min. Shared across instances — the limit is per IP.
+    _bucket = TokenBucket(capacity=2, rate=0.5)
+
+    async def _fetch_page(self, client: httpx.AsyncClient, page: int) -> Optional[list]:
+        # Disk hits skip the token bucket entirely — no request is made.
+        cache_key = f"coingecko_markets:{page}"
+        data = await disk_cache.get(cache_key, COINGECKO_TTL)
+        if data is not None:
+            return data
+        try:
+            await self._bucket.wait()
+            data = await _get(client, f"{self.BASE}/coins/markets", params={
+                "vs_currency": "usd",
+                "order":       "market_cap_desc",
+                "per_page":    self.PER_PAGE,
+                "page":        page,
+                "sparkline":   False,
+            }, headers={"Accept": "application/json"}, timeout=15, revalidate=True)
+        except Exception as e:
+            # Contained per page; a None page simply ends the walk.
+            log.debug("CoinGecko page %d failed: %s", page, e)
+            return None
+        if data:
+            await disk_cache.set(cache_key, data)
+        return data
 
     async def fetch_top_coins(self, limit: int = 100) -> List[dict]:
         log.info(f"Fetching top {limit} coins from CoinGecko")
         results = []
-        pages = (limit // 100) + 1
-
-        async with httpx.AsyncClient(timeout=15) as client:
-            for page in range(1, pages + 1):
-                data = await _get(client, f"{self.BASE}/coins/markets", params={
-                    "vs_currency": "usd",
-                    "order":       "market_cap_desc",
-                    "per_page":    100,
-                    "page":        page,
-                    "sparkline":   False,
-                }, headers={"Accept": "application/json"})
-                if not data:
-                    break
-                for coin in data:
-                    symbol = coin.get("symbol","").upper()
-                    results.append({
-                        "ticker":          f"{symbol}-USD",
-                        "name":            coin.get("name", symbol),
-                        "quote_type":      "CRYPTOCURRENCY",
-                        "sector":          "Crypto",
-                        "currency":        "USD",
-                        "market_cap":      coin.get("market_cap"),
-                        "price":           coin.get("current_price"),
-                        "change_pct":      coin.get("price_change_percentage_24h"),
-                        "avg_volume_30d":  coin.get("total_volume"),
-                        "fifty_two_week_high": coin.get("ath"),
-                        "fifty_two_week_low":  coin.get("atl"),
-                        "source":          "coingecko",
-                        "source_id":       coin.get("id"),
-                    })
-                if len(data) < 100:
-                    break
-                await asyncio.sleep(2)
+        pages = math.ceil(limit / self.PER_PAGE)
+
+        # All pages are dispatched at once; the token bucket paces them.
+        client = get_client()
+        pages_data = await asyncio.gather(
+            *(self._fetch_page(client, page) for page in range(1, pages + 1))
+        )
+
+        for data in pages_data:
+            if not data:
+                break
+            results.extend(map(_coin_row, data))
+            if len(data) < self.PER_PAGE:
+                break
 
         return results[:limit]
 
@@ -253,1301 +665,70 @@ class StaticSeedFetcher:
     Covers: US mega/large caps, UK FTSE stocks, thematic plays, crypto proxies.
     """
 
-    SEEDS = [
-        # ── US MEGA CAP TECH ─────────────────────────────────
-        {"ticker":"NVDA","name":"NVIDIA","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"AAPL","name":"Apple","sector":"Technology","industry":"Hardware","country":"US"},
-        {"ticker":"MSFT","name":"Microsoft","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"GOOGL","name":"Alphabet","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"META","name":"Meta Platforms","sector":"Technology","industry":"Social Media","country":"US"},
-        {"ticker":"AMD","name":"AMD","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"INTC","name":"Intel","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"AVGO","name":"Broadcom","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"QCOM","name":"Qualcomm","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"TXN","name":"Texas Instruments","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"MU","name":"Micron Technology","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"AMAT","name":"Applied Materials","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"LRCX","name":"Lam Research","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"ASML","name":"ASML Holding","sector":"Technology","industry":"Semiconductors","country":"NL"},
-        {"ticker":"TSM","name":"TSMC","sector":"Technology","industry":"Semiconductors","country":"TW"},
-        {"ticker":"ARM","name":"Arm Holdings","sector":"Technology","industry":"Semiconductors","country":"GB"},
-        {"ticker":"MRVL","name":"Marvell Technology","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"KLAC","name":"KLA Corporation","sector":"Technology","industry":"Semiconductors","country":"US"},
-
-        # ── SOFTWARE / CLOUD ─────────────────────────────────
-        {"ticker":"CRM","name":"Salesforce","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"ORCL","name":"Oracle","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"ADBE","name":"Adobe","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"NOW","name":"ServiceNow","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"SNOW","name":"Snowflake","sector":"Technology","industry":"Cloud","country":"US"},
-        {"ticker":"DDOG","name":"Datadog","sector":"Technology","industry":"Cloud","country":"US"},
-        {"ticker":"NET","name":"Cloudflare","sector":"Technology","industry":"Cloud","country":"US"},
-        {"ticker":"MDB","name":"MongoDB","sector":"Technology","industry":"Cloud","country":"US"},
-        {"ticker":"HUBS","name":"HubSpot","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"TEAM","name":"Atlassian","sector":"Technology","industry":"Software","country":"AU"},
-        {"ticker":"WDAY","name":"Workday","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"ZM","name":"Zoom Video","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"TWLO","name":"Twilio","sector":"Technology","industry":"Cloud","country":"US"},
-
-        # ── CYBERSECURITY ────────────────────────────────────
-        {"ticker":"CRWD","name":"CrowdStrike","sector":"Technology","industry":"Cybersecurity","country":"US"},
-        {"ticker":"PANW","name":"Palo Alto Networks","sector":"Technology","industry":"Cybersecurity","country":"US"},
-        {"ticker":"ZS","name":"Zscaler","sector":"Technology","industry":"Cybersecurity","country":"US"},
-        {"ticker":"S","name":"SentinelOne","sector":"Technology","industry":"Cybersecurity","country":"US"},
-        {"ticker":"OKTA","name":"Okta","sector":"Technology","industry":"Cybersecurity","country":"US"},
-        {"ticker":"FTNT","name":"Fortinet","sector":"Technology","industry":"Cybersecurity","country":"US"},
-
-        # ── AI / ML ──────────────────────────────────────────
-        {"ticker":"PLTR","name":"Palantir","sector":"Technology","industry":"AI / ML","country":"US"},
-        {"ticker":"AI","name":"C3.ai","sector":"Technology","industry":"AI / ML","country":"US"},
-        {"ticker":"SOUN","name":"SoundHound AI","sector":"Technology","industry":"AI / ML","country":"US"},
-        {"ticker":"BBAI","name":"BigBear.ai","sector":"Technology","industry":"AI / ML","country":"US"},
-        {"ticker":"UPST","name":"Upstart Holdings","sector":"Finance","industry":"AI Lending","country":"US"},
-
-        # ── QUANTUM COMPUTING ────────────────────────────────
-        {"ticker":"IONQ","name":"IonQ","sector":"Technology","industry":"Quantum Computing","country":"US"},
-        {"ticker":"QUBT","name":"Quantum Computing Inc","sector":"Technology","industry":"Quantum Computing","country":"US"},
-        {"ticker":"RGTI","name":"Rigetti Computing","sector":"Technology","industry":"Quantum Computing","country":"US"},
-        {"ticker":"QBTS","name":"D-Wave Quantum","sector":"Technology","industry":"Quantum Computing","country":"US"},
-
-        # ── STREAMING / MEDIA / GAMING ───────────────────────
-        {"ticker":"NFLX","name":"Netflix","sector":"Consumer","industry":"Streaming","country":"US"},
-        {"ticker":"DIS","name":"Walt Disney","sector":"Consumer","industry":"Entertainment","country":"US"},
-        {"ticker":"SPOT","name":"Spotify","sector":"Consumer","industry":"Streaming","country":"SE"},
-        {"ticker":"RBLX","name":"Roblox","sector":"Consumer","industry":"Gaming","country":"US"},
-        {"ticker":"TTWO","name":"Take-Two Interactive","sector":"Consumer","industry":"Gaming","country":"US"},
-        {"ticker":"EA","name":"Electronic Arts","sector":"Consumer","industry":"Gaming","country":"US"},
-        {"ticker":"ATVI","name":"Activision Blizzard","sector":"Consumer","industry":"Gaming","country":"US"},
-
-        # ── US CONSUMER ───────────────────────────────────────
-        {"ticker":"AMZN","name":"Amazon","sector":"Consumer","industry":"E-Commerce","country":"US"},
-        {"ticker":"TSLA","name":"Tesla","sector":"Consumer","industry":"EV","country":"US"},
-        {"ticker":"NKE","name":"Nike","sector":"Consumer","industry":"Apparel","country":"US"},
-        {"ticker":"SBUX","name":"Starbucks","sector":"Consumer","industry":"Restaurants","country":"US"},
-        {"ticker":"MCD","name":"McDonald's","sector":"Consumer","industry":"Restaurants","country":"US"},
-        {"ticker":"CMG","name":"Chipotle","sector":"Consumer","industry":"Restaurants","country":"US"},
-        {"ticker":"LULU","name":"Lululemon","sector":"Consumer","industry":"Apparel","country":"US"},
-        {"ticker":"GME","name":"GameStop","sector":"Consumer","industry":"Gaming Retail","country":"US"},
-        {"ticker":"AMC","name":"AMC Entertainment","sector":"Consumer","industry":"Entertainment","country":"US"},
-        {"ticker":"WMT","name":"Walmart","sector":"Consumer","industry":"Retail","country":"US"},
-        {"ticker":"TGT","name":"Target","sector":"Consumer","industry":"Retail","country":"US"},
-        {"ticker":"COST","name":"Costco","sector":"Consumer","industry":"Retail","country":"US"},
-        {"ticker":"RIVN","name":"Rivian","sector":"Consumer","industry":"EV","country":"US"},
-        {"ticker":"LCID","name":"Lucid Group","sector":"Consumer","industry":"EV","country":"US"},
-        {"ticker":"NIO","name":"NIO Inc","sector":"Consumer","industry":"EV","country":"CN"},
-        {"ticker":"LI","name":"Li Auto","sector":"Consumer","industry":"EV","country":"CN"},
-        {"ticker":"XPEV","name":"XPeng","sector":"Consumer","industry":"EV","country":"CN"},
-        {"ticker":"F","name":"Ford Motor","sector":"Consumer","industry":"Auto","country":"US"},
-        {"ticker":"GM","name":"General Motors","sector":"Consumer","industry":"Auto","country":"US"},
-        {"ticker":"UBER","name":"Uber Technologies","sector":"Consumer","industry":"Rideshare","country":"US"},
-        {"ticker":"LYFT","name":"Lyft","sector":"Consumer","industry":"Rideshare","country":"US"},
-        {"ticker":"ABNB","name":"Airbnb","sector":"Consumer","industry":"Travel","country":"US"},
-        {"ticker":"BKNG","name":"Booking Holdings","sector":"Consumer","industry":"Travel","country":"US"},
-
-        # ── US FINANCE ────────────────────────────────────────
-        {"ticker":"JPM","name":"JPMorgan Chase","sector":"Finance","industry":"Banking","country":"US"},
-        {"ticker":"GS","name":"Goldman Sachs","sector":"Finance","industry":"Investment Banking","country":"US"},
-        {"ticker":"MS","name":"Morgan Stanley","sector":"Finance","industry":"Investment Banking","country":"US"},
-        {"ticker":"BAC","name":"Bank of America","sector":"Finance","industry":"Banking","country":"US"},
-        {"ticker":"WFC","name":"Wells Fargo","sector":"Finance","industry":"Banking","country":"US"},
-        {"ticker":"C","name":"Citigroup","sector":"Finance","industry":"Banking","country":"US"},
-        {"ticker":"V","name":"Visa","sector":"Finance","industry":"Payments","country":"US"},
-        {"ticker":"MA","name":"Mastercard","sector":"Finance","industry":"Payments","country":"US"},
-        {"ticker":"PYPL","name":"PayPal","sector":"Finance","industry":"Fintech","country":"US"},
-        {"ticker":"SQ","name":"Block Inc","sector":"Finance","industry":"Fintech","country":"US"},
-        {"ticker":"SOFI","name":"SoFi Technologies","sector":"Finance","industry":"Fintech","country":"US"},
-        {"ticker":"AFRM","name":"Affirm Holdings","sector":"Finance","industry":"Fintech","country":"US"},
-        {"ticker":"COIN","name":"Coinbase","sector":"Finance","industry":"Crypto Exchange","country":"US"},
-        {"ticker":"MSTR","name":"MicroStrategy","sector":"Finance","industry":"BTC Treasury","country":"US"},
-        {"ticker":"HOOD","name":"Robinhood","sector":"Finance","industry":"Fintech","country":"US"},
-        {"ticker":"SCHW","name":"Charles Schwab","sector":"Finance","industry":"Brokerage","country":"US"},
-        {"ticker":"BLK","name":"BlackRock","sector":"Finance","industry":"Asset Management","country":"US"},
-        {"ticker":"AXP","name":"American Express","sector":"Finance","industry":"Payments","country":"US"},
-
-        # ── US HEALTHCARE ─────────────────────────────────────
-        {"ticker":"JNJ","name":"Johnson & Johnson","sector":"Healthcare","industry":"Pharma","country":"US"},
-        {"ticker":"PFE","name":"Pfizer","sector":"Healthcare","industry":"Pharma","country":"US"},
-        {"ticker":"MRK","name":"Merck","sector":"Healthcare","industry":"Pharma","country":"US"},
-        {"ticker":"ABBV","name":"AbbVie","sector":"Healthcare","industry":"Pharma","country":"US"},
-        {"ticker":"LLY","name":"Eli Lilly","sector":"Healthcare","industry":"Pharma","country":"US"},
-        {"ticker":"BMY","name":"Bristol-Myers Squibb","sector":"Healthcare","industry":"Pharma","country":"US"},
-        {"ticker":"MRNA","name":"Moderna","sector":"Healthcare","industry":"Biotech","country":"US"},
-        {"ticker":"BIIB","name":"Biogen","sector":"Healthcare","industry":"Biotech","country":"US"},
-        {"ticker":"GILD","name":"Gilead Sciences","sector":"Healthcare","industry":"Biotech","country":"US"},
-        {"ticker":"REGN","name":"Regeneron","sector":"Healthcare","industry":"Biotech","country":"US"},
-        {"ticker":"VRTX","name":"Vertex Pharma","sector":"Healthcare","industry":"Biotech","country":"US"},
-        {"ticker":"ISRG","name":"Intuitive Surgical","sector":"Healthcare","industry":"MedTech","country":"US"},
-        {"ticker":"SYK","name":"Stryker","sector":"Healthcare","industry":"MedTech","country":"US"},
-        {"ticker":"MDT","name":"Medtronic","sector":"Healthcare","industry":"MedTech","country":"US"},
-        {"ticker":"DXCM","name":"Dexcom","sector":"Healthcare","industry":"MedTech","country":"US"},
-        {"ticker":"NTLA","name":"Intellia Therapeutics","sector":"Healthcare","industry":"CRISPR","country":"US"},
-        {"ticker":"CRSP","name":"CRISPR Therapeutics","sector":"Healthcare","industry":"CRISPR","country":"US"},
-        {"ticker":"BEAM","name":"Beam Therapeutics","sector":"Healthcare","industry":"Gene Editing","country":"US"},
-        {"ticker":"EDIT","name":"Editas Medicine","sector":"Healthcare","industry":"CRISPR","country":"US"},
-        {"ticker":"RXRX","name":"Recursion Pharma","sector":"Healthcare","industry":"AI Drug Discovery","country":"US"},
-        {"ticker":"UNH","name":"UnitedHealth Group","sector":"Healthcare","industry":"Health Insurance","country":"US"},
-        {"ticker":"CVS","name":"CVS Health","sector":"Healthcare","industry":"Pharmacy","country":"US"},
-        {"ticker":"HCA","name":"HCA Healthcare","sector":"Healthcare","industry":"Hospitals","country":"US"},
-
-        # ── US ENERGY ─────────────────────────────────────────
-        {"ticker":"XOM","name":"ExxonMobil","sector":"Energy","industry":"Oil & Gas","country":"US"},
-        {"ticker":"CVX","name":"Chevron","sector":"Energy","industry":"Oil & Gas","country":"US"},
-        {"ticker":"COP","name":"ConocoPhillips","sector":"Energy","industry":"Oil & Gas","country":"US"},
-        {"ticker":"OXY","name":"Occidental Petroleum","sector":"Energy","industry":"Oil & Gas","country":"US"},
-        {"ticker":"SLB","name":"SLB (Schlumberger)","sector":"Energy","industry":"Oilfield Services","country":"US"},
-        {"ticker":"FSLR","name":"First Solar","sector":"Energy","industry":"Solar","country":"US"},
-        {"ticker":"ENPH","name":"Enphase Energy","sector":"Energy","industry":"Solar","country":"US"},
-        {"ticker":"SEDG","name":"SolarEdge Technologies","sector":"Energy","industry":"Solar","country":"US"},
-        {"ticker":"NEE","name":"NextEra Energy","sector":"Energy","industry":"Renewables","country":"US"},
-        {"ticker":"PLUG","name":"Plug Power","sector":"Energy","industry":"Hydrogen","country":"US"},
-        {"ticker":"FCEL","name":"FuelCell Energy","sector":"Energy","industry":"Hydrogen","country":"US"},
-        {"ticker":"BE","name":"Bloom Energy","sector":"Energy","industry":"Fuel Cells","country":"US"},
-        {"ticker":"HASI","name":"Hannon Armstrong","sector":"Energy","industry":"Clean Energy Finance","country":"US"},
-        {"ticker":"CHPT","name":"ChargePoint","sector":"Energy","industry":"EV Charging","country":"US"},
-        {"ticker":"BLNK","name":"Blink Charging","sector":"Energy","industry":"EV Charging","country":"US"},
-        {"ticker":"EVGO","name":"EVgo","sector":"Energy","industry":"EV Charging","country":"US"},
-
-        # ── NUCLEAR / URANIUM ─────────────────────────────────
-        {"ticker":"NNE","name":"Nano Nuclear Energy","sector":"Energy","industry":"Nuclear","country":"US"},
-        {"ticker":"CCJ","name":"Cameco","sector":"Energy","industry":"Uranium","country":"CA"},
-        {"ticker":"UEC","name":"Uranium Energy","sector":"Energy","industry":"Uranium","country":"US"},
-        {"ticker":"DNN","name":"Denison Mines","sector":"Energy","industry":"Uranium","country":"CA"},
-        {"ticker":"UUUU","name":"Energy Fuels","sector":"Energy","industry":"Uranium","country":"US"},
-        {"ticker":"URG","name":"Ur-Energy","sector":"Energy","industry":"Uranium","country":"CA"},
-        {"ticker":"SMR","name":"NuScale Power","sector":"Energy","industry":"Nuclear","country":"US"},
-        {"ticker":"OKLO","name":"Oklo Inc","sector":"Energy","industry":"Nuclear","country":"US"},
-
-        # ── SPACE & DEFENCE ───────────────────────────────────
-        {"ticker":"RKLB","name":"Rocket Lab USA","sector":"Space","industry":"Launch","country":"US"},
-        {"ticker":"ASTS","name":"AST SpaceMobile","sector":"Space","industry":"Satellite","country":"US"},
-        {"ticker":"LMT","name":"Lockheed Martin","sector":"Space","industry":"Defence","country":"US"},
-        {"ticker":"NOC","name":"Northrop Grumman","sector":"Space","industry":"Defence","country":"US"},
-        {"ticker":"RTX","name":"RTX Corporation","sector":"Space","industry":"Defence","country":"US"},
-        {"ticker":"BA","name":"Boeing","sector":"Space","industry":"Aerospace","country":"US"},
-        {"ticker":"GD","name":"General Dynamics","sector":"Space","industry":"Defence","country":"US"},
-        {"ticker":"SPCE","name":"Virgin Galactic","sector":"Space","industry":"Launch","country":"US"},
-        {"ticker":"MAXR","name":"Maxar Technologies","sector":"Space","industry":"Satellite","country":"US"},
-        {"ticker":"BWXT","name":"BWX Technologies","sector":"Space","industry":"Nuclear Defence","country":"US"},
-        {"ticker":"HII","name":"Huntington Ingalls","sector":"Space","industry":"Defence","country":"US"},
-        {"ticker":"KTOS","name":"Kratos Defence","sector":"Space","industry":"Defence","country":"US"},
-        {"ticker":"AVAV","name":"AeroVironment","sector":"Space","industry":"Drones","country":"US"},
-        {"ticker":"ACHR","name":"Archer Aviation","sector":"Space","industry":"eVTOL","country":"US"},
-        {"ticker":"JOBY","name":"Joby Aviation","sector":"Space","industry":"eVTOL","country":"US"},
-
-        # ── LITHIUM / CRITICAL MINERALS ───────────────────────
-        {"ticker":"ALB","name":"Albemarle","sector":"Materials","industry":"Lithium","country":"US"},
-        {"ticker":"LAC","name":"Lithium Americas","sector":"Materials","industry":"Lithium","country":"CA"},
-        {"ticker":"SQM","name":"Sociedad Quimica","sector":"Materials","industry":"Lithium","country":"CL"},
-        {"ticker":"PLL","name":"Piedmont Lithium","sector":"Materials","industry":"Lithium","country":"US"},
-        {"ticker":"LTHM","name":"Livent","sector":"Materials","industry":"Lithium","country":"US"},
-        {"ticker":"FCX","name":"Freeport-McMoRan","sector":"Materials","industry":"Copper","country":"US"},
-        {"ticker":"NUE","name":"Nucor Steel","sector":"Materials","industry":"Steel","country":"US"},
-        {"ticker":"VALE","name":"Vale SA","sector":"Materials","industry":"Iron Ore","country":"BR"},
-        {"ticker":"CLF","name":"Cleveland-Cliffs","sector":"Materials","industry":"Steel","country":"US"},
-        {"ticker":"MP","name":"MP Materials","sector":"Materials","industry":"Rare Earth","country":"US"},
-
-        # ── INDUSTRIALS ───────────────────────────────────────
-        {"ticker":"DE","name":"John Deere","sector":"Industrials","industry":"Machinery","country":"US"},
-        {"ticker":"CAT","name":"Caterpillar","sector":"Industrials","industry":"Machinery","country":"US"},
-        {"ticker":"HON","name":"Honeywell","sector":"Industrials","industry":"Diversified","country":"US"},
-        {"ticker":"GE","name":"GE Aerospace","sector":"Industrials","industry":"Aerospace","country":"US"},
-        {"ticker":"MMM","name":"3M","sector":"Industrials","industry":"Diversified","country":"US"},
-        {"ticker":"UPS","name":"UPS","sector":"Industrials","industry":"Logistics","country":"US"},
-        {"ticker":"FDX","name":"FedEx","sector":"Industrials","industry":"Logistics","country":"US"},
-
-        # ── UK STOCKS (FTSE) ──────────────────────────────────
-        {"ticker":"BP.L","name":"BP plc","sector":"Energy","industry":"Oil & Gas","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"SHEL.L","name":"Shell plc","sector":"Energy","industry":"Oil & Gas","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"HSBA.L","name":"HSBC Holdings","sector":"Finance","industry":"Banking","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"LLOY.L","name":"Lloyds Banking Group","sector":"Finance","industry":"Banking","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"BARC.L","name":"Barclays","sector":"Finance","industry":"Banking","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"NWG.L","name":"NatWest Group","sector":"Finance","industry":"Banking","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"STAN.L","name":"Standard Chartered","sector":"Finance","industry":"Banking","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"VOD.L","name":"Vodafone","sector":"Technology","industry":"Telecom","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"BT-A.L","name":"BT Group","sector":"Technology","industry":"Telecom","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"AZN.L","name":"AstraZeneca","sector":"Healthcare","industry":"Pharma","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"GSK.L","name":"GSK plc","sector":"Healthcare","industry":"Pharma","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"ULVR.L","name":"Unilever","sector":"Consumer","industry":"FMCG","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"DGE.L","name":"Diageo","sector":"Consumer","industry":"Beverages","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"REL.L","name":"RELX","sector":"Technology","industry":"Data & Analytics","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"RIO.L","name":"Rio Tinto","sector":"Materials","industry":"Mining","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"BHP.L","name":"BHP Group","sector":"Materials","industry":"Mining","country":"AU","exchange":"LSE","currency":"GBP"},
-        {"ticker":"AAL.L","name":"Anglo American","sector":"Materials","industry":"Mining","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"GLEN.L","name":"Glencore","sector":"Materials","industry":"Mining","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"RR.L","name":"Rolls-Royce","sector":"Industrials","industry":"Aerospace","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"BA.L","name":"BAE Systems","sector":"Space","industry":"Defence","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"IAG.L","name":"IAG","sector":"Consumer","industry":"Airlines","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"EXPN.L","name":"Experian","sector":"Finance","industry":"Data & Analytics","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"LSEG.L","name":"London Stock Exchange Group","sector":"Finance","industry":"Exchange","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"PRU.L","name":"Prudential","sector":"Finance","industry":"Insurance","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"TSCO.L","name":"Tesco","sector":"Consumer","industry":"Retail","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"MKS.L","name":"Marks & Spencer","sector":"Consumer","industry":"Retail","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"SBRY.L","name":"Sainsbury's","sector":"Consumer","industry":"Retail","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"AUTO.L","name":"Auto Trader","sector":"Technology","industry":"Marketplace","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"WISE.L","name":"Wise","sector":"Finance","industry":"Fintech","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"III.L","name":"3i Group","sector":"Finance","industry":"Private Equity","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"CNA.L","name":"Centrica","sector":"Energy","industry":"Gas","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"SSE.L","name":"SSE plc","sector":"Energy","industry":"Renewables","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"NG.L","name":"National Grid","sector":"Energy","industry":"Utilities","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"SGRO.L","name":"Segro","sector":"Real Estate","industry":"Logistics REIT","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"LAND.L","name":"Land Securities","sector":"Real Estate","industry":"REIT","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"SVT.L","name":"Severn Trent","sector":"Industrials","industry":"Water","country":"GB","exchange":"LSE","currency":"GBP"},
-
-        # ── AGRICULTURE ───────────────────────────────────────
-        {"ticker":"ADM","name":"Archer-Daniels-Midland","sector":"Agriculture","industry":"Grain","country":"US"},
-        {"ticker":"BG","name":"Bunge Global","sector":"Agriculture","industry":"Grain","country":"US"},
-        {"ticker":"MOS","name":"The Mosaic Company","sector":"Agriculture","industry":"Fertilisers","country":"US"},
-        {"ticker":"NTR","name":"Nutrien","sector":"Agriculture","industry":"Fertilisers","country":"CA"},
-        {"ticker":"CF","name":"CF Industries","sector":"Agriculture","industry":"Fertilisers","country":"US"},
-        {"ticker":"CTVA","name":"Corteva","sector":"Agriculture","industry":"Seeds","country":"US"},
-        {"ticker":"FMC","name":"FMC Corporation","sector":"Agriculture","industry":"Agrochemicals","country":"US"},
-
-        # ── REAL ESTATE ───────────────────────────────────────
-        {"ticker":"AMT","name":"American Tower","sector":"Real Estate","industry":"Data Centre REIT","country":"US"},
-        {"ticker":"EQIX","name":"Equinix","sector":"Real Estate","industry":"Data Centre REIT","country":"US"},
-        {"ticker":"PLD","name":"Prologis","sector":"Real Estate","industry":"Logistics REIT","country":"US"},
-        {"ticker":"SPG","name":"Simon Property Group","sector":"Real Estate","industry":"Retail REIT","country":"US"},
-        {"ticker":"O","name":"Realty Income","sector":"Real Estate","industry":"Net Lease REIT","country":"US"},
-        {"ticker":"VICI","name":"VICI Properties","sector":"Real Estate","industry":"Gaming REIT","country":"US"},
-
-        # ── CRYPTO PROXIES ────────────────────────────────────
-        {"ticker":"IBIT","name":"iShares Bitcoin Trust","sector":"Crypto","industry":"Bitcoin ETF","country":"US"},
-        {"ticker":"FBTC","name":"Fidelity Bitcoin Fund","sector":"Crypto","industry":"Bitcoin ETF","country":"US"},
-        {"ticker":"GBTC","name":"Grayscale Bitcoin Trust","sector":"Crypto","industry":"Bitcoin ETF","country":"US"},
-        {"ticker":"RIOT","name":"Riot Platforms","sector":"Crypto","industry":"Bitcoin Mining","country":"US"},
-        {"ticker":"MARA","name":"Marathon Digital","sector":"Crypto","industry":"Bitcoin Mining","country":"US"},
-        {"ticker":"CLSK","name":"CleanSpark","sector":"Crypto","industry":"Bitcoin Mining","country":"US"},
-        {"ticker":"HUT","name":"Hut 8 Corp","sector":"Crypto","industry":"Bitcoin Mining","country":"CA"},
-        {"ticker":"CIFR","name":"Cipher Mining","sector":"Crypto","industry":"Bitcoin Mining","country":"US"},
-
-        # ── REMAINING FTSE 100 ────────────────────────────────
-        {"ticker":"ABF.L","name":"Associated British Foods","sector":"Consumer","industry":"Food","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"ADM.L","name":"Admiral Group","sector":"Finance","industry":"Insurance","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"AHT.L","name":"Ashtead Group","sector":"Industrials","industry":"Equipment Rental","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"ANTO.L","name":"Antofagasta","sector":"Materials","industry":"Copper Mining","country":"CL","exchange":"LSE","currency":"GBP"},
-        {"ticker":"AV.L","name":"Aviva","sector":"Finance","industry":"Insurance","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"BATS.L","name":"British American Tobacco","sector":"Consumer","industry":"Tobacco","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"BLND.L","name":"British Land","sector":"Real Estate","industry":"REIT","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"BVIC.L","name":"Britvic","sector":"Consumer","industry":"Beverages","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"CPG.L","name":"Compass Group","sector":"Consumer","industry":"Catering","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"CRH.L","name":"CRH plc","sector":"Industrials","industry":"Building Materials","country":"IE","exchange":"LSE","currency":"GBP"},
-        {"ticker":"EZJ.L","name":"easyJet","sector":"Consumer","industry":"Airlines","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"FERG.L","name":"Ferguson Enterprises","sector":"Industrials","industry":"Distribution","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"FLTR.L","name":"Flutter Entertainment","sector":"Consumer","industry":"Gambling","country":"IE","exchange":"LSE","currency":"GBP"},
-        {"ticker":"FRES.L","name":"Fresnillo","sector":"Materials","industry":"Silver Mining","country":"MX","exchange":"LSE","currency":"GBP"},
-        {"ticker":"HIK.L","name":"Hikma Pharmaceuticals","sector":"Healthcare","industry":"Generics","country":"JO","exchange":"LSE","currency":"GBP"},
-        {"ticker":"HL.L","name":"Hargreaves Lansdown","sector":"Finance","industry":"Wealth Management","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"IMB.L","name":"Imperial Brands","sector":"Consumer","industry":"Tobacco","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"INF.L","name":"Informa","sector":"Technology","industry":"Publishing","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"ITRK.L","name":"Intertek Group","sector":"Industrials","industry":"Testing","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"JD.L","name":"JD Sports","sector":"Consumer","industry":"Retail","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"KGF.L","name":"Kingfisher","sector":"Consumer","industry":"DIY Retail","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"LGEN.L","name":"Legal & General","sector":"Finance","industry":"Insurance","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"MNDI.L","name":"Mondi","sector":"Materials","industry":"Packaging","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"MNG.L","name":"M&G plc","sector":"Finance","industry":"Asset Management","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"NXT.L","name":"Next plc","sector":"Consumer","industry":"Retail","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"OCDO.L","name":"Ocado Group","sector":"Technology","industry":"E-Commerce","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"PSN.L","name":"Persimmon","sector":"Real Estate","industry":"Housebuilding","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"PSON.L","name":"Pearson","sector":"Technology","industry":"Education","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"RKT.L","name":"Reckitt Benckiser","sector":"Consumer","industry":"FMCG","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"RMV.L","name":"Rightmove","sector":"Technology","industry":"Marketplace","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"SGE.L","name":"Sage Group","sector":"Technology","industry":"Software","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"SKG.L","name":"Smurfit Kappa","sector":"Materials","industry":"Packaging","country":"IE","exchange":"LSE","currency":"GBP"},
-        {"ticker":"SMT.L","name":"Scottish Mortgage IT","sector":"Finance","industry":"Investment Trust","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"SN.L","name":"Smith & Nephew","sector":"Healthcare","industry":"MedTech","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"SMIN.L","name":"Smiths Group","sector":"Industrials","industry":"Diversified","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"SPX.L","name":"Spirax-Sarco","sector":"Industrials","industry":"Engineering","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"STJ.L","name":"St. James Place","sector":"Finance","industry":"Wealth Management","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"TW.L","name":"Taylor Wimpey","sector":"Real Estate","industry":"Housebuilding","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"UU.L","name":"United Utilities","sector":"Industrials","industry":"Water","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"WPP.L","name":"WPP plc","sector":"Technology","industry":"Advertising","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"WTB.L","name":"Whitbread","sector":"Consumer","industry":"Hotels","country":"GB","exchange":"LSE","currency":"GBP"},
-        {"ticker":"MNDI.L","name":"Mondi","sector":"Materials","industry":"Packaging","country":"GB","exchange":"LSE","currency":"GBP"},
-
-        # ── EUROPEAN BLUE CHIPS ───────────────────────────────
-        {"ticker":"SAP.DE","name":"SAP SE","sector":"Technology","industry":"Software","country":"DE","exchange":"XETRA","currency":"EUR"},
-        {"ticker":"SIE.DE","name":"Siemens AG","sector":"Industrials","industry":"Engineering","country":"DE","exchange":"XETRA","currency":"EUR"},
-        {"ticker":"ALV.DE","name":"Allianz SE","sector":"Finance","industry":"Insurance","country":"DE","exchange":"XETRA","currency":"EUR"},
-        {"ticker":"MUV2.DE","name":"Munich Re","sector":"Finance","industry":"Reinsurance","country":"DE","exchange":"XETRA","currency":"EUR"},
-        {"ticker":"DBK.DE","name":"Deutsche Bank","sector":"Finance","industry":"Banking","country":"DE","exchange":"XETRA","currency":"EUR"},
-        {"ticker":"BMW.DE","name":"BMW AG","sector":"Consumer","industry":"Auto","country":"DE","exchange":"XETRA","currency":"EUR"},
-        {"ticker":"MBG.DE","name":"Mercedes-Benz","sector":"Consumer","industry":"Auto","country":"DE","exchange":"XETRA","currency":"EUR"},
-        {"ticker":"VOW3.DE","name":"Volkswagen AG","sector":"Consumer","industry":"Auto","country":"DE","exchange":"XETRA","currency":"EUR"},
-        {"ticker":"BAYN.DE","name":"Bayer AG","sector":"Healthcare","industry":"Pharma","country":"DE","exchange":"XETRA","currency":"EUR"},
-        {"ticker":"BASF.DE","name":"BASF SE","sector":"Materials","industry":"Chemicals","country":"DE","exchange":"XETRA","currency":"EUR"},
-        {"ticker":"DTE.DE","name":"Deutsche Telekom","sector":"Technology","industry":"Telecom","country":"DE","exchange":"XETRA","currency":"EUR"},
-        {"ticker":"RWE.DE","name":"RWE AG","sector":"Energy","industry":"Renewables","country":"DE","exchange":"XETRA","currency":"EUR"},
-        {"ticker":"ADS.DE","name":"Adidas AG","sector":"Consumer","industry":"Apparel","country":"DE","exchange":"XETRA","currency":"EUR"},
-        {"ticker":"MRK.DE","name":"Merck KGaA","sector":"Healthcare","industry":"Pharma","country":"DE","exchange":"XETRA","currency":"EUR"},
-        {"ticker":"EOAN.DE","name":"E.ON SE","sector":"Energy","industry":"Utilities","country":"DE","exchange":"XETRA","currency":"EUR"},
-        {"ticker":"OR.PA","name":"LOreal","sector":"Consumer","industry":"Beauty","country":"FR","exchange":"EURONEXT","currency":"EUR"},
-        {"ticker":"MC.PA","name":"LVMH","sector":"Consumer","industry":"Luxury","country":"FR","exchange":"EURONEXT","currency":"EUR"},
-        {"ticker":"RMS.PA","name":"Hermes","sector":"Consumer","industry":"Luxury","country":"FR","exchange":"EURONEXT","currency":"EUR"},
-        {"ticker":"TTE.PA","name":"TotalEnergies","sector":"Energy","industry":"Oil & Gas","country":"FR","exchange":"EURONEXT","currency":"EUR"},
-        {"ticker":"BNP.PA","name":"BNP Paribas","sector":"Finance","industry":"Banking","country":"FR","exchange":"EURONEXT","currency":"EUR"},
-        {"ticker":"SAN.PA","name":"Sanofi","sector":"Healthcare","industry":"Pharma","country":"FR","exchange":"EURONEXT","currency":"EUR"},
-        {"ticker":"AIR.PA","name":"Airbus SE","sector":"Industrials","industry":"Aerospace","country":"FR","exchange":"EURONEXT","currency":"EUR"},
-        {"ticker":"AXA.PA","name":"AXA SA","sector":"Finance","industry":"Insurance","country":"FR","exchange":"EURONEXT","currency":"EUR"},
-        {"ticker":"HEIA.AS","name":"Heineken","sector":"Consumer","industry":"Beverages","country":"NL","exchange":"EURONEXT","currency":"EUR"},
-        {"ticker":"INGA.AS","name":"ING Group","sector":"Finance","industry":"Banking","country":"NL","exchange":"EURONEXT","currency":"EUR"},
-        {"ticker":"ADYEN.AS","name":"Adyen","sector":"Finance","industry":"Fintech","country":"NL","exchange":"EURONEXT","currency":"EUR"},
-        {"ticker":"NESN.SW","name":"Nestle SA","sector":"Consumer","industry":"Food","country":"CH","exchange":"SIX","currency":"CHF"},
-        {"ticker":"ROG.SW","name":"Roche Holding","sector":"Healthcare","industry":"Pharma","country":"CH","exchange":"SIX","currency":"CHF"},
-        {"ticker":"NOVN.SW","name":"Novartis AG","sector":"Healthcare","industry":"Pharma","country":"CH","exchange":"SIX","currency":"CHF"},
-        {"ticker":"UBSG.SW","name":"UBS Group","sector":"Finance","industry":"Banking","country":"CH","exchange":"SIX","currency":"CHF"},
-        {"ticker":"NOVOB.CO","name":"Novo Nordisk","sector":"Healthcare","industry":"Pharma","country":"DK","exchange":"OMXC","currency":"DKK"},
-        {"ticker":"ERIC-B.ST","name":"Ericsson","sector":"Technology","industry":"Telecom","country":"SE","exchange":"OMXS","currency":"SEK"},
-        {"ticker":"VOLV-B.ST","name":"Volvo AB","sector":"Industrials","industry":"Trucks","country":"SE","exchange":"OMXS","currency":"SEK"},
-
-        # ── APAC ──────────────────────────────────────────────
-        {"ticker":"7203.T","name":"Toyota Motor","sector":"Consumer","industry":"Auto","country":"JP","exchange":"TSE","currency":"JPY"},
-        {"ticker":"6758.T","name":"Sony Group","sector":"Technology","industry":"Electronics","country":"JP","exchange":"TSE","currency":"JPY"},
-        {"ticker":"9984.T","name":"SoftBank Group","sector":"Finance","industry":"Investment","country":"JP","exchange":"TSE","currency":"JPY"},
-        {"ticker":"7974.T","name":"Nintendo","sector":"Consumer","industry":"Gaming","country":"JP","exchange":"TSE","currency":"JPY"},
-        {"ticker":"6861.T","name":"Keyence","sector":"Technology","industry":"Automation","country":"JP","exchange":"TSE","currency":"JPY"},
-        {"ticker":"8306.T","name":"Mitsubishi UFJ","sector":"Finance","industry":"Banking","country":"JP","exchange":"TSE","currency":"JPY"},
-        {"ticker":"BHP.AX","name":"BHP Group ASX","sector":"Materials","industry":"Mining","country":"AU","exchange":"ASX","currency":"AUD"},
-        {"ticker":"CBA.AX","name":"Commonwealth Bank","sector":"Finance","industry":"Banking","country":"AU","exchange":"ASX","currency":"AUD"},
-        {"ticker":"CSL.AX","name":"CSL Limited","sector":"Healthcare","industry":"Biotech","country":"AU","exchange":"ASX","currency":"AUD"},
-        {"ticker":"RIO.AX","name":"Rio Tinto ASX","sector":"Materials","industry":"Mining","country":"AU","exchange":"ASX","currency":"AUD"},
-        {"ticker":"WBC.AX","name":"Westpac Banking","sector":"Finance","industry":"Banking","country":"AU","exchange":"ASX","currency":"AUD"},
-        {"ticker":"005930.KS","name":"Samsung Electronics","sector":"Technology","industry":"Semiconductors","country":"KR","exchange":"KRX","currency":"KRW"},
-        {"ticker":"BABA","name":"Alibaba Group","sector":"Technology","industry":"E-Commerce","country":"CN"},
-        {"ticker":"JD","name":"JD.com","sector":"Technology","industry":"E-Commerce","country":"CN"},
-        {"ticker":"PDD","name":"PDD Holdings","sector":"Technology","industry":"E-Commerce","country":"CN"},
-        {"ticker":"BIDU","name":"Baidu","sector":"Technology","industry":"Search","country":"CN"},
-        {"ticker":"TCEHY","name":"Tencent Holdings","sector":"Technology","industry":"Social Media","country":"CN"},
-        {"ticker":"NTES","name":"NetEase","sector":"Technology","industry":"Gaming","country":"CN"},
-
-        # ── S&P 500 GAP FILLS ─────────────────────────────────
-        {"ticker":"GOOG","name":"Alphabet Class C","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"BRK-B","name":"Berkshire Hathaway B","sector":"Finance","industry":"Conglomerate","country":"US"},
-        {"ticker":"LIN","name":"Linde plc","sector":"Materials","industry":"Chemicals","country":"US"},
-        {"ticker":"PG","name":"Procter & Gamble","sector":"Consumer","industry":"FMCG","country":"US"},
-        {"ticker":"KO","name":"Coca-Cola","sector":"Consumer","industry":"Beverages","country":"US"},
-        {"ticker":"PEP","name":"PepsiCo","sector":"Consumer","industry":"Beverages","country":"US"},
-        {"ticker":"PM","name":"Philip Morris","sector":"Consumer","industry":"Tobacco","country":"US"},
-        {"ticker":"MO","name":"Altria Group","sector":"Consumer","industry":"Tobacco","country":"US"},
-        {"ticker":"CL","name":"Colgate-Palmolive","sector":"Consumer","industry":"FMCG","country":"US"},
-        {"ticker":"GIS","name":"General Mills","sector":"Consumer","industry":"Food","country":"US"},
-        {"ticker":"MDLZ","name":"Mondelez International","sector":"Consumer","industry":"Food","country":"US"},
-        {"ticker":"HSY","name":"Hershey Company","sector":"Consumer","industry":"Food","country":"US"},
-        {"ticker":"STZ","name":"Constellation Brands","sector":"Consumer","industry":"Beverages","country":"US"},
-        {"ticker":"HD","name":"Home Depot","sector":"Consumer","industry":"Home Improvement","country":"US"},
-        {"ticker":"LOW","name":"Lowes Companies","sector":"Consumer","industry":"Home Improvement","country":"US"},
-        {"ticker":"TJX","name":"TJX Companies","sector":"Consumer","industry":"Retail","country":"US"},
-        {"ticker":"EBAY","name":"eBay","sector":"Consumer","industry":"E-Commerce","country":"US"},
-        {"ticker":"ETSY","name":"Etsy","sector":"Consumer","industry":"E-Commerce","country":"US"},
-        {"ticker":"DASH","name":"DoorDash","sector":"Consumer","industry":"Delivery","country":"US"},
-        {"ticker":"YUM","name":"Yum Brands","sector":"Consumer","industry":"Restaurants","country":"US"},
-        {"ticker":"DPZ","name":"Dominos Pizza","sector":"Consumer","industry":"Restaurants","country":"US"},
-        {"ticker":"MAR","name":"Marriott International","sector":"Consumer","industry":"Hotels","country":"US"},
-        {"ticker":"HLT","name":"Hilton Worldwide","sector":"Consumer","industry":"Hotels","country":"US"},
-        {"ticker":"CCL","name":"Carnival Corporation","sector":"Consumer","industry":"Cruise","country":"US"},
-        {"ticker":"RCL","name":"Royal Caribbean","sector":"Consumer","industry":"Cruise","country":"US"},
-        {"ticker":"UAL","name":"United Airlines","sector":"Consumer","industry":"Airlines","country":"US"},
-        {"ticker":"DAL","name":"Delta Air Lines","sector":"Consumer","industry":"Airlines","country":"US"},
-        {"ticker":"AAL","name":"American Airlines","sector":"Consumer","industry":"Airlines","country":"US"},
-        {"ticker":"LUV","name":"Southwest Airlines","sector":"Consumer","industry":"Airlines","country":"US"},
-        {"ticker":"WBA","name":"Walgreens Boots","sector":"Healthcare","industry":"Pharmacy","country":"US"},
-        {"ticker":"CI","name":"Cigna Group","sector":"Healthcare","industry":"Health Insurance","country":"US"},
-        {"ticker":"ELV","name":"Elevance Health","sector":"Healthcare","industry":"Health Insurance","country":"US"},
-        {"ticker":"HUM","name":"Humana","sector":"Healthcare","industry":"Health Insurance","country":"US"},
-        {"ticker":"TMO","name":"Thermo Fisher","sector":"Healthcare","industry":"Lab Equipment","country":"US"},
-        {"ticker":"DHR","name":"Danaher","sector":"Healthcare","industry":"Lab Equipment","country":"US"},
-        {"ticker":"BSX","name":"Boston Scientific","sector":"Healthcare","industry":"MedTech","country":"US"},
-        {"ticker":"ILMN","name":"Illumina","sector":"Healthcare","industry":"Genomics","country":"US"},
-        {"ticker":"ALNY","name":"Alnylam Pharmaceuticals","sector":"Healthcare","industry":"Biotech","country":"US"},
-        {"ticker":"INCY","name":"Incyte Corporation","sector":"Healthcare","industry":"Biotech","country":"US"},
-        {"ticker":"BMRN","name":"BioMarin Pharmaceutical","sector":"Healthcare","industry":"Rare Disease","country":"US"},
-        {"ticker":"USB","name":"US Bancorp","sector":"Finance","industry":"Banking","country":"US"},
-        {"ticker":"PNC","name":"PNC Financial","sector":"Finance","industry":"Banking","country":"US"},
-        {"ticker":"TFC","name":"Truist Financial","sector":"Finance","industry":"Banking","country":"US"},
-        {"ticker":"COF","name":"Capital One","sector":"Finance","industry":"Banking","country":"US"},
-        {"ticker":"ICE","name":"Intercontinental Exchange","sector":"Finance","industry":"Exchange","country":"US"},
-        {"ticker":"CME","name":"CME Group","sector":"Finance","industry":"Exchange","country":"US"},
-        {"ticker":"MSCI","name":"MSCI Inc","sector":"Finance","industry":"Data & Analytics","country":"US"},
-        {"ticker":"SPGI","name":"SP Global","sector":"Finance","industry":"Data & Analytics","country":"US"},
-        {"ticker":"MCO","name":"Moodys Corporation","sector":"Finance","industry":"Data & Analytics","country":"US"},
-        {"ticker":"MMC","name":"Marsh McLennan","sector":"Finance","industry":"Insurance Broker","country":"US"},
-        {"ticker":"AON","name":"Aon plc","sector":"Finance","industry":"Insurance Broker","country":"GB"},
-        {"ticker":"MET","name":"MetLife","sector":"Finance","industry":"Insurance","country":"US"},
-        {"ticker":"AFL","name":"Aflac","sector":"Finance","industry":"Insurance","country":"US"},
-        {"ticker":"PGR","name":"Progressive Corporation","sector":"Finance","industry":"Insurance","country":"US"},
-        {"ticker":"CB","name":"Chubb Limited","sector":"Finance","industry":"Insurance","country":"CH"},
-        {"ticker":"TROW","name":"T Rowe Price","sector":"Finance","industry":"Asset Management","country":"US"},
-        {"ticker":"BLK","name":"BlackRock","sector":"Finance","industry":"Asset Management","country":"US"},
-        {"ticker":"LHX","name":"L3Harris Technologies","sector":"Space","industry":"Defence","country":"US"},
-        {"ticker":"TDG","name":"TransDigm Group","sector":"Industrials","industry":"Aerospace","country":"US"},
-        {"ticker":"ETN","name":"Eaton Corporation","sector":"Industrials","industry":"Power Mgmt","country":"IE"},
-        {"ticker":"EMR","name":"Emerson Electric","sector":"Industrials","industry":"Automation","country":"US"},
-        {"ticker":"ROK","name":"Rockwell Automation","sector":"Industrials","industry":"Automation","country":"US"},
-        {"ticker":"ITW","name":"Illinois Tool Works","sector":"Industrials","industry":"Diversified","country":"US"},
-        {"ticker":"PH","name":"Parker Hannifin","sector":"Industrials","industry":"Motion Control","country":"US"},
-        {"ticker":"GWW","name":"WW Grainger","sector":"Industrials","industry":"Distribution","country":"US"},
-        {"ticker":"FAST","name":"Fastenal","sector":"Industrials","industry":"Distribution","country":"US"},
-        {"ticker":"CAT","name":"Caterpillar","sector":"Industrials","industry":"Machinery","country":"US"},
-        {"ticker":"HON","name":"Honeywell","sector":"Industrials","industry":"Diversified","country":"US"},
-        {"ticker":"GE","name":"GE Aerospace","sector":"Industrials","industry":"Aerospace","country":"US"},
-        {"ticker":"UPS","name":"UPS","sector":"Industrials","industry":"Logistics","country":"US"},
-        {"ticker":"FDX","name":"FedEx","sector":"Industrials","industry":"Logistics","country":"US"},
-        {"ticker":"CSCO","name":"Cisco Systems","sector":"Technology","industry":"Networking","country":"US"},
-        {"ticker":"ANET","name":"Arista Networks","sector":"Technology","industry":"Networking","country":"US"},
-        {"ticker":"HPE","name":"Hewlett Packard Enterprise","sector":"Technology","industry":"Servers","country":"US"},
-        {"ticker":"DELL","name":"Dell Technologies","sector":"Technology","industry":"PCs","country":"US"},
-        {"ticker":"STX","name":"Seagate Technology","sector":"Technology","industry":"Storage","country":"IE"},
-        {"ticker":"WDC","name":"Western Digital","sector":"Technology","industry":"Storage","country":"US"},
-        {"ticker":"VRSK","name":"Verisk Analytics","sector":"Technology","industry":"Data & Analytics","country":"US"},
-
-        # ── MORE CRYPTO (top 50) ──────────────────────────────
-        {"ticker":"ADA-USD","name":"Cardano","sector":"Crypto","industry":"Layer 1","country":"US"},
-        {"ticker":"AVAX-USD","name":"Avalanche","sector":"Crypto","industry":"Layer 1","country":"US"},
-        {"ticker":"DOT-USD","name":"Polkadot","sector":"Crypto","industry":"Layer 0","country":"US"},
-        {"ticker":"MATIC-USD","name":"Polygon","sector":"Crypto","industry":"Layer 2","country":"US"},
-        {"ticker":"LINK-USD","name":"Chainlink","sector":"Crypto","industry":"Oracle","country":"US"},
-        {"ticker":"UNI-USD","name":"Uniswap","sector":"Crypto","industry":"DEX","country":"US"},
-        {"ticker":"LTC-USD","name":"Litecoin","sector":"Crypto","industry":"Payments","country":"US"},
-        {"ticker":"BCH-USD","name":"Bitcoin Cash","sector":"Crypto","industry":"Payments","country":"US"},
-        {"ticker":"ATOM-USD","name":"Cosmos","sector":"Crypto","industry":"Interoperability","country":"US"},
-        {"ticker":"NEAR-USD","name":"NEAR Protocol","sector":"Crypto","industry":"Layer 1","country":"US"},
-        {"ticker":"APT-USD","name":"Aptos","sector":"Crypto","industry":"Layer 1","country":"US"},
-        {"ticker":"ARB-USD","name":"Arbitrum","sector":"Crypto","industry":"Layer 2","country":"US"},
-        {"ticker":"OP-USD","name":"Optimism","sector":"Crypto","industry":"Layer 2","country":"US"},
-        {"ticker":"SUI-USD","name":"Sui","sector":"Crypto","industry":"Layer 1","country":"US"},
-        {"ticker":"INJ-USD","name":"Injective","sector":"Crypto","industry":"DeFi","country":"US"},
-        {"ticker":"TON-USD","name":"Toncoin","sector":"Crypto","industry":"Layer 1","country":"US"},
-        {"ticker":"PEPE-USD","name":"Pepe","sector":"Crypto","industry":"Meme","country":"US"},
-        {"ticker":"WIF-USD","name":"dogwifhat","sector":"Crypto","industry":"Meme","country":"US"},
-        {"ticker":"FTM-USD","name":"Fantom","sector":"Crypto","industry":"Layer 1","country":"US"},
-        {"ticker":"AAVE-USD","name":"Aave","sector":"Crypto","industry":"DeFi","country":"US"},
-        {"ticker":"MKR-USD","name":"Maker","sector":"Crypto","industry":"DeFi","country":"US"},
-
-        # ── EXTENDED FOREX ────────────────────────────────────
-        {"ticker":"AUDUSD=X","name":"AUD/USD","sector":"Forex","industry":"Major Pair","country":"US"},
-        {"ticker":"NZDUSD=X","name":"NZD/USD","sector":"Forex","industry":"Major Pair","country":"US"},
-        {"ticker":"USDCHF=X","name":"USD/CHF","sector":"Forex","industry":"Major Pair","country":"US"},
-        {"ticker":"EURGBP=X","name":"EUR/GBP","sector":"Forex","industry":"Cross Pair","country":"US"},
-        {"ticker":"EURJPY=X","name":"EUR/JPY","sector":"Forex","industry":"Cross Pair","country":"US"},
-        {"ticker":"GBPJPY=X","name":"GBP/JPY","sector":"Forex","industry":"Cross Pair","country":"US"},
-        {"ticker":"EURCHF=X","name":"EUR/CHF","sector":"Forex","industry":"Cross Pair","country":"US"},
-        {"ticker":"USDINR=X","name":"USD/INR","sector":"Forex","industry":"EM Pair","country":"US"},
-        {"ticker":"USDCNH=X","name":"USD/CNH","sector":"Forex","industry":"EM Pair","country":"US"},
-        {"ticker":"USDBRL=X","name":"USD/BRL","sector":"Forex","industry":"EM Pair","country":"US"},
-        {"ticker":"USDMXN=X","name":"USD/MXN","sector":"Forex","industry":"EM Pair","country":"US"},
-        {"ticker":"USDZAR=X","name":"USD/ZAR","sector":"Forex","industry":"EM Pair","country":"US"},
-        {"ticker":"USDTRY=X","name":"USD/TRY","sector":"Forex","industry":"EM Pair","country":"US"},
-        {"ticker":"USDSGD=X","name":"USD/SGD","sector":"Forex","industry":"EM Pair","country":"US"},
-
-        # ── COMMODITIES FUTURES ───────────────────────────────
-        {"ticker":"GC=F","name":"Gold Futures","sector":"Commodities","industry":"Precious Metals","country":"US"},
-        {"ticker":"SI=F","name":"Silver Futures","sector":"Commodities","industry":"Precious Metals","country":"US"},
-        {"ticker":"CL=F","name":"Crude Oil WTI","sector":"Commodities","industry":"Energy","country":"US"},
-        {"ticker":"BZ=F","name":"Brent Crude Oil","sector":"Commodities","industry":"Energy","country":"US"},
-        {"ticker":"NG=F","name":"Natural Gas","sector":"Commodities","industry":"Energy","country":"US"},
-        {"ticker":"HG=F","name":"Copper Futures","sector":"Commodities","industry":"Industrial Metals","country":"US"},
-        {"ticker":"ZW=F","name":"Wheat Futures","sector":"Commodities","industry":"Grains","country":"US"},
-        {"ticker":"ZC=F","name":"Corn Futures","sector":"Commodities","industry":"Grains","country":"US"},
-        {"ticker":"ZS=F","name":"Soybean Futures","sector":"Commodities","industry":"Grains","country":"US"},
-
-        # ── SECTOR ETFs & INDEX ETFs ───────────────────────────
-        {"ticker":"GLD","name":"SPDR Gold ETF","sector":"ETF","industry":"Gold","country":"US"},
-        {"ticker":"SLV","name":"iShares Silver ETF","sector":"ETF","industry":"Silver","country":"US"},
-        {"ticker":"GDX","name":"VanEck Gold Miners ETF","sector":"ETF","industry":"Gold Miners","country":"US"},
-        {"ticker":"GDXJ","name":"Junior Gold Miners ETF","sector":"ETF","industry":"Gold Miners","country":"US"},
-        {"ticker":"USO","name":"US Oil Fund","sector":"ETF","industry":"Oil","country":"US"},
-        {"ticker":"UNG","name":"US Natural Gas Fund","sector":"ETF","industry":"Gas","country":"US"},
-        {"ticker":"COPX","name":"Copper Miners ETF","sector":"ETF","industry":"Copper","country":"US"},
-        {"ticker":"LIT","name":"Lithium & Battery Tech ETF","sector":"ETF","industry":"Lithium","country":"US"},
-        {"ticker":"URA","name":"Uranium ETF","sector":"ETF","industry":"Uranium","country":"US"},
-        {"ticker":"TAN","name":"Solar ETF","sector":"ETF","industry":"Solar","country":"US"},
-        {"ticker":"ICLN","name":"Clean Energy ETF","sector":"ETF","industry":"Clean Energy","country":"US"},
-        {"ticker":"ARKK","name":"ARK Innovation ETF","sector":"ETF","industry":"Thematic","country":"US"},
-        {"ticker":"ARKG","name":"ARK Genomics ETF","sector":"ETF","industry":"Genomics","country":"US"},
-        {"ticker":"BOTZ","name":"Global Robotics & AI ETF","sector":"ETF","industry":"Robotics","country":"US"},
-        {"ticker":"CIBR","name":"Cybersecurity ETF","sector":"ETF","industry":"Cybersecurity","country":"US"},
-        {"ticker":"AIQ","name":"AI & Technology ETF","sector":"ETF","industry":"AI","country":"US"},
-        {"ticker":"UFO","name":"Space ETF","sector":"ETF","industry":"Space","country":"US"},
-        {"ticker":"XLK","name":"Technology SPDR","sector":"ETF","industry":"Technology","country":"US"},
-        {"ticker":"XLF","name":"Financial SPDR","sector":"ETF","industry":"Finance","country":"US"},
-        {"ticker":"XLV","name":"Health Care SPDR","sector":"ETF","industry":"Healthcare","country":"US"},
-        {"ticker":"XLE","name":"Energy SPDR","sector":"ETF","industry":"Energy","country":"US"},
-        {"ticker":"XLI","name":"Industrial SPDR","sector":"ETF","industry":"Industrials","country":"US"},
-        {"ticker":"XLB","name":"Materials SPDR","sector":"ETF","industry":"Materials","country":"US"},
-        {"ticker":"SPY","name":"SPDR S&P 500 ETF","sector":"ETF","industry":"Index","country":"US"},
-        {"ticker":"QQQ","name":"Invesco NASDAQ 100 ETF","sector":"ETF","industry":"Index","country":"US"},
-        {"ticker":"IWM","name":"iShares Russell 2000 ETF","sector":"ETF","industry":"Index","country":"US"},
-        {"ticker":"DIA","name":"SPDR Dow Jones ETF","sector":"ETF","industry":"Index","country":"US"},
-        {"ticker":"EWU","name":"iShares MSCI UK ETF","sector":"ETF","industry":"Index","country":"US"},
-        {"ticker":"EWG","name":"iShares MSCI Germany ETF","sector":"ETF","industry":"Index","country":"US"},
-        {"ticker":"EWJ","name":"iShares MSCI Japan ETF","sector":"ETF","industry":"Index","country":"US"},
-        {"ticker":"EEM","name":"iShares MSCI EM ETF","sector":"ETF","industry":"Index","country":"US"},
-        {"ticker":"TLT","name":"iShares 20yr Treasury ETF","sector":"ETF","industry":"Bonds","country":"US"},
-        {"ticker":"HYG","name":"High Yield Bond ETF","sector":"ETF","industry":"Bonds","country":"US"},
-
-        # ── METALS & MINING ADDITIONS ─────────────────────────
-        {"ticker":"GFI","name":"Gold Fields","sector":"Materials","industry":"Gold Mining","country":"ZA"},
-        {"ticker":"AEM","name":"Agnico Eagle Mines","sector":"Materials","industry":"Gold Mining","country":"CA"},
-        {"ticker":"NEM","name":"Newmont Corporation","sector":"Materials","industry":"Gold Mining","country":"US"},
-        {"ticker":"KGC","name":"Kinross Gold","sector":"Materials","industry":"Gold Mining","country":"CA"},
-        {"ticker":"GOLD","name":"Barrick Gold","sector":"Materials","industry":"Gold Mining","country":"CA"},
-        {"ticker":"WPM","name":"Wheaton Precious Metals","sector":"Materials","industry":"Royalties","country":"CA"},
-        {"ticker":"FNV","name":"Franco-Nevada","sector":"Materials","industry":"Royalties","country":"CA"},
-        {"ticker":"PAAS","name":"Pan American Silver","sector":"Materials","industry":"Silver Mining","country":"CA"},
-        {"ticker":"SCCO","name":"Southern Copper","sector":"Materials","industry":"Copper","country":"US"},
-        {"ticker":"TECK","name":"Teck Resources","sector":"Materials","industry":"Diversified Mining","country":"CA"},
-        {"ticker":"STLD","name":"Steel Dynamics","sector":"Materials","industry":"Steel","country":"US"},
-        {"ticker":"ATI","name":"ATI Inc","sector":"Materials","industry":"Specialty Metals","country":"US"},
-        {"ticker":"MP","name":"MP Materials","sector":"Materials","industry":"Rare Earth","country":"US"},
-        {"ticker":"SQM","name":"Sociedad Quimica","sector":"Materials","industry":"Lithium","country":"CL"},
-        {"ticker":"PLL","name":"Piedmont Lithium","sector":"Materials","industry":"Lithium","country":"US"},
-        # ── S&P 500 ADDITIONS ─────────────────────────────────
-        {"ticker":"MMM","name":"3M","sector":"Industrials","industry":"Conglomerates","country":"US"},
-        {"ticker":"AOS","name":"A.O. Smith","sector":"Industrials","industry":"Water Heaters","country":"US"},
-        {"ticker":"ABT","name":"Abbott Laboratories","sector":"Healthcare","industry":"Medical Devices","country":"US"},
-        {"ticker":"ABBV","name":"AbbVie","sector":"Healthcare","industry":"Pharma","country":"US"},
-        {"ticker":"ACN","name":"Accenture","sector":"Technology","industry":"IT Services","country":"US"},
-        {"ticker":"ADBE","name":"Adobe","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"AAP","name":"Advance Auto Parts","sector":"Consumer Cyclical","industry":"Auto Parts","country":"US"},
-        {"ticker":"AES","name":"AES Corporation","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"AFL","name":"Aflac","sector":"Financial","industry":"Insurance","country":"US"},
-        {"ticker":"A","name":"Agilent Technologies","sector":"Healthcare","industry":"Life Sciences","country":"US"},
-        {"ticker":"APD","name":"Air Products","sector":"Materials","industry":"Industrial Gases","country":"US"},
-        {"ticker":"AKAM","name":"Akamai Technologies","sector":"Technology","industry":"CDN","country":"US"},
-        {"ticker":"ALK","name":"Alaska Air","sector":"Industrials","industry":"Airlines","country":"US"},
-        {"ticker":"ALB","name":"Albemarle","sector":"Materials","industry":"Lithium","country":"US"},
-        {"ticker":"ARE","name":"Alexandria Real Estate","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"ALGN","name":"Align Technology","sector":"Healthcare","industry":"Medical Devices","country":"US"},
-        {"ticker":"ALLE","name":"Allegion","sector":"Industrials","industry":"Security","country":"US"},
-        {"ticker":"LNT","name":"Alliant Energy","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"ALL","name":"Allstate","sector":"Financial","industry":"Insurance","country":"US"},
-        {"ticker":"GOOGL","name":"Alphabet A","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"MO","name":"Altria Group","sector":"Consumer Staples","industry":"Tobacco","country":"US"},
-        {"ticker":"AMZN","name":"Amazon","sector":"Consumer Cyclical","industry":"E-Commerce","country":"US"},
-        {"ticker":"AMCR","name":"Amcor","sector":"Materials","industry":"Packaging","country":"AU"},
-        {"ticker":"AEE","name":"Ameren","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"AAL","name":"American Airlines","sector":"Industrials","industry":"Airlines","country":"US"},
-        {"ticker":"AEP","name":"American Electric Power","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"AXP","name":"American Express","sector":"Financial","industry":"Credit Services","country":"US"},
-        {"ticker":"AIG","name":"American International Group","sector":"Financial","industry":"Insurance","country":"US"},
-        {"ticker":"AMT","name":"American Tower","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"AWK","name":"American Water Works","sector":"Utilities","industry":"Water","country":"US"},
-        {"ticker":"AMP","name":"Ameriprise Financial","sector":"Financial","industry":"Asset Management","country":"US"},
-        {"ticker":"AME","name":"AMETEK","sector":"Industrials","industry":"Electronic Instruments","country":"US"},
-        {"ticker":"AMGN","name":"Amgen","sector":"Healthcare","industry":"Biotech","country":"US"},
-        {"ticker":"APH","name":"Amphenol","sector":"Technology","industry":"Electronic Components","country":"US"},
-        {"ticker":"ADI","name":"Analog Devices","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"ANSS","name":"ANSYS","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"AON","name":"Aon","sector":"Financial","industry":"Insurance","country":"US"},
-        {"ticker":"APA","name":"APA Corporation","sector":"Energy","industry":"Oil & Gas E&P","country":"US"},
-        {"ticker":"AAPL","name":"Apple","sector":"Technology","industry":"Hardware","country":"US"},
-        {"ticker":"AMAT","name":"Applied Materials","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"APTV","name":"Aptiv","sector":"Consumer Cyclical","industry":"Auto Parts","country":"US"},
-        {"ticker":"ACGL","name":"Arch Capital Group","sector":"Financial","industry":"Insurance","country":"US"},
-        {"ticker":"ADM","name":"Archer-Daniels-Midland","sector":"Consumer Staples","industry":"Agricultural Products","country":"US"},
-        {"ticker":"ANET","name":"Arista Networks","sector":"Technology","industry":"Networking","country":"US"},
-        {"ticker":"AJG","name":"Arthur J. Gallagher","sector":"Financial","industry":"Insurance","country":"US"},
-        {"ticker":"AIZ","name":"Assurant","sector":"Financial","industry":"Insurance","country":"US"},
-        {"ticker":"T","name":"AT&T","sector":"Communication","industry":"Telecom","country":"US"},
-        {"ticker":"ATO","name":"Atmos Energy","sector":"Utilities","industry":"Gas Utilities","country":"US"},
-        {"ticker":"ADSK","name":"Autodesk","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"ADP","name":"Automatic Data Processing","sector":"Technology","industry":"IT Services","country":"US"},
-        {"ticker":"AZO","name":"AutoZone","sector":"Consumer Cyclical","industry":"Auto Parts","country":"US"},
-        {"ticker":"AVB","name":"AvalonBay Communities","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"AVY","name":"Avery Dennison","sector":"Materials","industry":"Packaging","country":"US"},
-        {"ticker":"AXON","name":"Axon Enterprise","sector":"Industrials","industry":"Security","country":"US"},
-        {"ticker":"BKR","name":"Baker Hughes","sector":"Energy","industry":"Oilfield Services","country":"US"},
-        {"ticker":"BALL","name":"Ball Corporation","sector":"Materials","industry":"Packaging","country":"US"},
-        {"ticker":"BAC","name":"Bank of America","sector":"Financial","industry":"Banks","country":"US"},
-        {"ticker":"BK","name":"Bank of New York Mellon","sector":"Financial","industry":"Asset Management","country":"US"},
-        {"ticker":"BBWI","name":"Bath & Body Works","sector":"Consumer Cyclical","industry":"Retail","country":"US"},
-        {"ticker":"BAX","name":"Baxter International","sector":"Healthcare","industry":"Medical Devices","country":"US"},
-        {"ticker":"BDX","name":"Becton Dickinson","sector":"Healthcare","industry":"Medical Devices","country":"US"},
-        {"ticker":"BRK-B","name":"Berkshire Hathaway B","sector":"Financial","industry":"Conglomerates","country":"US"},
-        {"ticker":"BBY","name":"Best Buy","sector":"Consumer Cyclical","industry":"Electronics Retail","country":"US"},
-        {"ticker":"BIO","name":"Bio-Rad Laboratories","sector":"Healthcare","industry":"Life Sciences","country":"US"},
-        {"ticker":"TECH","name":"Bio-Techne","sector":"Healthcare","industry":"Life Sciences","country":"US"},
-        {"ticker":"BIIB","name":"Biogen","sector":"Healthcare","industry":"Biotech","country":"US"},
-        {"ticker":"BLK","name":"BlackRock","sector":"Financial","industry":"Asset Management","country":"US"},
-        {"ticker":"BX","name":"Blackstone","sector":"Financial","industry":"Asset Management","country":"US"},
-        {"ticker":"BA","name":"Boeing","sector":"Industrials","industry":"Aerospace","country":"US"},
-        {"ticker":"BKNG","name":"Booking Holdings","sector":"Consumer Cyclical","industry":"Travel","country":"US"},
-        {"ticker":"BWA","name":"BorgWarner","sector":"Consumer Cyclical","industry":"Auto Parts","country":"US"},
-        {"ticker":"BSX","name":"Boston Scientific","sector":"Healthcare","industry":"Medical Devices","country":"US"},
-        {"ticker":"BMY","name":"Bristol-Myers Squibb","sector":"Healthcare","industry":"Pharma","country":"US"},
-        {"ticker":"AVGO","name":"Broadcom","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"BR","name":"Broadridge Financial","sector":"Technology","industry":"IT Services","country":"US"},
-        {"ticker":"BF-B","name":"Brown-Forman B","sector":"Consumer Staples","industry":"Beverages","country":"US"},
-        {"ticker":"BLDR","name":"Builders FirstSource","sector":"Industrials","industry":"Building Materials","country":"US"},
-        {"ticker":"BG","name":"Bunge Global","sector":"Consumer Staples","industry":"Agricultural Products","country":"US"},
-        {"ticker":"CDNS","name":"Cadence Design Systems","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"CZR","name":"Caesars Entertainment","sector":"Consumer Cyclical","industry":"Gaming","country":"US"},
-        {"ticker":"CPT","name":"Camden Property Trust","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"CPB","name":"Campbell Soup","sector":"Consumer Staples","industry":"Food","country":"US"},
-        {"ticker":"COF","name":"Capital One Financial","sector":"Financial","industry":"Banks","country":"US"},
-        {"ticker":"CAH","name":"Cardinal Health","sector":"Healthcare","industry":"Distribution","country":"US"},
-        {"ticker":"KMX","name":"CarMax","sector":"Consumer Cyclical","industry":"Auto Retail","country":"US"},
-        {"ticker":"CCL","name":"Carnival","sector":"Consumer Cyclical","industry":"Travel","country":"US"},
-        {"ticker":"CARR","name":"Carrier Global","sector":"Industrials","industry":"HVAC","country":"US"},
-        {"ticker":"CTLT","name":"Catalent","sector":"Healthcare","industry":"Pharma","country":"US"},
-        {"ticker":"CAT","name":"Caterpillar","sector":"Industrials","industry":"Construction Machinery","country":"US"},
-        {"ticker":"CBOE","name":"Cboe Global Markets","sector":"Financial","industry":"Financial Exchanges","country":"US"},
-        {"ticker":"CBRE","name":"CBRE Group","sector":"Real Estate","industry":"Real Estate Services","country":"US"},
-        {"ticker":"CDW","name":"CDW Corporation","sector":"Technology","industry":"IT Services","country":"US"},
-        {"ticker":"CE","name":"Celanese","sector":"Materials","industry":"Chemicals","country":"US"},
-        {"ticker":"COR","name":"Cencora","sector":"Healthcare","industry":"Distribution","country":"US"},
-        {"ticker":"CNC","name":"Centene","sector":"Healthcare","industry":"Managed Care","country":"US"},
-        {"ticker":"CNP","name":"CenterPoint Energy","sector":"Utilities","industry":"Gas Utilities","country":"US"},
-        {"ticker":"CF","name":"CF Industries","sector":"Materials","industry":"Fertilizers","country":"US"},
-        {"ticker":"CRL","name":"Charles River Laboratories","sector":"Healthcare","industry":"Life Sciences","country":"US"},
-        {"ticker":"SCHW","name":"Charles Schwab","sector":"Financial","industry":"Brokers","country":"US"},
-        {"ticker":"CHTR","name":"Charter Communications","sector":"Communication","industry":"Cable","country":"US"},
-        {"ticker":"CVX","name":"Chevron","sector":"Energy","industry":"Oil & Gas Integrated","country":"US"},
-        {"ticker":"CMG","name":"Chipotle Mexican Grill","sector":"Consumer Cyclical","industry":"Restaurants","country":"US"},
-        {"ticker":"CB","name":"Chubb","sector":"Financial","industry":"Insurance","country":"US"},
-        {"ticker":"CI","name":"Cigna Group","sector":"Healthcare","industry":"Managed Care","country":"US"},
-        {"ticker":"CINf","name":"Cincinnati Financial","sector":"Financial","industry":"Insurance","country":"US"},
-        {"ticker":"CINTAS","name":"Cintas","sector":"Industrials","industry":"Business Services","country":"US"},
-        {"ticker":"CTAS","name":"Cintas","sector":"Industrials","industry":"Business Services","country":"US"},
-        {"ticker":"CSCO","name":"Cisco Systems","sector":"Technology","industry":"Networking","country":"US"},
-        {"ticker":"C","name":"Citigroup","sector":"Financial","industry":"Banks","country":"US"},
-        {"ticker":"CFG","name":"Citizens Financial Group","sector":"Financial","industry":"Banks","country":"US"},
-        {"ticker":"CLX","name":"Clorox","sector":"Consumer Staples","industry":"Household Products","country":"US"},
-        {"ticker":"CME","name":"CME Group","sector":"Financial","industry":"Financial Exchanges","country":"US"},
-        {"ticker":"CMS","name":"CMS Energy","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"KO","name":"Coca-Cola","sector":"Consumer Staples","industry":"Beverages","country":"US"},
-        {"ticker":"CTSH","name":"Cognizant Technology","sector":"Technology","industry":"IT Services","country":"US"},
-        {"ticker":"CL","name":"Colgate-Palmolive","sector":"Consumer Staples","industry":"Household Products","country":"US"},
-        {"ticker":"CMCSA","name":"Comcast","sector":"Communication","industry":"Cable","country":"US"},
-        {"ticker":"CMA","name":"Comerica","sector":"Financial","industry":"Banks","country":"US"},
-        {"ticker":"CAG","name":"Conagra Brands","sector":"Consumer Staples","industry":"Food","country":"US"},
-        {"ticker":"COP","name":"ConocoPhillips","sector":"Energy","industry":"Oil & Gas E&P","country":"US"},
-        {"ticker":"ED","name":"Consolidated Edison","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"STZ","name":"Constellation Brands","sector":"Consumer Staples","industry":"Beverages","country":"US"},
-        {"ticker":"CEG","name":"Constellation Energy","sector":"Utilities","industry":"Nuclear","country":"US"},
-        {"ticker":"COO","name":"Cooper Companies","sector":"Healthcare","industry":"Medical Devices","country":"US"},
-        {"ticker":"CPRT","name":"Copart","sector":"Consumer Cyclical","industry":"Auto Services","country":"US"},
-        {"ticker":"GLW","name":"Corning","sector":"Technology","industry":"Electronic Components","country":"US"},
-        {"ticker":"CPAY","name":"Corpay","sector":"Technology","industry":"Fintech","country":"US"},
-        {"ticker":"CTVA","name":"Corteva","sector":"Materials","industry":"Agricultural Chemicals","country":"US"},
-        {"ticker":"CSGP","name":"CoStar Group","sector":"Real Estate","industry":"Real Estate Services","country":"US"},
-        {"ticker":"COST","name":"Costco Wholesale","sector":"Consumer Staples","industry":"Retail","country":"US"},
-        {"ticker":"CTRA","name":"Coterra Energy","sector":"Energy","industry":"Oil & Gas E&P","country":"US"},
-        {"ticker":"CRWD","name":"CrowdStrike","sector":"Technology","industry":"Cybersecurity","country":"US"},
-        {"ticker":"CCI","name":"Crown Castle","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"CSX","name":"CSX","sector":"Industrials","industry":"Railroads","country":"US"},
-        {"ticker":"CMI","name":"Cummins","sector":"Industrials","industry":"Industrial Machinery","country":"US"},
-        {"ticker":"CVS","name":"CVS Health","sector":"Healthcare","industry":"Pharmacy","country":"US"},
-        {"ticker":"DHR","name":"Danaher","sector":"Healthcare","industry":"Life Sciences","country":"US"},
-        {"ticker":"DRI","name":"Darden Restaurants","sector":"Consumer Cyclical","industry":"Restaurants","country":"US"},
-        {"ticker":"DVA","name":"DaVita","sector":"Healthcare","industry":"Medical Services","country":"US"},
-        {"ticker":"DAY","name":"Dayforce","sector":"Technology","industry":"HR Software","country":"US"},
-        {"ticker":"DECK","name":"Deckers Outdoor","sector":"Consumer Cyclical","industry":"Footwear","country":"US"},
-        {"ticker":"DE","name":"Deere & Company","sector":"Industrials","industry":"Agricultural Machinery","country":"US"},
-        {"ticker":"DAL","name":"Delta Air Lines","sector":"Industrials","industry":"Airlines","country":"US"},
-        {"ticker":"DVN","name":"Devon Energy","sector":"Energy","industry":"Oil & Gas E&P","country":"US"},
-        {"ticker":"DXCM","name":"DexCom","sector":"Healthcare","industry":"Medical Devices","country":"US"},
-        {"ticker":"FANG","name":"Diamondback Energy","sector":"Energy","industry":"Oil & Gas E&P","country":"US"},
-        {"ticker":"DLR","name":"Digital Realty Trust","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"DFS","name":"Discover Financial Services","sector":"Financial","industry":"Credit Services","country":"US"},
-        {"ticker":"DG","name":"Dollar General","sector":"Consumer Staples","industry":"Retail","country":"US"},
-        {"ticker":"DLTR","name":"Dollar Tree","sector":"Consumer Staples","industry":"Retail","country":"US"},
-        {"ticker":"D","name":"Dominion Energy","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"DPZ","name":"Domino's Pizza","sector":"Consumer Cyclical","industry":"Restaurants","country":"US"},
-        {"ticker":"DOV","name":"Dover","sector":"Industrials","industry":"Industrial Machinery","country":"US"},
-        {"ticker":"DHI","name":"D.R. Horton","sector":"Consumer Cyclical","industry":"Homebuilding","country":"US"},
-        {"ticker":"DTE","name":"DTE Energy","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"DUK","name":"Duke Energy","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"DD","name":"DuPont","sector":"Materials","industry":"Specialty Chemicals","country":"US"},
-        {"ticker":"EMN","name":"Eastman Chemical","sector":"Materials","industry":"Chemicals","country":"US"},
-        {"ticker":"ETN","name":"Eaton","sector":"Industrials","industry":"Electrical Equipment","country":"US"},
-        {"ticker":"EBAY","name":"eBay","sector":"Consumer Cyclical","industry":"E-Commerce","country":"US"},
-        {"ticker":"ECL","name":"Ecolab","sector":"Materials","industry":"Specialty Chemicals","country":"US"},
-        {"ticker":"EIX","name":"Edison International","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"EW","name":"Edwards Lifesciences","sector":"Healthcare","industry":"Medical Devices","country":"US"},
-        {"ticker":"EA","name":"Electronic Arts","sector":"Communication","industry":"Gaming","country":"US"},
-        {"ticker":"ELV","name":"Elevance Health","sector":"Healthcare","industry":"Managed Care","country":"US"},
-        {"ticker":"EMR","name":"Emerson Electric","sector":"Industrials","industry":"Industrial Automation","country":"US"},
-        {"ticker":"ENPH","name":"Enphase Energy","sector":"Technology","industry":"Solar","country":"US"},
-        {"ticker":"ETR","name":"Entergy","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"EOG","name":"EOG Resources","sector":"Energy","industry":"Oil & Gas E&P","country":"US"},
-        {"ticker":"EPAM","name":"EPAM Systems","sector":"Technology","industry":"IT Services","country":"US"},
-        {"ticker":"EQT","name":"EQT Corporation","sector":"Energy","industry":"Oil & Gas E&P","country":"US"},
-        {"ticker":"EFX","name":"Equifax","sector":"Industrials","industry":"Business Services","country":"US"},
-        {"ticker":"EQIX","name":"Equinix","sector":"Real Estate","industry":"Data Centers","country":"US"},
-        {"ticker":"EQR","name":"Equity Residential","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"ESS","name":"Essex Property Trust","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"EL","name":"Estee Lauder","sector":"Consumer Staples","industry":"Cosmetics","country":"US"},
-        {"ticker":"ETSY","name":"Etsy","sector":"Consumer Cyclical","industry":"E-Commerce","country":"US"},
-        {"ticker":"EG","name":"Everest Group","sector":"Financial","industry":"Insurance","country":"US"},
-        {"ticker":"EVRG","name":"Evergy","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"ES","name":"Eversource Energy","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"EXC","name":"Exelon","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"EXPE","name":"Expedia Group","sector":"Consumer Cyclical","industry":"Travel","country":"US"},
-        {"ticker":"EXPD","name":"Expeditors International","sector":"Industrials","industry":"Logistics","country":"US"},
-        {"ticker":"EXR","name":"Extra Space Storage","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"XOM","name":"ExxonMobil","sector":"Energy","industry":"Oil & Gas Integrated","country":"US"},
-        {"ticker":"FFIV","name":"F5","sector":"Technology","industry":"Networking","country":"US"},
-        {"ticker":"FDS","name":"FactSet Research","sector":"Financial","industry":"Financial Data","country":"US"},
-        {"ticker":"FICO","name":"Fair Isaac","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"FAST","name":"Fastenal","sector":"Industrials","industry":"Distribution","country":"US"},
-        {"ticker":"FRT","name":"Federal Realty Investment Trust","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"FDX","name":"FedEx","sector":"Industrials","industry":"Logistics","country":"US"},
-        {"ticker":"FIS","name":"Fidelity National Information Services","sector":"Technology","industry":"Fintech","country":"US"},
-        {"ticker":"FITB","name":"Fifth Third Bancorp","sector":"Financial","industry":"Banks","country":"US"},
-        {"ticker":"FSLR","name":"First Solar","sector":"Technology","industry":"Solar","country":"US"},
-        {"ticker":"FE","name":"FirstEnergy","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"FI","name":"Fiserv","sector":"Technology","industry":"Fintech","country":"US"},
-        {"ticker":"FMC","name":"FMC Corporation","sector":"Materials","industry":"Agricultural Chemicals","country":"US"},
-        {"ticker":"F","name":"Ford Motor","sector":"Consumer Cyclical","industry":"Automobiles","country":"US"},
-        {"ticker":"FTNT","name":"Fortinet","sector":"Technology","industry":"Cybersecurity","country":"US"},
-        {"ticker":"FTV","name":"Fortive","sector":"Industrials","industry":"Industrial Instruments","country":"US"},
-        {"ticker":"FOXA","name":"Fox Corporation A","sector":"Communication","industry":"Media","country":"US"},
-        {"ticker":"BEN","name":"Franklin Resources","sector":"Financial","industry":"Asset Management","country":"US"},
-        {"ticker":"FCX","name":"Freeport-McMoRan","sector":"Materials","industry":"Copper","country":"US"},
-        {"ticker":"GRMN","name":"Garmin","sector":"Technology","industry":"Consumer Electronics","country":"CH"},
-        {"ticker":"IT","name":"Gartner","sector":"Technology","industry":"IT Research","country":"US"},
-        {"ticker":"GE","name":"GE Aerospace","sector":"Industrials","industry":"Aerospace","country":"US"},
-        {"ticker":"GEHC","name":"GE HealthCare","sector":"Healthcare","industry":"Medical Devices","country":"US"},
-        {"ticker":"GEV","name":"GE Vernova","sector":"Industrials","industry":"Energy Equipment","country":"US"},
-        {"ticker":"GEN","name":"Gen Digital","sector":"Technology","industry":"Cybersecurity","country":"US"},
-        {"ticker":"GNRC","name":"Generac Holdings","sector":"Industrials","industry":"Electrical Equipment","country":"US"},
-        {"ticker":"GD","name":"General Dynamics","sector":"Industrials","industry":"Defense","country":"US"},
-        {"ticker":"GIS","name":"General Mills","sector":"Consumer Staples","industry":"Food","country":"US"},
-        {"ticker":"GM","name":"General Motors","sector":"Consumer Cyclical","industry":"Automobiles","country":"US"},
-        {"ticker":"GPC","name":"Genuine Parts","sector":"Consumer Cyclical","industry":"Auto Parts","country":"US"},
-        {"ticker":"GILD","name":"Gilead Sciences","sector":"Healthcare","industry":"Biotech","country":"US"},
-        {"ticker":"GS","name":"Goldman Sachs","sector":"Financial","industry":"Investment Banking","country":"US"},
-        {"ticker":"HAL","name":"Halliburton","sector":"Energy","industry":"Oilfield Services","country":"US"},
-        {"ticker":"HIG","name":"Hartford Financial Services","sector":"Financial","industry":"Insurance","country":"US"},
-        {"ticker":"HAS","name":"Hasbro","sector":"Consumer Cyclical","industry":"Toys","country":"US"},
-        {"ticker":"HCA","name":"HCA Healthcare","sector":"Healthcare","industry":"Hospitals","country":"US"},
-        {"ticker":"DOC","name":"Healthpeak Properties","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"HSIC","name":"Henry Schein","sector":"Healthcare","industry":"Distribution","country":"US"},
-        {"ticker":"HSY","name":"Hershey","sector":"Consumer Staples","industry":"Food","country":"US"},
-        {"ticker":"HES","name":"Hess","sector":"Energy","industry":"Oil & Gas E&P","country":"US"},
-        {"ticker":"HPE","name":"Hewlett Packard Enterprise","sector":"Technology","industry":"Hardware","country":"US"},
-        {"ticker":"HLT","name":"Hilton Worldwide","sector":"Consumer Cyclical","industry":"Hotels","country":"US"},
-        {"ticker":"HOLX","name":"Hologic","sector":"Healthcare","industry":"Medical Devices","country":"US"},
-        {"ticker":"HD","name":"Home Depot","sector":"Consumer Cyclical","industry":"Home Improvement","country":"US"},
-        {"ticker":"HON","name":"Honeywell","sector":"Industrials","industry":"Industrial Conglomerate","country":"US"},
-        {"ticker":"HRL","name":"Hormel Foods","sector":"Consumer Staples","industry":"Food","country":"US"},
-        {"ticker":"HST","name":"Host Hotels & Resorts","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"HWM","name":"Howmet Aerospace","sector":"Industrials","industry":"Aerospace","country":"US"},
-        {"ticker":"HPQ","name":"HP","sector":"Technology","industry":"Hardware","country":"US"},
-        {"ticker":"HUBB","name":"Hubbell","sector":"Industrials","industry":"Electrical Equipment","country":"US"},
-        {"ticker":"HUM","name":"Humana","sector":"Healthcare","industry":"Managed Care","country":"US"},
-        {"ticker":"HBAN","name":"Huntington Bancshares","sector":"Financial","industry":"Banks","country":"US"},
-        {"ticker":"HII","name":"Huntington Ingalls Industries","sector":"Industrials","industry":"Defense","country":"US"},
-        {"ticker":"IBM","name":"IBM","sector":"Technology","industry":"IT Services","country":"US"},
-        {"ticker":"IEX","name":"IDEX Corporation","sector":"Industrials","industry":"Industrial Machinery","country":"US"},
-        {"ticker":"IDXX","name":"IDEXX Laboratories","sector":"Healthcare","industry":"Veterinary","country":"US"},
-        {"ticker":"ITW","name":"Illinois Tool Works","sector":"Industrials","industry":"Industrial Machinery","country":"US"},
-        {"ticker":"INCY","name":"Incyte","sector":"Healthcare","industry":"Biotech","country":"US"},
-        {"ticker":"IR","name":"Ingersoll Rand","sector":"Industrials","industry":"Industrial Machinery","country":"US"},
-        {"ticker":"PODD","name":"Insulet Corporation","sector":"Healthcare","industry":"Medical Devices","country":"US"},
-        {"ticker":"INTC","name":"Intel","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"ICE","name":"Intercontinental Exchange","sector":"Financial","industry":"Financial Exchanges","country":"US"},
-        {"ticker":"IFF","name":"International Flavors","sector":"Materials","industry":"Specialty Chemicals","country":"US"},
-        {"ticker":"IP","name":"International Paper","sector":"Materials","industry":"Paper & Packaging","country":"US"},
-        {"ticker":"IPG","name":"Interpublic Group","sector":"Communication","industry":"Advertising","country":"US"},
-        {"ticker":"INTU","name":"Intuit","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"ISRG","name":"Intuitive Surgical","sector":"Healthcare","industry":"Medical Devices","country":"US"},
-        {"ticker":"IVZ","name":"Invesco","sector":"Financial","industry":"Asset Management","country":"US"},
-        {"ticker":"INVH","name":"Invitation Homes","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"IQV","name":"IQVIA Holdings","sector":"Healthcare","industry":"Life Sciences","country":"US"},
-        {"ticker":"IRM","name":"Iron Mountain","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"JBHT","name":"J.B. Hunt Transport","sector":"Industrials","industry":"Trucking","country":"US"},
-        {"ticker":"JBL","name":"Jabil","sector":"Technology","industry":"Electronic Manufacturing","country":"US"},
-        {"ticker":"JKHY","name":"Jack Henry & Associates","sector":"Technology","industry":"Fintech","country":"US"},
-        {"ticker":"J","name":"Jacobs Solutions","sector":"Industrials","industry":"Engineering","country":"US"},
-        {"ticker":"KSU","name":"Kansas City Southern","sector":"Industrials","industry":"Railroads","country":"US"},
-        {"ticker":"K","name":"Kellanova","sector":"Consumer Staples","industry":"Food","country":"US"},
-        {"ticker":"KEY","name":"KeyCorp","sector":"Financial","industry":"Banks","country":"US"},
-        {"ticker":"KEYS","name":"Keysight Technologies","sector":"Technology","industry":"Electronic Instruments","country":"US"},
-        {"ticker":"KIM","name":"Kimco Realty","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"KMI","name":"Kinder Morgan","sector":"Energy","industry":"Pipelines","country":"US"},
-        {"ticker":"KKR","name":"KKR & Co","sector":"Financial","industry":"Asset Management","country":"US"},
-        {"ticker":"KLAC","name":"KLA Corporation","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"KHC","name":"Kraft Heinz","sector":"Consumer Staples","industry":"Food","country":"US"},
-        {"ticker":"KR","name":"Kroger","sector":"Consumer Staples","industry":"Grocery","country":"US"},
-        {"ticker":"LHX","name":"L3Harris Technologies","sector":"Industrials","industry":"Defense","country":"US"},
-        {"ticker":"LH","name":"LabCorp","sector":"Healthcare","industry":"Diagnostics","country":"US"},
-        {"ticker":"LRCX","name":"Lam Research","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"LW","name":"Lamb Weston Holdings","sector":"Consumer Staples","industry":"Food","country":"US"},
-        {"ticker":"LVS","name":"Las Vegas Sands","sector":"Consumer Cyclical","industry":"Gaming","country":"US"},
-        {"ticker":"LDOS","name":"Leidos Holdings","sector":"Technology","industry":"Defense IT","country":"US"},
-        {"ticker":"LEN","name":"Lennar","sector":"Consumer Cyclical","industry":"Homebuilding","country":"US"},
-        {"ticker":"LNC","name":"Lincoln National","sector":"Financial","industry":"Insurance","country":"US"},
-        {"ticker":"LIN","name":"Linde","sector":"Materials","industry":"Industrial Gases","country":"IE"},
-        {"ticker":"LYV","name":"Live Nation Entertainment","sector":"Communication","industry":"Entertainment","country":"US"},
-        {"ticker":"LKQ","name":"LKQ Corporation","sector":"Consumer Cyclical","industry":"Auto Parts","country":"US"},
-        {"ticker":"LMT","name":"Lockheed Martin","sector":"Industrials","industry":"Defense","country":"US"},
-        {"ticker":"L","name":"Loews","sector":"Financial","industry":"Conglomerates","country":"US"},
-        {"ticker":"LOW","name":"Lowe's","sector":"Consumer Cyclical","industry":"Home Improvement","country":"US"},
-        {"ticker":"LULU","name":"lululemon athletica","sector":"Consumer Cyclical","industry":"Apparel","country":"CA"},
-        {"ticker":"LYB","name":"LyondellBasell Industries","sector":"Materials","industry":"Chemicals","country":"NL"},
-        {"ticker":"MTB","name":"M&T Bank","sector":"Financial","industry":"Banks","country":"US"},
-        {"ticker":"MRO","name":"Marathon Oil","sector":"Energy","industry":"Oil & Gas E&P","country":"US"},
-        {"ticker":"MPC","name":"Marathon Petroleum","sector":"Energy","industry":"Oil & Gas Refining","country":"US"},
-        {"ticker":"MKTX","name":"MarketAxess Holdings","sector":"Financial","industry":"Financial Exchanges","country":"US"},
-        {"ticker":"MAR","name":"Marriott International","sector":"Consumer Cyclical","industry":"Hotels","country":"US"},
-        {"ticker":"MMC","name":"Marsh & McLennan","sector":"Financial","industry":"Insurance","country":"US"},
-        {"ticker":"MLM","name":"Martin Marietta Materials","sector":"Materials","industry":"Construction Materials","country":"US"},
-        {"ticker":"MAS","name":"Masco","sector":"Industrials","industry":"Building Products","country":"US"},
-        {"ticker":"MA","name":"Mastercard","sector":"Technology","industry":"Payments","country":"US"},
-        {"ticker":"MTCH","name":"Match Group","sector":"Communication","industry":"Internet","country":"US"},
-        {"ticker":"MKC","name":"McCormick","sector":"Consumer Staples","industry":"Food","country":"US"},
-        {"ticker":"MCD","name":"McDonald's","sector":"Consumer Cyclical","industry":"Restaurants","country":"US"},
-        {"ticker":"MCK","name":"McKesson","sector":"Healthcare","industry":"Distribution","country":"US"},
-        {"ticker":"MDT","name":"Medtronic","sector":"Healthcare","industry":"Medical Devices","country":"IE"},
-        {"ticker":"MRK","name":"Merck","sector":"Healthcare","industry":"Pharma","country":"US"},
-        {"ticker":"META","name":"Meta Platforms","sector":"Technology","industry":"Social Media","country":"US"},
-        {"ticker":"MET","name":"MetLife","sector":"Financial","industry":"Insurance","country":"US"},
-        {"ticker":"MTD","name":"Mettler-Toledo","sector":"Healthcare","industry":"Life Sciences","country":"US"},
-        {"ticker":"MGM","name":"MGM Resorts International","sector":"Consumer Cyclical","industry":"Gaming","country":"US"},
-        {"ticker":"MCHP","name":"Microchip Technology","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"MU","name":"Micron Technology","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"MSFT","name":"Microsoft","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"MAA","name":"Mid-America Apartment","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"MRNA","name":"Moderna","sector":"Healthcare","industry":"Biotech","country":"US"},
-        {"ticker":"MHK","name":"Mohawk Industries","sector":"Consumer Cyclical","industry":"Flooring","country":"US"},
-        {"ticker":"MOH","name":"Molina Healthcare","sector":"Healthcare","industry":"Managed Care","country":"US"},
-        {"ticker":"TAP","name":"Molson Coors Brewing","sector":"Consumer Staples","industry":"Beverages","country":"US"},
-        {"ticker":"MDLZ","name":"Mondelez International","sector":"Consumer Staples","industry":"Food","country":"US"},
-        {"ticker":"MPWR","name":"Monolithic Power Systems","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"MNST","name":"Monster Beverage","sector":"Consumer Staples","industry":"Beverages","country":"US"},
-        {"ticker":"MCO","name":"Moody's","sector":"Financial","industry":"Financial Data","country":"US"},
-        {"ticker":"MS","name":"Morgan Stanley","sector":"Financial","industry":"Investment Banking","country":"US"},
-        {"ticker":"MOS","name":"Mosaic","sector":"Materials","industry":"Fertilizers","country":"US"},
-        {"ticker":"MSI","name":"Motorola Solutions","sector":"Technology","industry":"Communications Equipment","country":"US"},
-        {"ticker":"MSCI","name":"MSCI Inc","sector":"Financial","industry":"Financial Data","country":"US"},
-        {"ticker":"NDAQ","name":"Nasdaq","sector":"Financial","industry":"Financial Exchanges","country":"US"},
-        {"ticker":"NTAP","name":"NetApp","sector":"Technology","industry":"Storage","country":"US"},
-        {"ticker":"NFLX","name":"Netflix","sector":"Communication","industry":"Streaming","country":"US"},
-        {"ticker":"NEM","name":"Newmont","sector":"Materials","industry":"Gold Mining","country":"US"},
-        {"ticker":"NWSA","name":"News Corp A","sector":"Communication","industry":"Media","country":"US"},
-        {"ticker":"NEE","name":"NextEra Energy","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"NKE","name":"Nike","sector":"Consumer Cyclical","industry":"Footwear","country":"US"},
-        {"ticker":"NI","name":"NiSource","sector":"Utilities","industry":"Gas Utilities","country":"US"},
-        {"ticker":"NDSN","name":"Nordson","sector":"Industrials","industry":"Industrial Machinery","country":"US"},
-        {"ticker":"NSC","name":"Norfolk Southern","sector":"Industrials","industry":"Railroads","country":"US"},
-        {"ticker":"NOC","name":"Northrop Grumman","sector":"Industrials","industry":"Defense","country":"US"},
-        {"ticker":"NCLH","name":"Norwegian Cruise Line","sector":"Consumer Cyclical","industry":"Travel","country":"US"},
-        {"ticker":"NRG","name":"NRG Energy","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"NUE","name":"Nucor","sector":"Materials","industry":"Steel","country":"US"},
-        {"ticker":"NVDA","name":"NVIDIA","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"NVR","name":"NVR","sector":"Consumer Cyclical","industry":"Homebuilding","country":"US"},
-        {"ticker":"NXPI","name":"NXP Semiconductors","sector":"Technology","industry":"Semiconductors","country":"NL"},
-        {"ticker":"ORLY","name":"O'Reilly Automotive","sector":"Consumer Cyclical","industry":"Auto Parts","country":"US"},
-        {"ticker":"OXY","name":"Occidental Petroleum","sector":"Energy","industry":"Oil & Gas Integrated","country":"US"},
-        {"ticker":"ODFL","name":"Old Dominion Freight","sector":"Industrials","industry":"Trucking","country":"US"},
-        {"ticker":"OMC","name":"Omnicom Group","sector":"Communication","industry":"Advertising","country":"US"},
-        {"ticker":"ON","name":"ON Semiconductor","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"OKE","name":"ONEOK","sector":"Energy","industry":"Pipelines","country":"US"},
-        {"ticker":"ORCL","name":"Oracle","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"OTIS","name":"Otis Worldwide","sector":"Industrials","industry":"Elevators","country":"US"},
-        {"ticker":"PCAR","name":"PACCAR","sector":"Industrials","industry":"Trucks","country":"US"},
-        {"ticker":"PKG","name":"Packaging Corp of America","sector":"Materials","industry":"Packaging","country":"US"},
-        {"ticker":"PANW","name":"Palo Alto Networks","sector":"Technology","industry":"Cybersecurity","country":"US"},
-        {"ticker":"PARA","name":"Paramount Global","sector":"Communication","industry":"Media","country":"US"},
-        {"ticker":"PH","name":"Parker Hannifin","sector":"Industrials","industry":"Industrial Machinery","country":"US"},
-        {"ticker":"PAYX","name":"Paychex","sector":"Technology","industry":"HR Software","country":"US"},
-        {"ticker":"PAYC","name":"Paycom Software","sector":"Technology","industry":"HR Software","country":"US"},
-        {"ticker":"PYPL","name":"PayPal Holdings","sector":"Technology","industry":"Fintech","country":"US"},
-        {"ticker":"PNR","name":"Pentair","sector":"Industrials","industry":"Water Treatment","country":"GB"},
-        {"ticker":"PEP","name":"PepsiCo","sector":"Consumer Staples","industry":"Beverages","country":"US"},
-        {"ticker":"PFE","name":"Pfizer","sector":"Healthcare","industry":"Pharma","country":"US"},
-        {"ticker":"PCG","name":"PG&E","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"PM","name":"Philip Morris International","sector":"Consumer Staples","industry":"Tobacco","country":"US"},
-        {"ticker":"PSX","name":"Phillips 66","sector":"Energy","industry":"Oil & Gas Refining","country":"US"},
-        {"ticker":"PNW","name":"Pinnacle West Capital","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"PNC","name":"PNC Financial Services","sector":"Financial","industry":"Banks","country":"US"},
-        {"ticker":"POOL","name":"Pool Corporation","sector":"Consumer Cyclical","industry":"Distribution","country":"US"},
-        {"ticker":"PPG","name":"PPG Industries","sector":"Materials","industry":"Specialty Chemicals","country":"US"},
-        {"ticker":"PPL","name":"PPL Corporation","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"PFG","name":"Principal Financial Group","sector":"Financial","industry":"Asset Management","country":"US"},
-        {"ticker":"PG","name":"Procter & Gamble","sector":"Consumer Staples","industry":"Household Products","country":"US"},
-        {"ticker":"PGR","name":"Progressive","sector":"Financial","industry":"Insurance","country":"US"},
-        {"ticker":"PLD","name":"Prologis","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"PRU","name":"Prudential Financial","sector":"Financial","industry":"Insurance","country":"US"},
-        {"ticker":"PEG","name":"Public Service Enterprise Group","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"PTIV","name":"PTC","sector":"Technology","industry":"Industrial Software","country":"US"},
-        {"ticker":"PSA","name":"Public Storage","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"PHM","name":"PulteGroup","sector":"Consumer Cyclical","industry":"Homebuilding","country":"US"},
-        {"ticker":"QRVO","name":"Qorvo","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"PWR","name":"Quanta Services","sector":"Industrials","industry":"Engineering","country":"US"},
-        {"ticker":"QCOM","name":"Qualcomm","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"DGX","name":"Quest Diagnostics","sector":"Healthcare","industry":"Diagnostics","country":"US"},
-        {"ticker":"RL","name":"Ralph Lauren","sector":"Consumer Cyclical","industry":"Apparel","country":"US"},
-        {"ticker":"RJF","name":"Raymond James Financial","sector":"Financial","industry":"Brokers","country":"US"},
-        {"ticker":"RTX","name":"Raytheon Technologies","sector":"Industrials","industry":"Defense","country":"US"},
-        {"ticker":"O","name":"Realty Income","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"REG","name":"Regency Centers","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"REGN","name":"Regeneron Pharmaceuticals","sector":"Healthcare","industry":"Biotech","country":"US"},
-        {"ticker":"RF","name":"Regions Financial","sector":"Financial","industry":"Banks","country":"US"},
-        {"ticker":"RSG","name":"Republic Services","sector":"Industrials","industry":"Waste Management","country":"US"},
-        {"ticker":"RMD","name":"ResMed","sector":"Healthcare","industry":"Medical Devices","country":"US"},
-        {"ticker":"RVTY","name":"Revvity","sector":"Healthcare","industry":"Life Sciences","country":"US"},
-        {"ticker":"ROK","name":"Rockwell Automation","sector":"Industrials","industry":"Industrial Automation","country":"US"},
-        {"ticker":"ROL","name":"Rollins","sector":"Consumer Cyclical","industry":"Pest Control","country":"US"},
-        {"ticker":"ROP","name":"Roper Technologies","sector":"Technology","industry":"Industrial Software","country":"US"},
-        {"ticker":"ROST","name":"Ross Stores","sector":"Consumer Cyclical","industry":"Retail","country":"US"},
-        {"ticker":"RCL","name":"Royal Caribbean Group","sector":"Consumer Cyclical","industry":"Travel","country":"US"},
-        {"ticker":"SPGI","name":"S&P Global","sector":"Financial","industry":"Financial Data","country":"US"},
-        {"ticker":"CRM","name":"Salesforce","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"SBAC","name":"SBA Communications","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"SLB","name":"Schlumberger","sector":"Energy","industry":"Oilfield Services","country":"US"},
-        {"ticker":"STX","name":"Seagate Technology","sector":"Technology","industry":"Storage","country":"US"},
-        {"ticker":"SRE","name":"Sempra","sector":"Utilities","industry":"Gas Utilities","country":"US"},
-        {"ticker":"NOW","name":"ServiceNow","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"SHW","name":"Sherwin-Williams","sector":"Materials","industry":"Specialty Chemicals","country":"US"},
-        {"ticker":"SPG","name":"Simon Property Group","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"SWKS","name":"Skyworks Solutions","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"SJM","name":"J.M. Smucker","sector":"Consumer Staples","industry":"Food","country":"US"},
-        {"ticker":"SW","name":"Smurfit WestRock","sector":"Materials","industry":"Packaging","country":"US"},
-        {"ticker":"SNA","name":"Snap-on","sector":"Industrials","industry":"Tools","country":"US"},
-        {"ticker":"SOLV","name":"Solventum","sector":"Healthcare","industry":"Medical Products","country":"US"},
-        {"ticker":"SO","name":"Southern Company","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"LUV","name":"Southwest Airlines","sector":"Industrials","industry":"Airlines","country":"US"},
-        {"ticker":"SWK","name":"Stanley Black & Decker","sector":"Industrials","industry":"Tools","country":"US"},
-        {"ticker":"SBUX","name":"Starbucks","sector":"Consumer Cyclical","industry":"Restaurants","country":"US"},
-        {"ticker":"STT","name":"State Street","sector":"Financial","industry":"Asset Management","country":"US"},
-        {"ticker":"STE","name":"STERIS","sector":"Healthcare","industry":"Medical Devices","country":"US"},
-        {"ticker":"SYK","name":"Stryker","sector":"Healthcare","industry":"Medical Devices","country":"US"},
-        {"ticker":"SMCI","name":"Super Micro Computer","sector":"Technology","industry":"Servers","country":"US"},
-        {"ticker":"SYF","name":"Synchrony Financial","sector":"Financial","industry":"Credit Services","country":"US"},
-        {"ticker":"SNPS","name":"Synopsys","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"SYY","name":"Sysco","sector":"Consumer Staples","industry":"Food Distribution","country":"US"},
-        {"ticker":"TMUS","name":"T-Mobile US","sector":"Communication","industry":"Telecom","country":"US"},
-        {"ticker":"TGT","name":"Target","sector":"Consumer Staples","industry":"Retail","country":"US"},
-        {"ticker":"TEL","name":"TE Connectivity","sector":"Technology","industry":"Electronic Components","country":"CH"},
-        {"ticker":"TDY","name":"Teledyne Technologies","sector":"Industrials","industry":"Defense Electronics","country":"US"},
-        {"ticker":"TFX","name":"Teleflex","sector":"Healthcare","industry":"Medical Devices","country":"US"},
-        {"ticker":"TER","name":"Teradyne","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"TSLA","name":"Tesla","sector":"Consumer Cyclical","industry":"EV","country":"US"},
-        {"ticker":"TPR","name":"Tapestry","sector":"Consumer Cyclical","industry":"Luxury Goods","country":"US"},
-        {"ticker":"TRGP","name":"Targa Resources","sector":"Energy","industry":"Pipelines","country":"US"},
-        {"ticker":"TDG","name":"TransDigm Group","sector":"Industrials","industry":"Aerospace","country":"US"},
-        {"ticker":"TRV","name":"Travelers Companies","sector":"Financial","industry":"Insurance","country":"US"},
-        {"ticker":"TRMB","name":"Trimble","sector":"Technology","industry":"Industrial Software","country":"US"},
-        {"ticker":"TFC","name":"Truist Financial","sector":"Financial","industry":"Banks","country":"US"},
-        {"ticker":"TYL","name":"Tyler Technologies","sector":"Technology","industry":"Government Software","country":"US"},
-        {"ticker":"TSN","name":"Tyson Foods","sector":"Consumer Staples","industry":"Food","country":"US"},
-        {"ticker":"USB","name":"U.S. Bancorp","sector":"Financial","industry":"Banks","country":"US"},
-        {"ticker":"UDR","name":"UDR","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"ULTA","name":"Ulta Beauty","sector":"Consumer Cyclical","industry":"Retail","country":"US"},
-        {"ticker":"UNP","name":"Union Pacific","sector":"Industrials","industry":"Railroads","country":"US"},
-        {"ticker":"UAL","name":"United Airlines","sector":"Industrials","industry":"Airlines","country":"US"},
-        {"ticker":"UPS","name":"United Parcel Service","sector":"Industrials","industry":"Logistics","country":"US"},
-        {"ticker":"URI","name":"United Rentals","sector":"Industrials","industry":"Equipment Rental","country":"US"},
-        {"ticker":"UNH","name":"UnitedHealth Group","sector":"Healthcare","industry":"Managed Care","country":"US"},
-        {"ticker":"UHS","name":"Universal Health Services","sector":"Healthcare","industry":"Hospitals","country":"US"},
-        {"ticker":"VLO","name":"Valero Energy","sector":"Energy","industry":"Oil & Gas Refining","country":"US"},
-        {"ticker":"VTR","name":"Ventas","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"VLTO","name":"Veralto","sector":"Industrials","industry":"Environmental","country":"US"},
-        {"ticker":"VRSN","name":"VeriSign","sector":"Technology","industry":"Internet","country":"US"},
-        {"ticker":"VRSK","name":"Verisk Analytics","sector":"Financial","industry":"Financial Data","country":"US"},
-        {"ticker":"VZ","name":"Verizon Communications","sector":"Communication","industry":"Telecom","country":"US"},
-        {"ticker":"VRTX","name":"Vertex Pharmaceuticals","sector":"Healthcare","industry":"Biotech","country":"US"},
-        {"ticker":"VLTO","name":"Veralto","sector":"Industrials","industry":"Environmental","country":"US"},
-        {"ticker":"VFC","name":"VF Corporation","sector":"Consumer Cyclical","industry":"Apparel","country":"US"},
-        {"ticker":"VTRS","name":"Viatris","sector":"Healthcare","industry":"Pharma","country":"US"},
-        {"ticker":"VICI","name":"VICI Properties","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"V","name":"Visa","sector":"Technology","industry":"Payments","country":"US"},
-        {"ticker":"VMC","name":"Vulcan Materials","sector":"Materials","industry":"Construction Materials","country":"US"},
-        {"ticker":"WAB","name":"Wabtec","sector":"Industrials","industry":"Rail Equipment","country":"US"},
-        {"ticker":"WBA","name":"Walgreens Boots Alliance","sector":"Healthcare","industry":"Pharmacy","country":"US"},
-        {"ticker":"WMT","name":"Walmart","sector":"Consumer Staples","industry":"Retail","country":"US"},
-        {"ticker":"WBD","name":"Warner Bros. Discovery","sector":"Communication","industry":"Media","country":"US"},
-        {"ticker":"WAT","name":"Waters Corporation","sector":"Healthcare","industry":"Life Sciences","country":"US"},
-        {"ticker":"WEC","name":"WEC Energy Group","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"WFC","name":"Wells Fargo","sector":"Financial","industry":"Banks","country":"US"},
-        {"ticker":"WELL","name":"Welltower","sector":"Real Estate","industry":"REITs","country":"US"},
-        {"ticker":"WST","name":"West Pharmaceutical Services","sector":"Healthcare","industry":"Medical Packaging","country":"US"},
-        {"ticker":"WDC","name":"Western Digital","sector":"Technology","industry":"Storage","country":"US"},
-        {"ticker":"WRK","name":"WestRock","sector":"Materials","industry":"Packaging","country":"US"},
-        {"ticker":"WY","name":"Weyerhaeuser","sector":"Real Estate","industry":"Timber REITs","country":"US"},
-        {"ticker":"WMB","name":"Williams Companies","sector":"Energy","industry":"Pipelines","country":"US"},
-        {"ticker":"WTW","name":"Willis Towers Watson","sector":"Financial","industry":"Insurance","country":"US"},
-        {"ticker":"GWW","name":"W.W. Grainger","sector":"Industrials","industry":"Distribution","country":"US"},
-        {"ticker":"WYNN","name":"Wynn Resorts","sector":"Consumer Cyclical","industry":"Gaming","country":"US"},
-        {"ticker":"XEL","name":"Xcel Energy","sector":"Utilities","industry":"Electric Utilities","country":"US"},
-        {"ticker":"XYL","name":"Xylem","sector":"Industrials","industry":"Water Technology","country":"US"},
-        {"ticker":"YUM","name":"Yum! Brands","sector":"Consumer Cyclical","industry":"Restaurants","country":"US"},
-        {"ticker":"ZBRA","name":"Zebra Technologies","sector":"Technology","industry":"Hardware","country":"US"},
-        {"ticker":"ZBH","name":"Zimmer Biomet","sector":"Healthcare","industry":"Medical Devices","country":"US"},
-        {"ticker":"ZTS","name":"Zoetis","sector":"Healthcare","industry":"Veterinary","country":"US"},
-        # ── HIGH-GROWTH / POPULAR RETAIL STOCKS ──────────────
-        {"ticker":"AFRM","name":"Affirm Holdings","sector":"Technology","industry":"Fintech","country":"US"},
-        {"ticker":"APPN","name":"Appian","sector":"Technology","industry":"Low-Code Software","country":"US"},
-        {"ticker":"ASAN","name":"Asana","sector":"Technology","industry":"Productivity Software","country":"US"},
-        {"ticker":"BILL","name":"Bill.com","sector":"Technology","industry":"Fintech","country":"US"},
-        {"ticker":"BIRD","name":"Allbirds","sector":"Consumer Cyclical","industry":"Footwear","country":"US"},
-        {"ticker":"BOX","name":"Box","sector":"Technology","industry":"Cloud Storage","country":"US"},
-        {"ticker":"BRZE","name":"Braze","sector":"Technology","industry":"Marketing Software","country":"US"},
-        {"ticker":"CLOV","name":"Clover Health","sector":"Healthcare","industry":"Managed Care","country":"US"},
-        {"ticker":"COIN","name":"Coinbase Global","sector":"Financial","industry":"Crypto Exchange","country":"US"},
-        {"ticker":"CORZ","name":"Core Scientific","sector":"Technology","industry":"Crypto Mining","country":"US"},
-        {"ticker":"CRCL","name":"Circle Internet","sector":"Technology","industry":"Fintech","country":"US"},
-        {"ticker":"DKNG","name":"DraftKings","sector":"Consumer Cyclical","industry":"Online Gaming","country":"US"},
-        {"ticker":"DOCS","name":"Doximity","sector":"Healthcare","industry":"Health IT","country":"US"},
-        {"ticker":"DOCU","name":"DocuSign","sector":"Technology","industry":"Software","country":"US"},
-        {"ticker":"DLO","name":"DLocal","sector":"Technology","industry":"Fintech","country":"UY"},
-        {"ticker":"DUOL","name":"Duolingo","sector":"Communication","industry":"EdTech","country":"US"},
-        {"ticker":"DWAC","name":"Digital World Acquisition","sector":"Communication","industry":"SPAC","country":"US"},
-        {"ticker":"DDOG","name":"Datadog","sector":"Technology","industry":"Cloud Monitoring","country":"US"},
-        {"ticker":"ESTC","name":"Elastic","sector":"Technology","industry":"Search Software","country":"US"},
-        {"ticker":"EVGO","name":"EVgo","sector":"Utilities","industry":"EV Charging","country":"US"},
-        {"ticker":"EXAS","name":"Exact Sciences","sector":"Healthcare","industry":"Diagnostics","country":"US"},
-        {"ticker":"FRSH","name":"Freshworks","sector":"Technology","industry":"CRM Software","country":"US"},
-        {"ticker":"GLBE","name":"Global-E Online","sector":"Technology","industry":"E-Commerce","country":"IL"},
-        {"ticker":"GTLB","name":"GitLab","sector":"Technology","industry":"DevOps Software","country":"US"},
-        {"ticker":"HIMS","name":"Hims & Hers Health","sector":"Healthcare","industry":"Telehealth","country":"US"},
-        {"ticker":"HCP","name":"HashiCorp","sector":"Technology","industry":"DevOps Software","country":"US"},
-        {"ticker":"HOOD","name":"Robinhood Markets","sector":"Financial","industry":"Brokers","country":"US"},
-        {"ticker":"HUBS","name":"HubSpot","sector":"Technology","industry":"CRM Software","country":"US"},
-        {"ticker":"HYMC","name":"Hycroft Mining","sector":"Materials","industry":"Gold Mining","country":"US"},
-        {"ticker":"IONQ","name":"IonQ","sector":"Technology","industry":"Quantum Computing","country":"US"},
-        {"ticker":"KIND","name":"Nextdoor Holdings","sector":"Communication","industry":"Social Media","country":"US"},
-        {"ticker":"LEGN","name":"Legend Biotech","sector":"Healthcare","industry":"Biotech","country":"US"},
-        {"ticker":"LIDR","name":"AEye","sector":"Technology","industry":"LiDAR","country":"US"},
-        {"ticker":"LMND","name":"Lemonade","sector":"Financial","industry":"Insurtech","country":"US"},
-        {"ticker":"LUNR","name":"Intuitive Machines","sector":"Industrials","industry":"Space","country":"US"},
-        {"ticker":"MARA","name":"Marathon Digital Holdings","sector":"Technology","industry":"Crypto Mining","country":"US"},
-        {"ticker":"MDGL","name":"Madrigal Pharmaceuticals","sector":"Healthcare","industry":"Biotech","country":"US"},
-        {"ticker":"MNDY","name":"monday.com","sector":"Technology","industry":"Productivity Software","country":"IL"},
-        {"ticker":"MSTR","name":"MicroStrategy","sector":"Technology","industry":"Business Intelligence","country":"US"},
-        {"ticker":"NKLA","name":"Nikola","sector":"Consumer Cyclical","industry":"EV","country":"US"},
-        {"ticker":"NUVL","name":"Nuvalent","sector":"Healthcare","industry":"Biotech","country":"US"},
-        {"ticker":"OPEN","name":"Opendoor Technologies","sector":"Real Estate","industry":"PropTech","country":"US"},
-        {"ticker":"OLK","name":"Olink Proteomics","sector":"Healthcare","industry":"Life Sciences","country":"SE"},
-        {"ticker":"OSCR","name":"Oscar Health","sector":"Healthcare","industry":"Insurtech","country":"US"},
-        {"ticker":"PTON","name":"Peloton Interactive","sector":"Consumer Cyclical","industry":"Fitness","country":"US"},
-        {"ticker":"PCVX","name":"Vaxcyte","sector":"Healthcare","industry":"Vaccines","country":"US"},
-        {"ticker":"PSTG","name":"Pure Storage","sector":"Technology","industry":"Storage","country":"US"},
-        {"ticker":"RBLX","name":"Roblox","sector":"Communication","industry":"Gaming","country":"US"},
-        {"ticker":"RELY","name":"Remitly Global","sector":"Technology","industry":"Fintech","country":"US"},
-        {"ticker":"RIVN","name":"Rivian Automotive","sector":"Consumer Cyclical","industry":"EV","country":"US"},
-        {"ticker":"RPAY","name":"Repay Holdings","sector":"Technology","industry":"Fintech","country":"US"},
-        {"ticker":"RKT","name":"Rocket Companies","sector":"Financial","industry":"Mortgage","country":"US"},
-        {"ticker":"RLAY","name":"Relay Therapeutics","sector":"Healthcare","industry":"Biotech","country":"US"},
-        {"ticker":"ROOT","name":"Root","sector":"Financial","industry":"Insurtech","country":"US"},
-        {"ticker":"S","name":"SentinelOne","sector":"Technology","industry":"Cybersecurity","country":"US"},
-        {"ticker":"SAMSF","name":"Samsung Electronics","sector":"Technology","industry":"Electronics","country":"KR"},
-        {"ticker":"SHOP","name":"Shopify","sector":"Technology","industry":"E-Commerce","country":"CA"},
-        {"ticker":"SMAR","name":"Smartsheet","sector":"Technology","industry":"Productivity Software","country":"US"},
-        {"ticker":"SNAP","name":"Snap","sector":"Communication","industry":"Social Media","country":"US"},
-        {"ticker":"SOFI","name":"SoFi Technologies","sector":"Financial","industry":"Fintech","country":"US"},
-        {"ticker":"SPCE","name":"Virgin Galactic","sector":"Industrials","industry":"Space","country":"US"},
-        {"ticker":"SPT","name":"Sprout Social","sector":"Technology","industry":"Marketing Software","country":"US"},
-        {"ticker":"SPTS","name":"Sprouts Farmers Market","sector":"Consumer Staples","industry":"Grocery","country":"US"},
-        {"ticker":"SQ","name":"Block","sector":"Technology","industry":"Fintech","country":"US"},
-        {"ticker":"TOST","name":"Toast","sector":"Technology","industry":"Restaurant Software","country":"US"},
-        {"ticker":"TTWO","name":"Take-Two Interactive","sector":"Communication","industry":"Gaming","country":"US"},
-        {"ticker":"TWLO","name":"Twilio","sector":"Technology","industry":"Cloud Communications","country":"US"},
-        {"ticker":"U","name":"Unity Software","sector":"Technology","industry":"Game Engine","country":"US"},
-        {"ticker":"UBER","name":"Uber Technologies","sector":"Technology","industry":"Ridesharing","country":"US"},
-        {"ticker":"UI","name":"Ubiquiti","sector":"Technology","industry":"Networking","country":"US"},
-        {"ticker":"UPST","name":"Upstart Holdings","sector":"Technology","industry":"AI Lending","country":"US"},
-        {"ticker":"VNET","name":"21Vianet Group","sector":"Technology","industry":"Data Centers","country":"CN"},
-        {"ticker":"WEN","name":"Wendy's","sector":"Consumer Cyclical","industry":"Restaurants","country":"US"},
-        {"ticker":"WIX","name":"Wix.com","sector":"Technology","industry":"Web Hosting","country":"IL"},
-        {"ticker":"WOLF","name":"Wolfspeed","sector":"Technology","industry":"Semiconductors","country":"US"},
-        {"ticker":"WKME","name":"WalkMe","sector":"Technology","industry":"Digital Adoption","country":"IL"},
-        {"ticker":"XP","name":"XP Inc","sector":"Financial","industry":"Brokers","country":"BR"},
-        {"ticker":"XPEV","name":"XPeng","sector":"Consumer Cyclical","industry":"EV","country":"CN"},
-        {"ticker":"ZI","name":"ZoomInfo Technologies","sector":"Technology","industry":"Sales Software","country":"US"},
-        {"ticker":"ZM","name":"Zoom Video","sector":"Technology","industry":"Video Conferencing","country":"US"},
-        {"ticker":"ZS","name":"Zscaler","sector":"Technology","industry":"Cybersecurity","country":"US"},
-        # ── ADDITIONAL CRYPTO ─────────────────────────────────
-        {"ticker":"AVAX-USD","name":"Avalanche","sector":"Crypto","industry":"Layer 1","country":"US","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"DOT-USD","name":"Polkadot","sector":"Crypto","industry":"Layer 0","country":"US","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"TRX-USD","name":"TRON","sector":"Crypto","industry":"Layer 1","country":"CN","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"NEAR-USD","name":"NEAR Protocol","sector":"Crypto","industry":"Layer 1","country":"US","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"ICP-USD","name":"Internet Computer","sector":"Crypto","industry":"Web3","country":"CH","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"APT-USD","name":"Aptos","sector":"Crypto","industry":"Layer 1","country":"US","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"OP-USD","name":"Optimism","sector":"Crypto","industry":"Layer 2","country":"US","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"ARB-USD","name":"Arbitrum","sector":"Crypto","industry":"Layer 2","country":"US","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"INJ-USD","name":"Injective","sector":"Crypto","industry":"DeFi","country":"US","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"ATOM-USD","name":"Cosmos","sector":"Crypto","industry":"Layer 0","country":"US","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"IMX-USD","name":"Immutable X","sector":"Crypto","industry":"Gaming","country":"AU","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"RUNE-USD","name":"THORChain","sector":"Crypto","industry":"DeFi","country":"US","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"FIL-USD","name":"Filecoin","sector":"Crypto","industry":"Storage","country":"US","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"LDO-USD","name":"Lido DAO","sector":"Crypto","industry":"DeFi","country":"US","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"GRT-USD","name":"The Graph","sector":"Crypto","industry":"Data Indexing","country":"US","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"RNDR-USD","name":"Render Network","sector":"Crypto","industry":"GPU Computing","country":"US","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"FET-USD","name":"Fetch.ai","sector":"Crypto","industry":"AI Crypto","country":"GB","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"OCEAN-USD","name":"Ocean Protocol","sector":"Crypto","industry":"Data Marketplace","country":"SG","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"VET-USD","name":"VeChain","sector":"Crypto","industry":"Supply Chain","country":"CN","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"ALGO-USD","name":"Algorand","sector":"Crypto","industry":"Layer 1","country":"US","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"HBAR-USD","name":"Hedera","sector":"Crypto","industry":"Layer 1","country":"US","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"XLM-USD","name":"Stellar","sector":"Crypto","industry":"Payments","country":"US","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"EGLD-USD","name":"MultiversX","sector":"Crypto","industry":"Layer 1","country":"MD","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"FTM-USD","name":"Fantom","sector":"Crypto","industry":"Layer 1","country":"SG","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"EOS-USD","name":"EOS","sector":"Crypto","industry":"Layer 1","country":"US","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"SAND-USD","name":"The Sandbox","sector":"Crypto","industry":"Gaming","country":"HK","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"MANA-USD","name":"Decentraland","sector":"Crypto","industry":"Metaverse","country":"AR","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"AXS-USD","name":"Axie Infinity","sector":"Crypto","industry":"Gaming","country":"VN","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"CHZ-USD","name":"Chiliz","sector":"Crypto","industry":"Sports Fan Tokens","country":"MT","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"GALA-USD","name":"Gala","sector":"Crypto","industry":"Gaming","country":"US","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"FLOW-USD","name":"Flow","sector":"Crypto","industry":"NFTs","country":"CA","quote_type":"CRYPTOCURRENCY"},
-        {"ticker":"WBTC-USD","name":"Wrapped Bitcoin","sector":"Crypto","industry":"Wrapped Assets","country":"US","quote_type":"CRYPTOCURRENCY"},
-        # ── MORE FOREX PAIRS ──────────────────────────────────
-        {"ticker":"CHFUSD=X","name":"CHF/USD","sector":"Forex","industry":"Currency","country":"CH","quote_type":"FOREX"},
-        {"ticker":"SEKUSD=X","name":"SEK/USD","sector":"Forex","industry":"Currency","country":"SE","quote_type":"FOREX"},
-        {"ticker":"NOKUSD=X","name":"NOK/USD","sector":"Forex","industry":"Currency","country":"NO","quote_type":"FOREX"},
-        {"ticker":"DKKUSD=X","name":"DKK/USD","sector":"Forex","industry":"Currency","country":"DK","quote_type":"FOREX"},
-        {"ticker":"SGDUSD=X","name":"SGD/USD","sector":"Forex","industry":"Currency","country":"SG","quote_type":"FOREX"},
-        {"ticker":"HKDUSD=X","name":"HKD/USD","sector":"Forex","industry":"Currency","country":"HK","quote_type":"FOREX"},
-        {"ticker":"MXNUSD=X","name":"MXN/USD","sector":"Forex","industry":"Currency","country":"MX","quote_type":"FOREX"},
-        {"ticker":"ZARUSD=X","name":"ZAR/USD","sector":"Forex","industry":"Currency","country":"ZA","quote_type":"FOREX"},
-        {"ticker":"NZDUSD=X","name":"NZD/USD","sector":"Forex","industry":"Currency","country":"NZ","quote_type":"FOREX"},
-        {"ticker":"TRYUSD=X","name":"TRY/USD","sector":"Forex","industry":"Currency","country":"TR","quote_type":"FOREX"},
-        # ── ADDITIONAL ETFs ───────────────────────────────────
-        {"ticker":"QQQ","name":"Invesco QQQ Trust","sector":"ETF","industry":"Tech ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"SPY","name":"SPDR S&P 500 ETF","sector":"ETF","industry":"Broad Market ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"IWM","name":"iShares Russell 2000","sector":"ETF","industry":"Small Cap ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"VTI","name":"Vanguard Total Stock Market","sector":"ETF","industry":"Broad Market ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"VOO","name":"Vanguard S&P 500","sector":"ETF","industry":"Broad Market ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"ARKK","name":"ARK Innovation ETF","sector":"ETF","industry":"Thematic ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"ARKG","name":"ARK Genomic Revolution","sector":"ETF","industry":"Healthcare ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"ARKW","name":"ARK Next Generation Internet","sector":"ETF","industry":"Tech ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"GLD","name":"SPDR Gold Shares","sector":"ETF","industry":"Commodities ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"SLV","name":"iShares Silver Trust","sector":"ETF","industry":"Commodities ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"XLF","name":"Financial Select Sector SPDR","sector":"ETF","industry":"Financial ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"XLE","name":"Energy Select Sector SPDR","sector":"ETF","industry":"Energy ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"XLK","name":"Technology Select Sector SPDR","sector":"ETF","industry":"Tech ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"XLV","name":"Health Care Select Sector SPDR","sector":"ETF","industry":"Healthcare ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"SOXX","name":"iShares PHLX Semiconductor ETF","sector":"ETF","industry":"Semiconductor ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"BOTZ","name":"Global X Robotics & AI ETF","sector":"ETF","industry":"AI ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"JETS","name":"US Global Jets ETF","sector":"ETF","industry":"Airlines ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"ICLN","name":"iShares Global Clean Energy ETF","sector":"ETF","industry":"Clean Energy ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"KWEB","name":"KraneShares CSI China Internet","sector":"ETF","industry":"China Tech ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"EEM","name":"iShares MSCI Emerging Markets","sector":"ETF","industry":"Emerging Markets ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"VGK","name":"Vanguard FTSE Europe","sector":"ETF","industry":"Europe ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"EWJ","name":"iShares MSCI Japan","sector":"ETF","industry":"Japan ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"EWZ","name":"iShares MSCI Brazil","sector":"ETF","industry":"Brazil ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"TLT","name":"iShares 20+ Year Treasury Bond","sector":"ETF","industry":"Bond ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"HYG","name":"iShares High Yield Corporate Bond","sector":"ETF","industry":"Bond ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"BITO","name":"ProShares Bitcoin ETF","sector":"ETF","industry":"Crypto ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"IBIT","name":"iShares Bitcoin Trust","sector":"ETF","industry":"Crypto ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"FBTC","name":"Fidelity Wise Origin Bitcoin","sector":"ETF","industry":"Crypto ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"BITB","name":"Bitwise Bitcoin ETF","sector":"ETF","industry":"Crypto ETF","country":"US","quote_type":"ETF"},
-        {"ticker":"ETHA","name":"iShares Ethereum Trust","sector":"ETF","industry":"Crypto ETF","country":"US","quote_type":"ETF"},
-        # ── UK / EUROPEAN BLUE CHIPS ──────────────────────────
-        {"ticker":"SHEL.L","name":"Shell","sector":"Energy","industry":"Oil & Gas Integrated","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"AZN.L","name":"AstraZeneca","sector":"Healthcare","industry":"Pharma","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"HSBA.L","name":"HSBC Holdings","sector":"Financial","industry":"Banks","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"ULVR.L","name":"Unilever","sector":"Consumer Staples","industry":"Household Products","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"BP.L","name":"BP","sector":"Energy","industry":"Oil & Gas Integrated","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"RIO.L","name":"Rio Tinto","sector":"Materials","industry":"Diversified Mining","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"GSK.L","name":"GSK","sector":"Healthcare","industry":"Pharma","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"BHP.L","name":"BHP Group","sector":"Materials","industry":"Diversified Mining","country":"AU","quote_type":"EQUITY"},
-        {"ticker":"LSEG.L","name":"LSEG","sector":"Financial","industry":"Financial Exchanges","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"DGE.L","name":"Diageo","sector":"Consumer Staples","industry":"Beverages","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"BAE.L","name":"BAE Systems","sector":"Industrials","industry":"Defense","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"REL.L","name":"RELX","sector":"Communication","industry":"Information Services","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"CPG.L","name":"Compass Group","sector":"Consumer Cyclical","industry":"Food Services","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"RTO.L","name":"Rentokil Initial","sector":"Industrials","industry":"Business Services","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"NG.L","name":"National Grid","sector":"Utilities","industry":"Electric Utilities","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"PRU.L","name":"Prudential","sector":"Financial","industry":"Insurance","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"SGE.L","name":"Sage Group","sector":"Technology","industry":"ERP Software","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"SVT.L","name":"Severn Trent","sector":"Utilities","industry":"Water","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"TSCO.L","name":"Tesco","sector":"Consumer Staples","industry":"Grocery","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"VOD.L","name":"Vodafone","sector":"Communication","industry":"Telecom","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"WPP.L","name":"WPP","sector":"Communication","industry":"Advertising","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"AAL.L","name":"Anglo American","sector":"Materials","industry":"Diversified Mining","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"ANTO.L","name":"Antofagasta","sector":"Materials","industry":"Copper","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"AUTO.L","name":"Auto Trader Group","sector":"Communication","industry":"Online Marketplace","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"AV.L","name":"Aviva","sector":"Financial","industry":"Insurance","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"BATS.L","name":"British American Tobacco","sector":"Consumer Staples","industry":"Tobacco","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"BARC.L","name":"Barclays","sector":"Financial","industry":"Banks","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"BT.L","name":"BT Group","sector":"Communication","industry":"Telecom","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"CNA.L","name":"Centrica","sector":"Utilities","industry":"Gas Utilities","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"EXPN.L","name":"Experian","sector":"Technology","industry":"Credit Data","country":"IE","quote_type":"EQUITY"},
-        {"ticker":"FERG.L","name":"Ferguson Enterprises","sector":"Industrials","industry":"Distribution","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"FLTR.L","name":"Flutter Entertainment","sector":"Consumer Cyclical","industry":"Online Gaming","country":"IE","quote_type":"EQUITY"},
-        {"ticker":"GLEN.L","name":"Glencore","sector":"Materials","industry":"Diversified Mining","country":"CH","quote_type":"EQUITY"},
-        {"ticker":"HIK.L","name":"Hikma Pharmaceuticals","sector":"Healthcare","industry":"Pharma","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"IMB.L","name":"Imperial Brands","sector":"Consumer Staples","industry":"Tobacco","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"INF.L","name":"Informa","sector":"Communication","industry":"Information Services","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"ITV.L","name":"ITV","sector":"Communication","industry":"Broadcasting","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"JMAT.L","name":"Johnson Matthey","sector":"Materials","industry":"Specialty Chemicals","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"KGF.L","name":"Kingfisher","sector":"Consumer Cyclical","industry":"Home Improvement","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"LAND.L","name":"Land Securities Group","sector":"Real Estate","industry":"REITs","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"LLOY.L","name":"Lloyds Banking Group","sector":"Financial","industry":"Banks","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"MKS.L","name":"Marks & Spencer","sector":"Consumer Cyclical","industry":"Retail","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"MNG.L","name":"M&G","sector":"Financial","industry":"Asset Management","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"MRO.L","name":"Melrose Industries","sector":"Industrials","industry":"Aerospace","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"NWG.L","name":"NatWest Group","sector":"Financial","industry":"Banks","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"OCDO.L","name":"Ocado Group","sector":"Consumer Staples","industry":"Grocery","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"PSN.L","name":"Persimmon","sector":"Consumer Cyclical","industry":"Homebuilding","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"PSON.L","name":"Pearson","sector":"Communication","industry":"Education","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"RKT.L","name":"Reckitt Benckiser","sector":"Consumer Staples","industry":"Household Products","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"RR.L","name":"Rolls-Royce Holdings","sector":"Industrials","industry":"Aerospace","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"RS1.L","name":"RS Group","sector":"Industrials","industry":"Distribution","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"SBRY.L","name":"Sainsbury's","sector":"Consumer Staples","industry":"Grocery","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"SDR.L","name":"Schroders","sector":"Financial","industry":"Asset Management","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"SKG.L","name":"Smurfit Kappa","sector":"Materials","industry":"Packaging","country":"IE","quote_type":"EQUITY"},
-        {"ticker":"SMDS.L","name":"DS Smith","sector":"Materials","industry":"Packaging","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"SMIN.L","name":"Smiths Group","sector":"Industrials","industry":"Industrial Conglomerate","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"SMT.L","name":"Scottish Mortgage Investment Trust","sector":"Financial","industry":"Investment Trust","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"SPX.L","name":"Spirax-Sarco Engineering","sector":"Industrials","industry":"Industrial Machinery","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"SSE.L","name":"SSE","sector":"Utilities","industry":"Electric Utilities","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"STJ.L","name":"St. James's Place","sector":"Financial","industry":"Wealth Management","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"TW.L","name":"Taylor Wimpey","sector":"Consumer Cyclical","industry":"Homebuilding","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"WEIR.L","name":"Weir Group","sector":"Industrials","industry":"Industrial Machinery","country":"GB","quote_type":"EQUITY"},
-        {"ticker":"WTB.L","name":"Whitbread","sector":"Consumer Cyclical","industry":"Hotels","country":"GB","quote_type":"EQUITY"},
-        # ── EUROPEAN BLUE CHIPS ────────────────────────────────
-        {"ticker":"ASML","name":"ASML Holding","sector":"Technology","industry":"Semiconductors","country":"NL"},
-        {"ticker":"NVO","name":"Novo Nordisk ADR","sector":"Healthcare","industry":"Pharma","country":"DK"},
-        {"ticker":"SAP","name":"SAP ADR","sector":"Technology","industry":"ERP Software","country":"DE"},
-        {"ticker":"TM","name":"Toyota Motor ADR","sector":"Consumer Cyclical","industry":"Automobiles","country":"JP"},
-        {"ticker":"SNY","name":"Sanofi ADR","sector":"Healthcare","industry":"Pharma","country":"FR"},
-        {"ticker":"LVMUY","name":"LVMH ADR","sector":"Consumer Cyclical","industry":"Luxury Goods","country":"FR"},
-        {"ticker":"NESN","name":"Nestle ADR","sector":"Consumer Staples","industry":"Food","country":"CH"},
-        {"ticker":"RHHBY","name":"Roche ADR","sector":"Healthcare","industry":"Pharma","country":"CH"},
-        {"ticker":"NOVN","name":"Novartis ADR","sector":"Healthcare","industry":"Pharma","country":"CH"},
-        {"ticker":"SIEGY","name":"Siemens ADR","sector":"Industrials","industry":"Industrial Conglomerate","country":"DE"},
-        {"ticker":"ALIZY","name":"Allianz ADR","sector":"Financial","industry":"Insurance","country":"DE"},
-        {"ticker":"BAYRY","name":"Bayer ADR","sector":"Healthcare","industry":"Pharma","country":"DE"},
-        {"ticker":"BASFY","name":"BASF ADR","sector":"Materials","industry":"Chemicals","country":"DE"},
-        {"ticker":"BMWYY","name":"BMW ADR","sector":"Consumer Cyclical","industry":"Automobiles","country":"DE"},
-        {"ticker":"DDAIF","name":"Mercedes-Benz ADR","sector":"Consumer Cyclical","industry":"Automobiles","country":"DE"},
-        {"ticker":"VWAGY","name":"Volkswagen ADR","sector":"Consumer Cyclical","industry":"Automobiles","country":"DE"},
-        {"ticker":"BNP.PA","name":"BNP Paribas","sector":"Financial","industry":"Banks","country":"FR","quote_type":"EQUITY"},
-        {"ticker":"AIR.PA","name":"Airbus","sector":"Industrials","industry":"Aerospace","country":"FR","quote_type":"EQUITY"},
-        {"ticker":"TTE.PA","name":"TotalEnergies","sector":"Energy","industry":"Oil & Gas Integrated","country":"FR","quote_type":"EQUITY"},
-        {"ticker":"OR.PA","name":"L'Oreal","sector":"Consumer Staples","industry":"Cosmetics","country":"FR","quote_type":"EQUITY"},
-        {"ticker":"HO.PA","name":"Thales","sector":"Industrials","industry":"Defense","country":"FR","quote_type":"EQUITY"},
-        # ── ASIAN BLUE CHIPS ──────────────────────────────────
-        {"ticker":"BABA","name":"Alibaba Group","sector":"Consumer Cyclical","industry":"E-Commerce","country":"CN"},
-        {"ticker":"TCEHY","name":"Tencent ADR","sector":"Communication","industry":"Internet","country":"CN"},
-        {"ticker":"TSM","name":"TSMC ADR","sector":"Technology","industry":"Semiconductors","country":"TW"},
-        {"ticker":"SONY","name":"Sony Group ADR","sector":"Consumer Cyclical","industry":"Electronics","country":"JP"},
-        {"ticker":"BIDU","name":"Baidu","sector":"Technology","industry":"Internet Search","country":"CN"},
-        {"ticker":"JD","name":"JD.com","sector":"Consumer Cyclical","industry":"E-Commerce","country":"CN"},
-        {"ticker":"NIO","name":"NIO","sector":"Consumer Cyclical","industry":"EV","country":"CN"},
-        {"ticker":"PDD","name":"PDD Holdings","sector":"Consumer Cyclical","industry":"E-Commerce","country":"CN"},
-        {"ticker":"NTES","name":"NetEase","sector":"Communication","industry":"Gaming","country":"CN"},
-        {"ticker":"SE","name":"Sea Limited","sector":"Communication","industry":"Gaming","country":"SG"},
-        {"ticker":"GRAB","name":"Grab Holdings","sector":"Technology","industry":"Ridesharing","country":"SG"},
-        {"ticker":"DESP","name":"Despegar.com","sector":"Consumer Cyclical","industry":"Travel","country":"AR"},
-        {"ticker":"HDB","name":"HDFC Bank ADR","sector":"Financial","industry":"Banks","country":"IN"},
-        {"ticker":"IBN","name":"ICICI Bank ADR","sector":"Financial","industry":"Banks","country":"IN"},
-        {"ticker":"WIT","name":"Wipro ADR","sector":"Technology","industry":"IT Services","country":"IN"},
-        {"ticker":"INFY","name":"Infosys ADR","sector":"Technology","industry":"IT Services","country":"IN"},
-        {"ticker":"TTM","name":"Tata Motors ADR","sector":"Consumer Cyclical","industry":"Automobiles","country":"IN"},
-        {"ticker":"RDY","name":"Dr. Reddy's Laboratories","sector":"Healthcare","industry":"Pharma","country":"IN"},
-        {"ticker":"VALE","name":"Vale ADR","sector":"Materials","industry":"Iron Ore","country":"BR"},
-        {"ticker":"PBR","name":"Petrobras ADR","sector":"Energy","industry":"Oil & Gas Integrated","country":"BR"},
-        {"ticker":"ITUB","name":"Itau Unibanco ADR","sector":"Financial","industry":"Banks","country":"BR"},
-    ]
-
-    async def fetch(self) -> List[dict]:
-        log.info(f"Loading {len(self.SEEDS)} static seed assets")
-        for seed in self.SEEDS:
-            seed["source"] = "static_seed"
-            if "quote_type" not in seed:
-                seed["quote_type"] = "EQUITY"
-        return self.SEEDS
+    @property
+    def SEEDS(self) -> Tuple[Mapping[str, object], ...]:
+        """Legacy name for every seed record (the universe itself is columnar)."""
+        return _frozen_seeds(None)
+
+    def load(self, region: Optional[str] = None) -> Tuple[Mapping[str, object], ...]:
+        """No I/O after the first call per region — callers need not await."""
+        seeds = _frozen_seeds(region)
+        log.info(f"Loading {len(seeds)} static seed assets")
+        return seeds
+
+    async def fetch(self, region: Optional[str] = None) -> Tuple[Mapping[str, object], ...]:
+        # Kept async to match the other fetchers' interface
+        return self.load(region)
+
+    # Frozen records line up with universe rows, so its indexes address them
+    def get(self, ticker: str, region: Optional[str] = None) -> Optional[Mapping[str, object]]:
+        i = get_universe(region).ticker_index.get(ticker)
+        return None if i is None else _frozen_seeds(region)[i]
+
+    def by_sector(self, sector: str,
+                  region: Optional[str] = None) -> Tuple[Mapping[str, object], ...]:
+        seeds = _frozen_seeds(region)
+        return tuple(seeds[i] for i in get_universe(region).by_sector.get(sector, ()))
+
+    def stocks(self, region: Optional[str] = None) -> Tuple[Stock, ...]:
+        """
+        The same seeds as frozen slots Stock records, for code that reads
+        fields by attribute. Built once per region and shared.
+        """
+        return get_universe(region).stocks
+
+    def columns(self, region: Optional[str] = None) -> Universe:
+        """
+        The same seeds column-wise, for consumers that filter or join in
+        bulk: per-field tuples with inverted indexes, plus .frame() (pandas)
+        and .arrow() (dictionary-encoded pyarrow Table).
+        """
+        return get_universe(region)
+
+
+# Seed record fill-ins, merged in C by dict unpacking: defaults yield to the
+# seed's own value, overrides always win.
+_SEED_DEFAULTS  = MappingProxyType({"quote_type": "EQUITY"})
+_SEED_OVERRIDES = MappingProxyType({"source": "static_seed"})
+
+
+@lru_cache(maxsize=None)
+def _frozen_seeds(region: Optional[str]) -> Tuple[Mapping[str, object], ...]:
+    """
+    Finished seed records for `region`, built once per process: source and
+    default quote_type filled in, each wrapped read-only. Repeat fetch()
+    calls return the same tuple — nothing is rewritten per call, and no
+    caller can mutate it (stage_deduplicate copies before merging).
+    """
+    return tuple(
+        MappingProxyType({**_SEED_DEFAULTS, **seed, **_SEED_OVERRIDES})
+        for seed in get_universe(region).records()
+    )
+
+
+def __getattr__(name: str):
+    # Legacy module-level SEEDS, resolved lazily so importing fetchers never
+    # reads the seed files (PEP 562).
+    if name == "SEEDS":
+        return _frozen_seeds(None)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
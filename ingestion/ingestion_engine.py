@@ -20,18 +20,18 @@ import logging
 import os
 import time
 import uuid
-from datetime import datetime, timezone
-from typing import List, Dict, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Iterable, Iterator, List, Dict, Optional, Tuple
 
 from database import (
-    init_db, upsert_asset, deactivate_asset, get_all_active_tickers,
+    init_db, upsert_asset, bulk_deactivate_assets, get_all_active_tickers,
     get_asset, start_run, complete_run, get_recent_runs, get_universe_summary,
     get_pending_notifications, mark_notifications_processed,
 )
 from classifiers import (
     classify_asset, is_liquid_enough, is_allowed_exchange, normalise_ticker
 )
-from fetchers import YahooFetcher, CoinGeckoFetcher, StaticSeedFetcher
+from fetchers import YahooFetcher, CoinGeckoFetcher, StaticSeedFetcher, aclose_client
 
 logging.basicConfig(
     level=logging.INFO,
@@ -45,6 +45,11 @@ SKIP_OTC         = os.environ.get("SKIP_OTC",    "true").lower() == "true"
 SKIP_PENNY       = os.environ.get("SKIP_PENNY",  "true").lower() == "true"
 CONCURRENCY      = int(os.environ.get("FETCH_CONCURRENCY", "5"))
 
+# Schedule (UTC): full rebuild Sundays 02:00, price refresh daily 06:00.
+FULL_WEEKDAY     = 6
+FULL_HOUR_UTC    = 2
+UPDATE_HOUR_UTC  = 6
+
 ENGINE_API_URL   = os.environ.get("MB_API_URL", "http://localhost:8000")
 ENGINE_API_TOKEN = os.environ.get("MB_BOT_TOKEN", "")
 
@@ -53,7 +58,23 @@ ENGINE_API_TOKEN = os.environ.get("MB_BOT_TOKEN", "")
 # PIPELINE STAGES
 # ══════════════════════════════════════════════════════════════
 
-async def stage_fetch(mode: str) -> List[dict]:
+async def _gather_sources(sources: Dict[str, Awaitable[List[dict]]]) -> List[dict]:
+    """
+    Await every source together; results keep the given order. A failing
+    source is logged and contributes nothing rather than sinking the run.
+    """
+    results = await asyncio.gather(*sources.values(), return_exceptions=True)
+    rows: List[dict] = []
+    for label, result in zip(sources, results):
+        if isinstance(result, BaseException):
+            log.error(f"{label} fetch failed: {result}")
+            continue
+        rows.extend(result)
+        log.info(f"{label}: {len(result)} assets")
+    return rows
+
+
+async def stage_fetch(mode: str, existing: Optional[List[str]] = None) -> List[dict]:
     yahoo  = YahooFetcher()
     gecko  = CoinGeckoFetcher()
     static = StaticSeedFetcher()
@@ -61,108 +82,122 @@ async def stage_fetch(mode: str) -> List[dict]:
     all_raw = []
 
     if mode in ("full", "update"):
-        seeds = await static.fetch()
+        seeds = static.load()
         all_raw.extend(seeds)
         log.info(f"Seeds: {len(seeds)} assets")
 
-        crypto = await gecko.fetch_top_coins(limit=200)
-        all_raw.extend(crypto)
-        log.info(f"CoinGecko: {len(crypto)} crypto assets")
-
-        forex = await yahoo.fetch_forex()
-        all_raw.extend(forex)
-        log.info(f"Forex: {len(forex)} pairs")
-
-        commodities = await yahoo.fetch_commodities()
-        all_raw.extend(commodities)
-        log.info(f"Commodities: {len(commodities)} assets")
-
-        etfs = await yahoo.fetch_etfs()
-        all_raw.extend(etfs)
-        log.info(f"ETFs: {len(etfs)} assets")
+        # Independent sources overlap; each fetcher's token bucket still
+        # paces requests to its own host.
+        all_raw.extend(await _gather_sources({
+            "CoinGecko":   gecko.fetch_top_coins(limit=200),
+            "Forex":       yahoo.fetch_forex(),
+            "Commodities": yahoo.fetch_commodities(),
+            "ETFs":        yahoo.fetch_etfs(),
+        }))
 
     if mode == "full":
-        for tier in ["us_large_cap", "us_mid_cap", "us_small_cap"]:
-            equities = await yahoo.fetch_equities_screener(tier)
-            all_raw.extend(equities)
-            log.info(f"Screener {tier}: {len(equities)} equities")
-            await asyncio.sleep(1)
+        all_raw.extend(await _gather_sources({
+            f"Screener {tier}": yahoo.fetch_equities_screener(tier)
+            for tier in ["us_large_cap", "us_mid_cap", "us_small_cap"]
+        }))
 
     if mode == "crypto":
         crypto = await gecko.fetch_top_coins(limit=200)
         all_raw.extend(crypto)
 
     if mode == "update":
-        existing = get_all_active_tickers()
+        if existing is None:
+            existing = get_all_active_tickers()
         log.info(f"Refreshing {len(existing)} existing tickers from Yahoo")
-        batches = [existing[i:i+50] for i in range(0, len(existing), 50)]
-        for batch in batches:
-            refreshed = await yahoo.fetch_tickers_batch(
-                batch, include_summary=False, concurrency=CONCURRENCY
-            )
-            all_raw.extend(refreshed)
-            await asyncio.sleep(0.5)
+        # One call for the whole universe: the fetcher splits it into
+        # v7/quote chunks sent together and bounds the chart fallback by
+        # CONCURRENCY, the pool limits and its token bucket.
+        all_raw.extend(await yahoo.fetch_tickers_batch(existing, concurrency=CONCURRENCY))
 
     log.info(f"Total raw assets fetched: {len(all_raw)}")
     return all_raw
 
 
+# (ticker, reason) for each row a filter stage drops — enough for counts and
+# audit logs without copying the whole asset dict per rejection.
+Rejection = Tuple[str, str]
+
+_DEDUP_KEEP = frozenset({"source", "ticker"})
+
+
 def stage_deduplicate(raw_assets: List[dict]) -> List[dict]:
     seen: Dict[str, dict] = {}
     for asset in raw_assets:
-        ticker = normalise_ticker(
-            asset.get("ticker", ""),
-            asset.get("exchange")
-        ).upper().strip()
+        # normalise_ticker already upper-cases and strips.
+        ticker = normalise_ticker(asset.get("ticker", ""), asset.get("exchange"))
         if not ticker:
             continue
-        if ticker in seen:
-            existing = seen[ticker]
+        existing = seen.get(ticker)
+        if existing is None:
+            # Copied, not stored: seed rows are shared read-only mappings.
+            seen[ticker] = {**asset, "ticker": ticker}
+        else:
+            # Later non-null fields win; source and the normalised ticker stay.
             for k, v in asset.items():
-                if v is not None and k != "source":
+                if v is not None and k not in _DEDUP_KEEP:
                     existing[k] = v
-        else:
-            seen[ticker] = {**asset, "ticker": ticker}
 
     result = list(seen.values())
     log.info(f"After dedup: {len(result)} unique assets")
     return result
 
 
-def stage_classify(raw_assets: List[dict]) -> List[dict]:
-    classified = [classify_asset(a) for a in raw_assets]
-    log.info(f"Classified: {len(classified)} assets")
-    return classified
+def stage_classify(raw_assets: List[dict]) -> Iterator[dict]:
+    """
+    Lazily classify: rows flow one at a time into stage_filter, so the full
+    classified list is never held alongside the raw and passing lists.
+    """
+    log.info(f"Classifying {len(raw_assets)} assets")
+    return map(classify_asset, raw_assets)
 
 
-def stage_filter(assets: List[dict]) -> tuple[List[dict], List[dict]]:
-    passing  = []
-    rejected = []
-
-    for asset in assets:
-        asset_type = asset.get("asset_type", "equity")
-        price      = asset.get("price_last")
-        volume     = asset.get("avg_volume_30d")
-        exchange   = asset.get("exchange")
+def stage_prefilter(raw_assets: List[dict]) -> tuple[List[dict], List[Rejection]]:
+    """
+    Rejections decidable from the raw (deduped) row, run before classify so
+    rows that cannot pass are never classified: OTC exchange, missing name.
+    classify_asset copies exchange through unchanged and falls back to the
+    ticker for an absent name, so the outcome matches filtering afterwards.
+    """
+    passing:  List[dict]      = []
+    rejected: List[Rejection] = []
 
+    for asset in raw_assets:
         if SKIP_OTC:
-            ok, reason = is_allowed_exchange(exchange)
+            ok, reason = is_allowed_exchange(asset.get("exchange"))
             if not ok:
-                rejected.append({**asset, "_reject_reason": reason})
+                rejected.append((asset["ticker"], reason))
                 continue
 
-        min_price = MIN_PRICE if SKIP_PENNY else 0.0
+        if not asset.get("name", asset["ticker"]):
+            rejected.append((asset["ticker"], "missing name"))
+            continue
+
+        passing.append(asset)
+
+    log.info(f"Prefilter: {len(passing)} pass, {len(rejected)} rejected")
+    return passing, rejected
+
+
+def stage_filter(assets: Iterable[dict]) -> tuple[List[dict], List[Rejection]]:
+    """Liquidity / penny rules, which need the classified asset_type."""
+    passing:  List[dict]      = []
+    rejected: List[Rejection] = []
+    min_price = MIN_PRICE if SKIP_PENNY else 0.0
+
+    for asset in assets:
         ok, reason = is_liquid_enough(
-            volume, price, asset_type,
+            asset.get("avg_volume_30d"), asset.get("price_last"),
+            asset.get("asset_type", "equity"),
             min_adv_usd=MIN_ADV_USD,
             min_price=min_price,
         )
         if not ok:
-            rejected.append({**asset, "_reject_reason": reason})
-            continue
-
-        if not asset.get("name"):
-            rejected.append({**asset, "_reject_reason": "missing name"})
+            rejected.append((asset["ticker"], reason))
             continue
 
         passing.append(asset)
@@ -184,25 +219,29 @@ def stage_store(assets: List[dict], run_id: str, source: str) -> Dict[str, int]:
     return stats
 
 
-async def stage_detect_delistings(fetched_tickers: List[str], run_id: str, source: str) -> int:
-    active_tickers = set(get_all_active_tickers())
-    fetched_set    = set(fetched_tickers)
-    missing        = active_tickers - fetched_set
+async def stage_detect_delistings(fetched_tickers: List[str], run_id: str, source: str,
+                                  existing: Optional[List[str]] = None) -> int:
+    """
+    `existing` is the active universe at the start of the run. Tickers
+    stored this run are all in `fetched_tickers`, so the missing set is the
+    same as when computed from the post-store universe.
+    """
+    if existing is None:
+        existing = get_all_active_tickers()
+    missing = set(existing).difference(fetched_tickers)
 
     if not missing:
         log.info("No delistings detected")
         return 0
 
     log.info(f"Validating {len(missing)} potentially delisted tickers")
-    yahoo = YahooFetcher()
-    deactivated = 0
 
-    for ticker in missing:
-        is_valid = await yahoo.validate_ticker(ticker)
-        if not is_valid:
-            deactivate_asset(ticker, run_id, source, reason="not found in data source")
-            deactivated += 1
-        await asyncio.sleep(0.3)
+    # One bulk check: v7/quote batches, then the chart fallback under the
+    # fetcher's own concurrency cap and rate limit — no per-ticker sleeps.
+    validity = await YahooFetcher().validate_tickers(sorted(missing), concurrency=CONCURRENCY)
+    invalid = [ticker for ticker, is_valid in validity.items() if not is_valid]
+    deactivated = bulk_deactivate_assets(invalid, run_id, source,
+                                         reason="not found in data source")
 
     log.info(f"Deactivated {deactivated} delisted assets")
     return deactivated
@@ -238,14 +277,17 @@ async def run_ingestion(mode: str = "update") -> Dict:
     }
 
     try:
-        raw = await stage_fetch(mode)
+        # Read once: update mode refreshes these, full mode checks them for delistings.
+        existing = get_all_active_tickers()
+        raw = await stage_fetch(mode, existing)
         stats["fetched"] = len(raw)
 
         deduped = stage_deduplicate(raw)
-        classified = stage_classify(deduped)
+        candidates, pre_rejected = stage_prefilter(deduped)
+        classified = stage_classify(candidates)
 
         passing, rejected = stage_filter(classified)
-        stats["skipped"] = len(rejected)
+        stats["skipped"] = len(pre_rejected) + len(rejected)
 
         store_stats = stage_store(passing, run_id, source)
         stats["added"]   = store_stats.get("added", 0)
@@ -255,7 +297,7 @@ async def run_ingestion(mode: str = "update") -> Dict:
         if mode == "full":
             fetched_tickers = [a["ticker"] for a in passing]
             stats["deactivated"] = await stage_detect_delistings(
-                fetched_tickers, run_id, source
+                fetched_tickers, run_id, source, existing
             )
 
         await stage_notify_engine(run_id)
@@ -280,6 +322,9 @@ async def run_ingestion(mode: str = "update") -> Dict:
         stats["notes"]  = str(e)
         await complete_run(run_id, stats, "failed")  # ← await (triggers HTTP flush)
 
+    finally:
+        await aclose_client()   # shared HTTP client; reopened lazily next run
+
     return stats
 
 
@@ -287,24 +332,41 @@ async def run_ingestion(mode: str = "update") -> Dict:
 # CLI + SCHEDULER
 # ══════════════════════════════════════════════════════════════
 
+def next_scheduled_run(now: datetime) -> tuple[datetime, str]:
+    """(when, mode) of the first scheduled job strictly after `now` (UTC)."""
+    hour = now.replace(minute=0, second=0, microsecond=0)
+    update = hour.replace(hour=UPDATE_HOUR_UTC)
+    if update <= now:
+        update += timedelta(days=1)
+    full = hour.replace(hour=FULL_HOUR_UTC) + timedelta(
+        days=(FULL_WEEKDAY - now.weekday()) % 7)
+    if full <= now:
+        full += timedelta(weeks=1)
+    return (full, "full") if full < update else (update, "update")
+
+
 async def run_scheduled():
     log.info("Ingestion bot started in scheduled mode")
 
     await run_ingestion(mode="update")
 
+    # Sleep straight to the next job instead of waking every minute to poll.
     while True:
-        now     = datetime.now(timezone.utc)
-        weekday = now.weekday()
-        hour    = now.hour
-
-        if weekday == 6 and hour == 2:
-            await run_ingestion(mode="full")
-            await asyncio.sleep(3600)
-        elif hour == 6 and now.minute < 5:
-            await run_ingestion(mode="update")
-            await asyncio.sleep(300)
-        else:
-            await asyncio.sleep(60)
+        at, mode = next_scheduled_run(datetime.now(timezone.utc))
+        log.info(f"Next {mode} run at {at:%Y-%m-%d %H:%M} UTC")
+        await asyncio.sleep(max(0.0, (at - datetime.now(timezone.utc)).total_seconds()))
+        await run_ingestion(mode=mode)
+
+
+def install_event_loop() -> None:
+    """Run on uvloop (libuv) when installed — cheaper scheduling for the
+    hundreds of concurrent fetch tasks. Falls back to the stdlib loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    log.info("Using uvloop event loop")
 
 
 def print_status():
@@ -338,6 +400,7 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     init_db()
+    install_event_loop()
 
     if args.mode == "status":
         print_status()
@@ -0,0 +1,50 @@
+"""
+Regression tests for fetchers. Run from ingestion/: python -m pytest -q
+No network — the remote calls are replaced per test.
+"""
+
+import asyncio
+import os
+import tempfile
+
+os.environ.setdefault("INGEST_CACHE_PATH",
+                      os.path.join(tempfile.mkdtemp(), "cache.sqlite"))
+
+from fetchers import Quote, YahooFetcher
+
+
+def _quote(ticker: str) -> Quote:
+    return Quote(ticker=ticker, name=ticker, quote_type="ETF", exchange="PCX",
+                 currency="USD", price=1.0, change_pct=0.0,
+                 fifty_two_week_high=None, fifty_two_week_low=None,
+                 avg_volume_30d=None, market_cap=None)
+
+
+def test_cancelled_waiter_does_not_sink_owner_batch():
+    async def run():
+        yahoo   = YahooFetcher()
+        release = asyncio.Event()
+        calls   = []
+
+        async def fake_multi(client, tickers):
+            calls.append(list(tickers))
+            await release.wait()
+            return {t: _quote(t) for t in tickers}
+
+        yahoo.fetch_quotes_multi = fake_multi
+
+        owner = asyncio.create_task(yahoo._fetch_quotes(["GLD", "SLV"]))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(yahoo._fetch_quotes(["GLD"]))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        release.set()
+
+        quotes = await owner
+        assert waiter.cancelled()
+        assert calls == [["GLD", "SLV"]]
+        assert [q.ticker for q in quotes] == ["GLD", "SLV"]
+        assert not yahoo._quote_inflight
+
+    asyncio.run(run())
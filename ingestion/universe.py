@@ -0,0 +1,371 @@
+"""
+Market Brain — Seed Universe
+─────────────────────────────
+The curated static universe, split by region under seeds/<region>.json.
+
+Each asset is a positional row under one shared "columns" header (trailing
+empty fields omitted), so the files carry no per-row key strings. Exchange
+and currency are not stored at all: the ticker suffix (.L, .DE, .T, ...)
+determines both, so a row can never disagree with its own ticker. Regions
+are read lazily: get_universe("uk") never touches the US or APAC files,
+and repeated calls within a process return the same cached Universe.
+
+A Universe is held column-wise: .tickers, .names, .sectors, ... are
+parallel tuples aligned by row index, with the low-cardinality columns
+interned.
+
+  get_universe(region=None) — one region, or all of REGIONS concatenated
+  UNIVERSE / US / UK / ...  — the same, as lazy module attributes
+  exchange_of(ticker)       — (exchange, currency) from the ticker suffix
+  .row(i) / .get(ticker)    — one row as a dict (O(1) via .ticker_index)
+  .stocks / .stock(ticker)  — rows as frozen slots Stock records
+  .exchange_ids / .currency_ids
+                            — uint8 Exchange / Currency codes per row
+  .categories / .category_ids / .category(i)
+                            — shared (sector, industry, country) triples
+  .indices_where(col, v)    — row indices matching an interned column value
+  .by_sector / .by_country / .by_exchange
+                            — value → row indices, e.g. u.by_country["GB"]
+  .records()                — list of dicts, empty fields dropped (legacy callers)
+  .frame()                  — pandas DataFrame for vectorised filters
+  .arrow() / .polars()      — dictionary-encoded Arrow table / Polars view
+                              (optional pyarrow / polars, imported on first call)
+"""
+
+import json
+import logging
+import sys
+from array import array
+from dataclasses import dataclass, fields
+from enum import IntEnum
+from functools import cached_property, lru_cache
+from itertools import zip_longest
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:     # stdlib fallback — same result, just slower
+    _json_loads = json.loads
+
+log = logging.getLogger("mb-ingestion.universe")
+
+SEEDS_DIR = Path(__file__).with_name("seeds")
+REGIONS   = ("us", "uk", "eu", "apac", "crypto", "macro")
+
+# Column order of every Universe. exchange and currency are not stored in
+# the seed files — they are derived from the ticker suffix (see exchange_of).
+SEED_KEYS = ("ticker", "name", "sector", "industry", "country",
+             "exchange", "currency", "quote_type")
+
+# Yahoo ticker suffix → (exchange, currency)
+SUFFIX_MAP: Dict[str, Tuple[str, str]] = {
+    "L":  ("LSE",      "GBP"),
+    "DE": ("XETRA",    "EUR"),
+    "PA": ("EURONEXT", "EUR"),
+    "AS": ("EURONEXT", "EUR"),
+    "SW": ("SIX",      "CHF"),
+    "CO": ("OMXC",     "DKK"),
+    "ST": ("OMXS",     "SEK"),
+    "T":  ("TSE",      "JPY"),
+    "AX": ("ASX",      "AUD"),
+    "KS": ("KRX",      "KRW"),
+}
+# Columns each seed file carries; the first REQUIRED_FIELDS are mandatory
+FILE_KEYS       = ("ticker", "name", "sector", "industry", "country", "quote_type")
+REQUIRED_FIELDS = 5
+
+_NO_SUFFIX: Tuple[Optional[str], Optional[str]] = (None, None)
+
+# Repeated categorical columns: every "Finance" / "US" / "GBP" / "Banking"
+# is one shared object (937 rows carry only 278 distinct industries).
+INTERNED = ("sector", "industry", "country", "exchange", "currency", "quote_type")
+# Not categorical, but used as a key everywhere (ticker_index, frozen seed
+# records, dedup maps): interned so each ticker is one shared object and
+# key comparisons between those maps hit the identity fast path.
+INTERNED_KEYS = ("ticker",)
+
+
+def exchange_of(ticker: str) -> Tuple[Optional[str], Optional[str]]:
+    """(exchange, currency) implied by the ticker suffix, or (None, None)."""
+    _, dot, suffix = ticker.rpartition(".")
+    return SUFFIX_MAP.get(suffix, _NO_SUFFIX) if dot else _NO_SUFFIX
+
+
+def _validate(region: str, keys: Tuple[str, ...], rows: List[list]) -> None:
+    """
+    Schema check, once per file at load. Afterwards every row is guaranteed
+    its required fields as non-empty strings, so no reader needs a .get or
+    KeyError path for them.
+    """
+    if keys != FILE_KEYS:
+        raise ValueError(f"seeds/{region}.json columns {list(keys)} != {list(FILE_KEYS)}")
+    width = len(FILE_KEYS)
+    for n, row in enumerate(rows):
+        if not (REQUIRED_FIELDS <= len(row) <= width
+                and all(isinstance(v, str) and v for v in row[:REQUIRED_FIELDS])
+                and all(v is None or isinstance(v, str) for v in row[REQUIRED_FIELDS:])):
+            raise ValueError(f"seeds/{region}.json row {n} is malformed: {row!r}")
+
+
+def _load_region(region: str) -> List[list]:
+    data = _json_loads((SEEDS_DIR / f"{region}.json").read_bytes())
+    # Rows stay exactly as parsed (ragged); Universe transposes them in one pass
+    rows = [row for section in data["sections"].values() for row in section]
+    _validate(region, tuple(data["columns"]), rows)
+    return rows
+
+
+# ── Integer codes for joins/group-bys; 0 = not recorded in the seeds ──
+class Exchange(IntEnum):
+    NONE = 0
+    NASDAQ = 1
+    NYSE = 2
+    LSE = 3
+    XETRA = 4
+    EURONEXT = 5
+    SIX = 6
+    TSE = 7
+    ASX = 8
+    KRX = 9
+    OMXS = 10
+    OMXC = 11
+
+
+class Currency(IntEnum):
+    NONE = 0
+    USD = 1
+    GBP = 2
+    EUR = 3
+    CHF = 4
+    DKK = 5
+    SEK = 6
+    JPY = 7
+    AUD = 8
+    KRW = 9
+
+
+def _codes(column: tuple, enum) -> array:
+    """Column of names → contiguous uint8 array of enum codes."""
+    try:
+        return array("B", [0 if v is None else enum[v] for v in column])
+    except KeyError as e:
+        raise ValueError(f"Seed value {e} has no {enum.__name__} code") from None
+
+
+def _group(column: tuple) -> Dict[str, Tuple[int, ...]]:
+    """value → row indices holding it, for an inverted index."""
+    groups: Dict[str, List[int]] = {}
+    for i, v in enumerate(column):
+        if v is not None:
+            groups.setdefault(v, []).append(i)
+    return {v: tuple(idx) for v, idx in groups.items()}
+
+
+# Written into the column once at load, so readers never branch on a missing
+# value. Same default classify_asset / upsert_asset apply per row. There is
+# no exchange default: unsuffixed rows span NASDAQ, NYSE and ADRs.
+DEFAULTS = {"currency": "USD"}
+
+
+def _column(key: str, values: tuple) -> tuple:
+    default = DEFAULTS.get(key)
+    if default is not None:
+        values = tuple(default if v is None else v for v in values)
+    if key in INTERNED or key in INTERNED_KEYS:
+        return tuple(v if v is None else sys.intern(v) for v in values)
+    return values
+
+
+@dataclass(slots=True, frozen=True)
+class Stock:
+    """One seed row. Fields the seed files leave empty are None."""
+    ticker:     str
+    name:       str
+    sector:     Optional[str] = None
+    industry:   Optional[str] = None
+    country:    Optional[str] = None
+    exchange:   Optional[str] = None
+    currency:   str = "USD"
+    quote_type: Optional[str] = None
+
+    def as_dict(self) -> dict:
+        return {name: v for name in self.__slots__ if (v := getattr(self, name)) is not None}
+
+
+STOCK_FIELDS = tuple(f.name for f in fields(Stock))
+
+
+class Universe:
+
+    def __init__(self, file_keys: Tuple[str, ...], rows: List[list]):
+        self.keys = SEED_KEYS
+        # ── Struct-of-arrays: one tuple per field, aligned by row index ──
+        # zip_longest transposes the ragged rows in C, filling trailing empty
+        # fields with None — no padded per-row copies.
+        raw = dict(zip(file_keys, zip_longest(*rows)))
+        raw["exchange"], raw["currency"] = (
+            tuple(zip(*map(exchange_of, raw["ticker"]))) if rows else ((), ())
+        )
+        empty = (None,) * len(rows)
+        self.columns: Tuple[tuple, ...] = tuple(
+            _column(key, raw.get(key, empty)) for key in SEED_KEYS
+        )
+        col = dict(zip(SEED_KEYS, self.columns)).__getitem__
+        self.tickers     = col("ticker")
+        self.names       = col("name")
+        self.sectors     = col("sector")
+        self.industries  = col("industry")
+        self.countries   = col("country")
+        self.exchanges   = col("exchange")
+        self.currencies  = col("currency")
+        self.quote_types = col("quote_type")
+
+        # ticker → row index. Each ticker should appear once across the seed
+        # files; a repeat is flagged here and the later row wins the index.
+        self.ticker_index: Dict[str, int] = {}
+        for i, ticker in enumerate(self.tickers):
+            if ticker in self.ticker_index:
+                log.warning(f"Duplicate seed ticker {ticker} "
+                            f"(rows {self.ticker_index[ticker]} and {i})")
+            self.ticker_index[ticker] = i
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def row(self, i: int) -> dict:
+        """Row i as a dict, empty fields dropped — the legacy seed shape."""
+        return {k: col[i] for k, col in zip(self.keys, self.columns) if col[i] is not None}
+
+    def get(self, ticker: str) -> Optional[dict]:
+        """Seed row for `ticker` via the index, or None."""
+        i = self.ticker_index.get(ticker)
+        return None if i is None else self.row(i)
+
+    def indices_where(self, column: tuple, value: Optional[str]) -> List[int]:
+        """Row indices whose interned column value is `value` (identity compare)."""
+        value = value if value is None else sys.intern(value)
+        return [i for i, v in enumerate(column) if v is value]
+
+    # ── Inverted indexes: value → row indices, built on first access ──
+    @cached_property
+    def by_sector(self) -> Dict[str, Tuple[int, ...]]:
+        return _group(self.sectors)
+
+    @cached_property
+    def by_country(self) -> Dict[str, Tuple[int, ...]]:
+        return _group(self.countries)
+
+    @cached_property
+    def by_exchange(self) -> Dict[str, Tuple[int, ...]]:
+        return _group(self.exchanges)
+
+    # ── uint8 codes aligned with the rows; ticker_index values are the ticker ids ──
+    @cached_property
+    def exchange_ids(self) -> array:
+        return _codes(self.exchanges, Exchange)
+
+    @cached_property
+    def currency_ids(self) -> array:
+        return _codes(self.currencies, Currency)
+
+    # ── (sector, industry, country) dictionary encoding ──
+    # 937 rows share 446 distinct triples; each row holds a uint16 code into
+    # one shared tuple per triple instead of three separate references.
+    @cached_property
+    def _category_encoding(self) -> Tuple[Tuple[Tuple[str, str, str], ...], array]:
+        codes: Dict[Tuple[str, str, str], int] = {}
+        ids = array("H", [
+            codes.setdefault(triple, len(codes))
+            for triple in zip(self.sectors, self.industries, self.countries)
+        ])
+        return tuple(codes), ids
+
+    @property
+    def categories(self) -> Tuple[Tuple[str, str, str], ...]:
+        """Distinct (sector, industry, country) triples, indexed by category id."""
+        return self._category_encoding[0]
+
+    @property
+    def category_ids(self) -> array:
+        return self._category_encoding[1]
+
+    def category(self, i: int) -> Tuple[str, str, str]:
+        """Row i's shared (sector, industry, country) triple."""
+        return self.categories[self.category_ids[i]]
+
+    @cached_property
+    def stocks(self) -> Tuple[Stock, ...]:
+        """Every row as a frozen Stock, in row order. Built on first access."""
+        by_key = dict(zip(self.keys, self.columns))
+        return tuple(Stock(*values) for values in zip(*(by_key[f] for f in STOCK_FIELDS)))
+
+    def stock(self, ticker: str) -> Optional[Stock]:
+        i = self.ticker_index.get(ticker)
+        return None if i is None else self.stocks[i]
+
+    def records(self) -> List[dict]:
+        """Fresh list of dicts, one per seed row."""
+        return [self.row(i) for i in range(len(self))]
+
+    @cached_property
+    def _frame(self):
+        import pandas as pd     # deferred — only frame consumers pay for it
+        return pd.DataFrame(dict(zip(self.keys, self.columns)))
+
+    def frame(self):
+        """
+        Universe as a DataFrame, built on first call. Missing fields are None.
+        e.g. get_universe().frame().query("sector == 'Finance'")
+        """
+        return self._frame
+
+    @cached_property
+    def _arrow(self):
+        import pyarrow as pa    # optional — only Arrow/Polars consumers need it
+        return pa.table({
+            key: (pa.array(col, type=pa.string()).dictionary_encode()
+                  if key in INTERNED else pa.array(col, type=pa.string()))
+            for key, col in zip(self.keys, self.columns)
+        })
+
+    def arrow(self):
+        """
+        Universe as a pyarrow Table, built once from the columns. The
+        categorical columns are dictionary-encoded (int codes + one small
+        dictionary), ready for Parquet, DuckDB or an Arrow join.
+        Requires pyarrow.
+        """
+        return self._arrow
+
+    def polars(self):
+        """Zero-copy Polars view of arrow(). Requires polars and pyarrow."""
+        import polars as pl
+        return pl.from_arrow(self.arrow())
+
+
+@lru_cache(maxsize=None)
+def get_universe(region: Optional[str] = None) -> Universe:
+    """Seed universe for one region, or every region when `region` is None."""
+    if region is not None and region not in REGIONS:
+        raise ValueError(f"Unknown seed region {region!r} (expected one of {REGIONS})")
+    rows: List[list] = []
+    for name in (REGIONS if region is None else (region,)):
+        rows.extend(_load_region(name))
+    return Universe(FILE_KEYS, rows)
+
+
+# ── Lazy module attributes (PEP 562) ──
+# `universe.UNIVERSE` is every region; `universe.UK`, `universe.APAC`, ... are
+# single regions. Nothing is read until the attribute is first touched.
+def __getattr__(name: str) -> Universe:
+    if name == "UNIVERSE":
+        return get_universe()
+    if name.lower() in REGIONS and name.isupper():
+        return get_universe(name.lower())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), "UNIVERSE", *(r.upper() for r in REGIONS)])